@@ -0,0 +1,104 @@
+"""
+Measures how long it takes to linearize the groups of every host in inventories with
+deep and diamond shaped group hierarchies.
+
+The numbers are compared against the previous implementation, which recomputed the
+linearization recursively on every call and deduplicated groups using a list.
+
+Usage:
+
+    python benchmarks/bench_extended_groups.py
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from nornir.core.inventory import Group, Host, InventoryElement, ParentGroups
+
+LEVELS = 10
+NUM_GROUPS = 500
+NUM_HOSTS = 1000
+REPEAT = 5
+
+
+def uncached_extended_groups(element: InventoryElement) -> list[Group]:
+    groups: list[Group] = []
+
+    for g in element.groups:
+        if g not in groups:
+            groups.append(g)
+
+        for sg in uncached_extended_groups(g):
+            if sg not in groups:
+                groups.append(sg)
+
+    return groups
+
+
+def deep_hierarchy() -> list[Host]:
+    """Chains of ``LEVELS`` groups where each group only has one parent"""
+    per_level = NUM_GROUPS // LEVELS
+    levels: list[list[Group]] = [[Group(name=f"g0-{i}") for i in range(per_level)]]
+    for level in range(1, LEVELS):
+        levels.append(
+            [
+                Group(name=f"g{level}-{i}", groups=ParentGroups([levels[-1][i]]))
+                for i in range(per_level)
+            ]
+        )
+    return [
+        Host(name=f"h{i}", groups=ParentGroups([levels[-1][i % per_level]]))
+        for i in range(NUM_HOSTS)
+    ]
+
+
+def diamond_hierarchy() -> list[Host]:
+    """``LEVELS`` levels of groups where each group has two parents in the level above"""
+    per_level = NUM_GROUPS // LEVELS
+    levels: list[list[Group]] = [[Group(name=f"g0-{i}") for i in range(per_level)]]
+    for level in range(1, LEVELS):
+        above = levels[-1]
+        levels.append(
+            [
+                Group(
+                    name=f"g{level}-{i}",
+                    groups=ParentGroups([above[i], above[(i + 1) % per_level]]),
+                )
+                for i in range(per_level)
+            ]
+        )
+    bottom = levels[-1]
+    return [
+        Host(
+            name=f"h{i}",
+            groups=ParentGroups([bottom[i % per_level], bottom[(i + 7) % per_level]]),
+        )
+        for i in range(NUM_HOSTS)
+    ]
+
+
+def bench(name: str, hosts: list[Host]) -> None:
+    for h in hosts:
+        assert h.extended_groups() == uncached_extended_groups(h)
+
+    before = min(
+        timeit.repeat(lambda: [uncached_extended_groups(h) for h in hosts], number=1, repeat=1)
+    )
+    after = min(
+        timeit.repeat(lambda: [h.extended_groups() for h in hosts], number=1, repeat=REPEAT)
+    )
+    print(
+        f"{name:>8}: uncached {before * 1000:10.2f}ms  cached {after * 1000:8.2f}ms  "
+        f"speedup x{before / after:.0f}"
+    )
+
+
+def main() -> None:
+    print(f"{NUM_HOSTS} hosts, {NUM_GROUPS} groups, {LEVELS} levels")
+    bench("deep", deep_hierarchy())
+    bench("diamond", diamond_hierarchy())
+
+
+if __name__ == "__main__":
+    main()
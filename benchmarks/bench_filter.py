@@ -0,0 +1,125 @@
+"""
+Measures filter throughput, in hosts per second, for ``F`` filter trees compared
+against evaluating the same rules the way they were evaluated before they were compiled,
+splitting the keys and probing the data for the operator on every call. It also
+measures evaluating the filters for all the hosts at once with ``evaluate_many``.
+
+Usage:
+
+    python benchmarks/bench_filter.py
+"""
+
+from __future__ import annotations
+
+import timeit
+from typing import Any
+
+from nornir.core.filter import AND, NOT_F, OR, F
+from nornir.core.inventory import Defaults, Group, Host, ParentGroups
+
+NUM_HOSTS = 10000
+REPEAT = 5
+
+
+def verify_rule(data: Any, rule: str, value: Any) -> bool:
+    operator = "__{}__".format(rule)
+    if hasattr(data, operator):
+        return getattr(data, operator)(value) is True
+
+    if hasattr(data, rule):
+        if callable(getattr(data, rule)):
+            return bool(getattr(data, rule)(value))
+        return bool(getattr(data, rule) == value)
+
+    if rule == "in":
+        return bool(data in value)
+
+    if rule == "any":
+        if isinstance(data, list):
+            return any(x in data for x in value)
+        return any(x == data for x in value)
+
+    if rule == "all":
+        if isinstance(data, list):
+            return all(x in data for x in value)
+        return False
+
+    return bool(data.get(rule) == value)
+
+
+def verify_rules(data: Any, rule: list[str], value: Any) -> bool:
+    """Checks ``data`` against a filter key without the compiled closures of ``F``"""
+    if len(rule) > 1:
+        try:
+            return verify_rules(data.get(rule[0], {}), rule[1:], value)
+        except AttributeError:
+            return False
+    return verify_rule(data, rule[0], value)
+
+
+def interpreted(f: Any) -> Any:
+    """Returns a function that evaluates ``f`` without using the compiled closures"""
+    if isinstance(f, AND):
+        op1, op2 = interpreted(f.op1), interpreted(f.op2)
+        return lambda host: op1(host) and op2(host)
+    if isinstance(f, OR):
+        op1, op2 = interpreted(f.op1), interpreted(f.op2)
+        return lambda host: op1(host) or op2(host)
+    if isinstance(f, NOT_F):
+        filters = f.filters
+        return lambda host: (
+            not any(verify_rules(host, k.split("__"), v) for k, v in filters.items())
+        )
+    if isinstance(f, F):
+        filters = f.filters
+        return lambda host: all(verify_rules(host, k.split("__"), v) for k, v in filters.items())
+    return f
+
+
+def build_hosts() -> list[Host]:
+    defaults = Defaults(data={"domain": "example.com"})
+    groups = [Group(name=f"site{i}", data={"site": f"site{i}"}) for i in range(10)]
+    return [
+        Host(
+            name=f"h{i}",
+            platform="linux" if i % 2 else "eos",
+            groups=ParentGroups([groups[i % len(groups)]]),
+            data={"role": "www" if i % 3 else "db", "facts": {"tags": [f"t{i % 7}", "all"]}},
+            defaults=defaults,
+        )
+        for i in range(NUM_HOSTS)
+    ]
+
+
+FILTERS: dict[str, F | AND | OR] = {
+    "simple": F(role="www"),
+    "attribute": F(platform="linux"),
+    "operator": F(name__startswith="h1"),
+    "nested": F(facts__tags__contains="t3"),
+    "tree": (F(site="site1") | F(site="site2")) & ~F(role="db") & F(platform__in=["linux"]),
+}
+
+
+def bench(name: str, f: F | AND | OR, hosts: list[Host]) -> None:
+    reference = interpreted(f)
+    assert [f(h) for h in hosts] == [reference(h) for h in hosts] == f.evaluate_many(hosts)
+
+    before = min(timeit.repeat(lambda: [reference(h) for h in hosts], number=1, repeat=REPEAT))
+    after = min(timeit.repeat(lambda: [f(h) for h in hosts], number=1, repeat=REPEAT))
+    batch = min(timeit.repeat(lambda: f.evaluate_many(hosts), number=1, repeat=REPEAT))
+    print(
+        f"{name:>10}: interpreted {len(hosts) / before:12,.0f} hosts/s  "
+        f"compiled {len(hosts) / after:12,.0f} hosts/s  "
+        f"batch {len(hosts) / batch:12,.0f} hosts/s"
+    )
+
+
+def main() -> None:
+    hosts = build_hosts()
+    print(f"{NUM_HOSTS} hosts")
+    for name, f in FILTERS.items():
+        bench(name, f, hosts)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Measures the overhead of a run of ThreadedRunner with tasks that do nothing, which is
+dominated by starting and stopping the threads.
+
+The numbers are compared against the previous implementation, which created a new
+pool of threads on every run.
+
+Usage:
+
+    python benchmarks/bench_threaded_runner.py
+"""
+
+from __future__ import annotations
+
+import timeit
+from concurrent.futures import ThreadPoolExecutor
+
+from nornir.core import Nornir
+from nornir.core.inventory import Host, Hosts, Inventory
+from nornir.core.task import AggregatedResult, Task
+from nornir.plugins.runners import ThreadedRunner
+
+NUM_HOSTS = 100
+NUM_WORKERS = 20
+RUNS = 40
+REPEAT = 5
+
+
+class PerRunPoolRunner:
+    def __init__(self, num_workers: int = 20) -> None:
+        self.num_workers = num_workers
+
+    def run(self, task: Task, hosts: list[Host]) -> AggregatedResult:
+        result = AggregatedResult(task.name)
+        with ThreadPoolExecutor(self.num_workers) as pool:
+            futures = [pool.submit(task.copy().start, host) for host in hosts]
+
+        for future in futures:
+            worker_result = future.result()
+            result[worker_result.host.name] = worker_result
+        return result
+
+
+def noop(task: Task) -> None:
+    pass
+
+
+def bench(nr: Nornir) -> float:
+    def playbook() -> None:
+        for _ in range(RUNS):
+            nr.run(noop)
+
+    return min(timeit.repeat(playbook, number=1, repeat=REPEAT)) / RUNS
+
+
+def main() -> None:
+    inventory = Inventory(hosts=Hosts({f"h{i}": Host(name=f"h{i}") for i in range(NUM_HOSTS)}))
+    before = bench(Nornir(inventory=inventory, runner=PerRunPoolRunner(NUM_WORKERS)))
+    runner = ThreadedRunner(NUM_WORKERS)
+    after = bench(Nornir(inventory=inventory, runner=runner))
+    runner.close()
+    print(f"{NUM_HOSTS} hosts, {NUM_WORKERS} workers, {RUNS} runs of a task that does nothing")
+    print(
+        f"per run: new pool {before * 1000:8.2f}ms  persistent pool {after * 1000:8.2f}ms  "
+        f"speedup x{before / after:.1f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Measures the peak memory (RSS) used by ThreadedRunner to run a task that does nothing
+over a large inventory, streaming the results with Nornir.run_iter so they aren't kept.
+
+The numbers are compared against the previous implementation, which submitted all the
+hosts to the pool of threads before any of them completed. Each variant runs in its own
+process so the peak of one doesn't hide the other.
+
+Usage:
+
+    python benchmarks/bench_threaded_runner_memory.py
+"""
+
+from __future__ import annotations
+
+import resource
+import subprocess  # noqa: S404
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING
+
+from nornir.core import Nornir
+from nornir.core.inventory import Host, Hosts, Inventory
+from nornir.plugins.runners import ThreadedRunner
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from nornir.core.task import MultiResult, Task
+
+NUM_HOSTS = 200_000
+NUM_WORKERS = 20
+
+
+class SubmitAllRunner:
+    def __init__(self, num_workers: int = 20) -> None:
+        self.num_workers = num_workers
+
+    def run_iter(self, task: Task, hosts: list[Host]) -> Iterator[MultiResult]:
+        with ThreadPoolExecutor(self.num_workers) as pool:
+            futures = [pool.submit(task.copy().start, host) for host in hosts]
+            for future in as_completed(futures):
+                yield future.result()
+
+
+def noop(task: Task) -> None:
+    pass
+
+
+def max_rss_mb() -> float:
+    # kilobytes on linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def measure(variant: str) -> None:
+    hosts = Hosts({f"h{i}": Host(name=f"h{i}") for i in range(NUM_HOSTS)})
+    runner = (
+        SubmitAllRunner(NUM_WORKERS) if variant == "submit-all" else ThreadedRunner(NUM_WORKERS)
+    )
+    nr = Nornir(inventory=Inventory(hosts=hosts), runner=runner)  # type: ignore[arg-type]
+    before = max_rss_mb()
+    for _ in nr.run_iter(noop):
+        pass
+    print(
+        f"{variant:>10}: inventory {before:8.1f}MB  peak {max_rss_mb():8.1f}MB  "
+        f"run {max_rss_mb() - before:8.1f}MB"
+    )
+
+
+def main() -> None:
+    print(f"{NUM_HOSTS} hosts, {NUM_WORKERS} workers")
+    for variant in ("submit-all", "windowed"):
+        subprocess.run([sys.executable, __file__, variant], check=True)  # noqa: S603
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        measure(sys.argv[1])
+    else:
+        main()
@@ -4,17 +4,19 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 from nornir.core.configuration import Config
-from nornir.core.exceptions import PluginNotRegistered
-from nornir.core.inventory import Inventory
+from nornir.core.exceptions import NornirExecutionError, PluginNotRegistered
+from nornir.core.inventory import Inventory, InventoryChanges, InventoryView
 from nornir.core.plugins.runners import RunnerPlugin
 from nornir.core.processor import Processor, Processors
 from nornir.core.state import GlobalState
-from nornir.core.task import AggregatedResult, Task
+from nornir.core.task import AggregatedResult, MultiResult, Task
 
 if TYPE_CHECKING:
     import builtins
     import types
-    from collections.abc import Callable, Generator
+    from collections.abc import Callable, Generator, Iterable, Iterator
+
+    from nornir.core.inventory import Host
 
 logger = logging.getLogger(__name__)
 
@@ -61,6 +63,10 @@ class Nornir:
         exc_tb: types.TracebackType | None = None,
     ) -> None:
         self.close_connections(on_good=True, on_failed=True)
+        # runners may keep resources, like a pool of threads, between runs
+        close = getattr(self._runner, "close", None)
+        if close is not None:
+            close()
 
     def with_processors(self, processors: list[Processor]) -> Nornir:
         """
@@ -87,6 +93,30 @@ class Nornir:
         b.inventory = self.inventory.filter(*args, **kwargs)
         return b
 
+    def view(self, *args: Any, **kwargs: Any) -> Nornir:
+        """
+        See :py:meth:`nornir.core.inventory.Inventory.view`
+
+        Returns:
+            :obj:`Nornir`: A new object with same configuration as ``self`` but with a
+            view of the inventory, which selects the hosts the first time it's used.
+        """
+        b = Nornir(**self._clone_parameters())
+        b.inventory = self.inventory.view(*args, **kwargs)
+        return b
+
+    def shard(self, *args: Any, **kwargs: Any) -> Nornir:
+        """
+        See :py:meth:`nornir.core.inventory.Inventory.shard`
+
+        Returns:
+            :obj:`Nornir`: A new object with same configuration as ``self`` but only the
+            hosts in the shard.
+        """
+        b = Nornir(**self._clone_parameters())
+        b.inventory = self.inventory.shard(*args, **kwargs)
+        return b
+
     def run(
         self,
         task: Callable[..., Any],
@@ -114,6 +144,94 @@ class Nornir:
         Returns:
             :obj:`nornir.core.task.AggregatedResult`: results of each execution
         """
+        run_task, run_on = self._start_run(task, on_good, on_failed, name, kwargs)
+
+        result = self.runner.run(run_task, run_on)
+
+        raise_on_error = (
+            raise_on_error if raise_on_error is not None else self.config.core.raise_on_error
+        )
+        if raise_on_error:
+            result.raise_on_error()
+        else:
+            self.data.failed_hosts.update(result.failed_hosts.keys())
+
+        self.processors.task_completed(run_task, result)
+
+        return result
+
+    def run_iter(
+        self,
+        task: Callable[..., Any],
+        raise_on_error: bool | None = None,
+        on_good: bool = True,
+        on_failed: bool = False,
+        name: str | None = None,
+        aggregate: AggregatedResult | None = None,
+        **kwargs: Any,
+    ) -> Iterator[tuple[Host, MultiResult]]:
+        """
+        Same as :meth:`run` but yields the host and the results of each host as soon as
+        the host completes the task, so results can be processed while the task keeps
+        running on the rest of the hosts.
+
+        Results are yielded in the order hosts complete the task if the runner supports
+        it (it implements ``run_iter``), otherwise after all the hosts complete it. Unless
+        ``aggregate`` is given, results aren't kept once they are yielded.
+
+        Arguments:
+            aggregate (:obj:`nornir.core.task.AggregatedResult`): if given, results are also
+              added to it. It's the result passed to the processors when the task completes,
+              otherwise they get an empty one
+            others: see :meth:`run`
+
+        Raises:
+            :obj:`nornir.core.exceptions.NornirExecutionError`: once all the hosts have
+              completed the task, if at least a task failed and ``raise_on_error`` (or
+              self.config.core.raise_on_error) is set to ``True``. Its result only contains
+              the hosts that failed
+        """
+        run_task, run_on = self._start_run(task, on_good, on_failed, name, kwargs)
+        if aggregate is None:
+            aggregate = AggregatedResult(run_task.name)
+            keep = False
+        else:
+            keep = True
+
+        raise_on_error = (
+            raise_on_error if raise_on_error is not None else self.config.core.raise_on_error
+        )
+        failed = AggregatedResult(run_task.name)
+
+        run_iter = getattr(self.runner, "run_iter", None)
+        results: Iterable[MultiResult] = (
+            run_iter(run_task, run_on)
+            if run_iter is not None
+            else self.runner.run(run_task, run_on).values()
+        )
+        for result in results:
+            host = result.host
+            if keep:
+                aggregate[host.name] = result
+            if result.failed:
+                failed[host.name] = result
+                if not raise_on_error:
+                    self.data.failed_hosts.add(host.name)
+            yield host, result
+
+        if raise_on_error and failed:
+            raise NornirExecutionError(failed)
+
+        self.processors.task_completed(run_task, aggregate)
+
+    def _start_run(
+        self,
+        task: Callable[..., Any],
+        on_good: bool,
+        on_failed: bool,
+        name: str | None,
+        kwargs: builtins.dict[str, Any],
+    ) -> tuple[Task, list[Host]]:
         run_task = Task(
             task,
             self,
@@ -145,19 +263,7 @@ class Nornir:
         else:
             logger.warning("Task %r has not been run – 0 hosts selected", run_task.name)
 
-        result = self.runner.run(run_task, run_on)
-
-        raise_on_error = (
-            raise_on_error if raise_on_error is not None else self.config.core.raise_on_error
-        )
-        if raise_on_error:
-            result.raise_on_error()
-        else:
-            self.data.failed_hosts.update(result.failed_hosts.keys())
-
-        self.processors.task_completed(run_task, result)
-
-        return result
+        return run_task, run_on
 
     def dict(self) -> dict[str, Any]:
         """Return a dictionary representing the object."""
@@ -169,6 +275,34 @@ class Nornir:
 
         self.run(task=close_connections_task, on_good=on_good, on_failed=on_failed)
 
+    def refresh_inventory(self) -> InventoryChanges:
+        """
+        Loads the inventory again using the inventory plugin in the configuration and
+        updates the current one in place with the changes, see
+        :meth:`nornir.core.inventory.Inventory.patch`. Hosts that didn't change keep
+        their open connections.
+
+        Raises:
+            ValueError: if the inventory is filtered, refresh the unfiltered object instead
+
+        Returns:
+            :obj:`nornir.core.inventory.InventoryChanges`: the elements that changed
+        """
+        if isinstance(self.inventory, InventoryView):
+            raise ValueError("can't refresh a filtered inventory")
+
+        # imported here as nornir.init_nornir depends on this module
+        from nornir.init_nornir import load_inventory  # noqa: PLC0415
+
+        changes = self.inventory.patch(load_inventory(self.config))
+        logger.info(
+            "Inventory refreshed: %d hosts added, %d removed and %d updated",
+            len(changes.hosts_added),
+            len(changes.hosts_removed),
+            len(changes.hosts_updated),
+        )
+        return changes
+
     @property
     def runner(self) -> RunnerPlugin:
         if self._runner:
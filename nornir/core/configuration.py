@@ -70,7 +70,15 @@ class SSHConfig:
 
 
 class InventoryConfig:
-    __slots__ = "options", "plugin", "transform_function", "transform_function_options"
+    __slots__ = (
+        "options",
+        "plugin",
+        "transform_function",
+        "transform_function_batch",
+        "transform_function_executor",
+        "transform_function_options",
+        "transform_function_workers",
+    )
 
     class Parameters:
         plugin = Parameter[str](
@@ -81,6 +89,15 @@ class InventoryConfig:
         transform_function_options = Parameter[dict[str, Any]](
             default={}, envvar="NORNIR_INVENTORY_TRANSFORM_FUNCTION_OPTIONS"
         )
+        transform_function_workers = Parameter[int](
+            default=1, envvar="NORNIR_INVENTORY_TRANSFORM_FUNCTION_WORKERS"
+        )
+        transform_function_executor = Parameter[str](
+            default="thread", envvar="NORNIR_INVENTORY_TRANSFORM_FUNCTION_EXECUTOR"
+        )
+        transform_function_batch = Parameter[bool](
+            typ=bool, default=False, envvar="NORNIR_INVENTORY_TRANSFORM_FUNCTION_BATCH"
+        )
 
     def __init__(
         self,
@@ -88,6 +105,9 @@ class InventoryConfig:
         options: dict[str, Any] | None = None,
         transform_function: str | None = None,
         transform_function_options: dict[str, Any] | None = None,
+        transform_function_workers: int | None = None,
+        transform_function_executor: str | None = None,
+        transform_function_batch: bool | None = None,
     ) -> None:
         self.plugin = self.Parameters.plugin.resolve(plugin)
         self.options = self.Parameters.options.resolve(options) or {}
@@ -95,6 +115,15 @@ class InventoryConfig:
         self.transform_function_options = self.Parameters.transform_function_options.resolve(
             transform_function_options
         )
+        self.transform_function_workers = self.Parameters.transform_function_workers.resolve(
+            transform_function_workers
+        )
+        self.transform_function_executor = self.Parameters.transform_function_executor.resolve(
+            transform_function_executor
+        )
+        self.transform_function_batch = self.Parameters.transform_function_batch.resolve(
+            transform_function_batch
+        )
 
     def dict(self) -> dict[str, Any]:
         return {
@@ -102,6 +131,9 @@ class InventoryConfig:
             "options": self.options,
             "transform_function": self.transform_function,
             "transform_function_options": self.transform_function_options,
+            "transform_function_workers": self.transform_function_workers,
+            "transform_function_executor": self.transform_function_executor,
+            "transform_function_batch": self.transform_function_batch,
         }
 
 
@@ -85,6 +85,21 @@ class NornirSubTaskError(Exception):
         return "Subtask: {} (failed)\n".format(self.task)
 
 
+class RemoteTaskError(Exception):
+    """
+    Replaces an exception raised by a task in a worker process that can't be sent back
+    to the main process, i.e. because it can't be pickled
+    """
+
+    def __init__(self, exc_type: str, message: str) -> None:
+        super().__init__(exc_type, message)
+        self.exc_type = exc_type
+        self.message = message
+
+    def __str__(self) -> str:
+        return "{}: {}".format(self.exc_type, self.message)
+
+
 class NornirNoValidInventoryError(Exception):
     """
     Raised by nornir when :meth:`nornir.plugins.inventory.parse` fails to load any valid inventory
@@ -1,8 +1,16 @@
 from __future__ import annotations
 
-from typing import Any
+import operator
+from collections.abc import Callable, Collection, Iterable, Iterator
+from functools import partial
+from itertools import compress, repeat, starmap
+from typing import Any, Literal, overload
 
-from nornir.core.inventory import Host
+from nornir.core.inventory import Host, Hosts, Inventory
+
+Matcher = Callable[[Any], bool]
+
+_MISSING = object()
 
 
 class F_BASE:
@@ -10,10 +18,196 @@ class F_BASE:
         raise NotImplementedError()
 
 
-class F_OP_BASE(F_BASE):
+class _CompiledFilter(F_BASE):
+    """
+    Filters that are compiled into a closure when they are built so evaluating them
+    doesn't need to parse the rules again for each host
+    """
+
+    _match: Matcher
+
+    def __call__(self, host: Host) -> bool:
+        return self._match(host)
+
+    def _compile(self) -> Matcher:
+        raise NotImplementedError()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # closures can't be pickled, they are compiled again when unpickling
+        state = self.__dict__.copy()
+        del state["_match"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._match = self._compile()
+
+    @overload
+    def evaluate_many(
+        self, hosts: Iterable[Host], *, names: Literal[False] = ...
+    ) -> list[bool]: ...
+
+    @overload
+    def evaluate_many(self, hosts: Iterable[Host], *, names: Literal[True]) -> list[str]: ...
+
+    def evaluate_many(
+        self, hosts: Iterable[Host], *, names: bool = False
+    ) -> list[bool] | list[str]:
+        """
+        Evaluates the filter for all the hosts at once. Instead of evaluating the filter
+        host by host, each field the filter refers to is extracted once for all the hosts
+        and the rules are evaluated over those values in bulk. As with ``AND`` and ``OR``,
+        rules are only evaluated for the hosts whose result they can still change.
+
+        Arguments:
+            hosts: hosts to evaluate
+            names: return the names of the matching hosts instead of a mask
+
+        Returns:
+            a list of booleans, one per host, or the names of the hosts that match
+        """
+        columns = _Columns(list(hosts))
+        mask = self._evaluate_many(columns, None)
+        if names:
+            return [h.name for h in compress(columns.hosts, mask)]
+        return mask
+
+    def _evaluate_many(self, columns: _Columns, idx: list[int] | None) -> list[bool]:
+        """
+        Evaluates the filter for the hosts at positions ``idx`` of ``columns`` (or all
+        of them if ``None``), returns a mask aligned with ``idx``
+        """
+        raise NotImplementedError()
+
+
+def _matcher(f: F_BASE) -> Matcher:
+    if type(f).__call__ is _CompiledFilter.__call__:
+        return f._match  # type: ignore[attr-defined, no-any-return]
+    return f
+
+
+def _get(data: Any, key: str) -> Any:
+    try:
+        return data.get(key, {})
+    except AttributeError:
+        return _MISSING
+
+
+class _Columns:
+    """
+    Values of the fields a filter refers to for a list of hosts. Each field is extracted
+    once for all the hosts and shared by all the rules referring to it.
+    """
+
+    def __init__(self, hosts: list[Host]) -> None:
+        self.hosts = hosts
+        self._paths: dict[tuple[str, ...], list[Any]] = {(): hosts}
+        self._values: dict[str, list[Any]] = {}
+
+    def path(self, path: tuple[str, ...]) -> list[Any]:
+        """
+        Data found following ``path`` with ``data.get(key, {})`` from each host,
+        ``_MISSING`` where the path can't be followed
+        """
+        column = self._paths.get(path)
+        if column is None:
+            key = path[-1]
+            column = [
+                _MISSING if data is _MISSING else _get(data, key) for data in self.path(path[:-1])
+            ]
+            self._paths[path] = column
+        return column
+
+    def value(self, key: str) -> list[Any]:
+        """``host.get(key)`` for each host"""
+        column = self._values.get(key)
+        if column is None:
+            column = self._values[key] = [h.get(key) for h in self.hosts]
+        return column
+
+    def positions(self, idx: list[int] | None) -> Iterable[int]:
+        return range(len(self.hosts)) if idx is None else idx
+
+
+def _take(column: list[Any], idx: list[int] | None) -> list[Any]:
+    return column if idx is None else [column[i] for i in idx]
+
+
+def _evaluate_many(f: F_BASE, columns: _Columns, idx: list[int] | None) -> list[bool]:
+    if type(f).__call__ is _CompiledFilter.__call__:
+        return f._evaluate_many(columns, idx)  # type: ignore[attr-defined, no-any-return]
+    return [bool(f(h)) for h in _take(columns.hosts, idx)]
+
+
+def _evaluate_rule_many(
+    key: str, value: Any, columns: _Columns, idx: list[int] | None
+) -> list[bool]:
+    if _is_equality(key):
+        values = _take(columns.value(key), idx)
+        return list(map(bool, map(operator.eq, values, repeat(value))))
+
+    *path, rule = key.split("__")
+    verify = F._compile_rule(rule, value)
+    data = _take(columns.path(tuple(path)), idx)
+    if not path:
+        return list(map(verify, data))
+
+    def safe_verify(d: Any) -> bool:
+        if d is _MISSING:
+            return False
+        try:
+            return verify(d)
+        except AttributeError:
+            return False
+
+    return list(map(safe_verify, data))
+
+
+EvaluateMany = Callable[[list[int] | None], list[bool]]
+
+
+def _all_many(
+    evaluators: list[EvaluateMany], columns: _Columns, idx: list[int] | None
+) -> list[bool]:
+    """
+    Mask of the hosts matching all the evaluators. Each evaluator is only evaluated
+    for the hosts that matched the previous ones.
+    """
+    remaining = idx
+    for evaluate in evaluators:
+        remaining = list(compress(columns.positions(remaining), evaluate(remaining)))
+        if not remaining:
+            break
+    if remaining is None:
+        return [True] * len(list(columns.positions(idx)))
+    selected = set(remaining)
+    return [i in selected for i in columns.positions(idx)]
+
+
+def _any_many(
+    evaluators: list[EvaluateMany], columns: _Columns, idx: list[int] | None
+) -> list[bool]:
+    """
+    Mask of the hosts matching any of the evaluators. Each evaluator is only evaluated
+    for the hosts that didn't match the previous ones.
+    """
+    remaining = idx
+    selected: set[int] = set()
+    for evaluate in evaluators:
+        positions = list(columns.positions(remaining))
+        if not positions:
+            break
+        mask = evaluate(remaining)
+        selected.update(compress(positions, mask))
+        remaining = [i for i, m in zip(positions, mask, strict=True) if not m]
+    return [i in selected for i in columns.positions(idx)]
+
+
+class F_OP_BASE(_CompiledFilter):
     def __init__(self, op1: F_BASE, op2: F_BASE) -> None:
         self.op1 = op1
         self.op2 = op2
+        self._match = self._compile()
 
     def __and__(self, other: F_BASE) -> AND:
         return AND(self, other)
@@ -35,21 +229,55 @@ class F_OP_BASE(F_BASE):
 
 
 class AND(F_OP_BASE):
-    def __call__(self, host: Host) -> bool:
-        return self.op1(host) and self.op2(host)
+    def _compile(self) -> Matcher:
+        m1, m2 = _matcher(self.op1), _matcher(self.op2)
+
+        def match(host: Host) -> bool:
+            return m1(host) and m2(host)
+
+        return match
+
+    def _evaluate_many(self, columns: _Columns, idx: list[int] | None) -> list[bool]:
+        return _all_many(
+            [partial(_evaluate_many, op, columns) for op in (self.op1, self.op2)], columns, idx
+        )
 
 
 class OR(F_OP_BASE):
-    def __call__(self, host: Host) -> bool:
-        return self.op1(host) or self.op2(host)
+    def _compile(self) -> Matcher:
+        m1, m2 = _matcher(self.op1), _matcher(self.op2)
+
+        def match(host: Host) -> bool:
+            return m1(host) or m2(host)
 
+        return match
 
-class F(F_BASE):
+    def _evaluate_many(self, columns: _Columns, idx: list[int] | None) -> list[bool]:
+        return _any_many(
+            [partial(_evaluate_many, op, columns) for op in (self.op1, self.op2)], columns, idx
+        )
+
+
+class F(_CompiledFilter):
     def __init__(self, **kwargs: Any) -> None:
         self.filters = kwargs
+        self._match = self._compile()
 
-    def __call__(self, host: Host) -> bool:
-        return all(F._verify_rules(host, k.split("__"), v) for k, v in self.filters.items())
+    def _compile(self) -> Matcher:
+        matchers = [F._compile_rules(k.split("__"), v) for k, v in self.filters.items()]
+        if len(matchers) == 1:
+            return matchers[0]
+
+        def match(host: Host) -> bool:
+            return all(m(host) for m in matchers)
+
+        return match
+
+    def _rule_evaluators(self, columns: _Columns) -> list[EvaluateMany]:
+        return [partial(_evaluate_rule_many, k, v, columns) for k, v in self.filters.items()]
+
+    def _evaluate_many(self, columns: _Columns, idx: list[int] | None) -> list[bool]:
+        return _all_many(self._rule_evaluators(columns), columns, idx)
 
     def __and__(self, other: F) -> AND:
         return AND(self, other)
@@ -70,54 +298,527 @@ class F(F_BASE):
         return self.__class__ == other.__class__ and self.filters == other.filters
 
     @staticmethod
-    def _verify_rule(data: Any, rule: str, value: Any) -> bool:
+    def _compile_rule(rule: str, value: Any) -> Matcher:
+        """
+        Returns a function checking the data against the last part of a filter key.
+
+        The data is checked, in order, for an operator ``__<rule>__``, for an attribute
+        or method ``rule``, for the special rules ``in``, ``any`` and ``all`` and,
+        lastly, for a key ``rule`` equal to ``value``. The checks depend on the data so
+        they still happen for each host but the names to look up and the fallback are
+        resolved once.
+        """
         operator = "__{}__".format(rule)
-        if hasattr(data, operator):
-            return getattr(data, operator)(value) is True
+        fallback = F._compile_fallback(rule, value)
+
+        def verify(data: Any) -> bool:
+            op = getattr(data, operator, _MISSING)
+            if op is not _MISSING:
+                return op(value) is True  # type: ignore[operator]
+
+            attr = getattr(data, rule, _MISSING)
+            if attr is not _MISSING:
+                if callable(attr):
+                    return bool(attr(value))
+                return bool(attr == value)
 
-        if hasattr(data, rule):
-            if callable(getattr(data, rule)):
-                return bool(getattr(data, rule)(value))
-            return bool(getattr(data, rule) == value)
+            return fallback(data)
 
+        return verify
+
+    @staticmethod
+    def _compile_fallback(rule: str, value: Any) -> Matcher:
+        fallback: Matcher
         if rule == "in":
-            return bool(data in value)
 
-        if rule == "any":
-            if isinstance(data, list):
-                return any(x in data for x in value)
-            return any(x == data for x in value)
+            def fallback(data: Any) -> bool:
+                return bool(data in value)
 
-        if rule == "all":
-            if isinstance(data, list):
-                return all(x in data for x in value)
+        elif rule == "any":
 
-            # it doesn't make sense to check a single value meets more than one case
-            return False
+            def fallback(data: Any) -> bool:
+                if isinstance(data, list):
+                    return any(x in data for x in value)
+                return any(x == data for x in value)
+
+        elif rule == "all":
+
+            def fallback(data: Any) -> bool:
+                if isinstance(data, list):
+                    return all(x in data for x in value)
+
+                # it doesn't make sense to check a single value meets more than one case
+                return False
+
+        else:
+
+            def fallback(data: Any) -> bool:
+                return bool(data.get(rule) == value)
 
-        return bool(data.get(rule) == value)
+        return fallback
 
     @staticmethod
-    def _verify_rules(data: Any, rule: list[str], value: Any) -> bool:
-        if len(rule) > 1:
+    def _compile_rules(rule: list[str], value: Any) -> Matcher:
+        """
+        Returns a function checking the data against a filter key split on ``__``. All
+        but the last part are keys looked up in the nested data and the last one is
+        checked with :meth:`_compile_rule`.
+        """
+        if not rule:
+            raise Exception("I don't know how I got here:\n{}\n{}".format(rule, value))
+
+        *path, last = rule
+        verify = F._compile_rule(last, value)
+        if not path:
+            return verify
+
+        def match(data: Any) -> bool:
             try:
-                return F._verify_rules(data.get(rule[0], {}), rule[1:], value)
+                for key in path:
+                    data = data.get(key, {})
+                return verify(data)
             except AttributeError:
                 return False
 
-        elif len(rule) == 1:
-            return F._verify_rule(data, rule[0], value)
-
-        else:
-            raise Exception("I don't know how I got here:\n{}\n{}\n{}".format(data, rule, value))
+        return match
 
 
 class NOT_F(F):
-    def __call__(self, host: Host) -> bool:
-        return not any(F._verify_rules(host, k.split("__"), v) for k, v in self.filters.items())
+    def _compile(self) -> Matcher:
+        matchers = [F._compile_rules(k.split("__"), v) for k, v in self.filters.items()]
+
+        def match(host: Host) -> bool:
+            return not any(m(host) for m in matchers)
+
+        return match
+
+    def _evaluate_many(self, columns: _Columns, idx: list[int] | None) -> list[bool]:
+        return [not m for m in _any_many(self._rule_evaluators(columns), columns, idx)]
 
     def __invert__(self) -> F:
         return F(**self.filters)
 
     def __repr__(self) -> str:
         return "<Filter NOT ({})>".format(self.filters)
+
+
+# relative cost of evaluating each kind of node for a single host
+_COST_EQUAL = 1.0
+_COST_RULE = 2.0
+_COST_CALL = 100.0
+# selectivity assumed for nodes that can't be answered with an index
+_DEFAULT_SELECTIVITY = 0.5
+
+
+class _Node:
+    """
+    Node of a :class:`FilterPlan`. Nodes keep track of how many hosts they evaluated
+    and how many passed so the plan can explain how it was executed.
+    """
+
+    cost = _COST_RULE
+
+    def __init__(self) -> None:
+        self.evaluated = 0
+        self.passed = 0
+        # hosts found using indexes, only set if the node can use them
+        self.found: dict[str, Host] | None = None
+        # whether ``found`` are exactly the hosts matching the node or a superset
+        self.exact = False
+
+    def prepare(self, inventory: Inventory) -> None:
+        """Looks up the hosts matching the node in the inventory indexes if possible"""
+
+    def selectivity(self, total: int) -> float:
+        if self.found is None or not total:
+            return _DEFAULT_SELECTIVITY
+        return len(self.found) / total
+
+    def matcher(self) -> Matcher:
+        """Returns a function that checks if a host matches the node"""
+        check = self._check()
+
+        def match(host: Host) -> bool:
+            self.evaluated += 1
+            if check(host):
+                self.passed += 1
+                return True
+            return False
+
+        return match
+
+    def _check(self) -> Matcher:
+        raise NotImplementedError()
+
+    def describe(self) -> str:
+        raise NotImplementedError()
+
+    def explain(self, depth: int) -> list[str]:
+        line = "{}{}".format("  " * depth, self.describe())
+        if self.found is not None:
+            line += ": {} hosts from index".format(len(self.found))
+        if self.evaluated:
+            line += ": evaluated {}, passed {}".format(self.evaluated, self.passed)
+        return [line]
+
+
+class _Equal(_Node):
+    """Hosts for which ``host.get(key) == value``, answered with an index if possible"""
+
+    cost = _COST_EQUAL
+
+    def __init__(self, key: str, value: Any) -> None:
+        super().__init__()
+        self.key = key
+        self.value = value
+
+    def prepare(self, inventory: Inventory) -> None:
+        self.found = inventory._lookup(self.key, self.value)
+        self.exact = self.found is not None
+
+    def _check(self) -> Matcher:
+        key, value = self.key, self.value
+
+        def check(host: Host) -> bool:
+            return bool(host.get(key) == value)
+
+        return check
+
+    def describe(self) -> str:
+        return "{} == {!r}".format(self.key, self.value)
+
+
+class _Rule(_Node):
+    """A single rule of an :class:`F` or :class:`NOT_F` object"""
+
+    def __init__(self, key: str, value: Any, negate: bool) -> None:
+        super().__init__()
+        self.key = key
+        self.value = value
+        self.negate = negate
+        self.cost = _COST_RULE + key.count("__")
+
+    def _check(self) -> Matcher:
+        verify = F._compile_rules(self.key.split("__"), self.value)
+        if not self.negate:
+            return verify
+
+        def check(host: Host) -> bool:
+            return not verify(host)
+
+        return check
+
+    def describe(self) -> str:
+        return "{}{}={!r}".format("not " if self.negate else "", self.key, self.value)
+
+
+class _In(_Rule):
+    """
+    Hosts for which ``host.get(key)`` is one of ``values``, i.e. ``F(key__in=values)``,
+    answered with an index if possible. Hosts yielded by the index are checked again
+    with the rule, except for names, which are always strings compared by equality
+    """
+
+    cost = _COST_EQUAL
+
+    def __init__(self, key: str, values: Collection[Any]) -> None:
+        super().__init__("{}__in".format(key), values, negate=False)
+        self.cost = _COST_EQUAL
+        self.base_key = key
+
+    def prepare(self, inventory: Inventory) -> None:
+        self.found = inventory._lookup_any(self.base_key, self.value)
+        self.exact = self.found is not None and self.base_key == "name"
+
+
+def _index_values(key: str, value: Any) -> Collection[Any] | None:
+    """
+    Returns the values to look up in the index over ``key`` to answer
+    ``F(key__in=value)`` or ``None`` if the index can't answer it
+    """
+    if not key or not _is_equality(key) or not isinstance(value, list | tuple | set | frozenset):
+        return None
+    # hosts missing the key are compared as {} by the rule but are indexed as None
+    if any(v is None for v in value):
+        return None
+    return value
+
+
+class _Call(_Node):
+    """A custom filter function, it's assumed to be expensive"""
+
+    cost = _COST_CALL
+
+    def __init__(self, func: Callable[..., bool], kwargs: dict[str, Any]) -> None:
+        super().__init__()
+        self.func = func
+        self.kwargs = kwargs
+
+    def _check(self) -> Matcher:
+        func, kwargs = self.func, self.kwargs
+
+        def check(host: Host) -> bool:
+            return bool(func(host, **kwargs))
+
+        return check
+
+    def describe(self) -> str:
+        name = getattr(self.func, "__name__", None) or repr(self.func)
+        args = ", ".join(starmap("{}={!r}".format, self.kwargs.items()))
+        return "call {}({})".format(name, args)
+
+
+class _And(_Node):
+    def __init__(self, children: list[_Node]) -> None:
+        super().__init__()
+        self.children = children
+        self.cost = sum(c.cost for c in children)
+        self.total = 0
+
+    def prepare(self, inventory: Inventory) -> None:
+        self.total = len(inventory.hosts)
+        for c in self.children:
+            c.prepare(inventory)
+
+        found = sorted((c.found for c in self.children if c.found is not None), key=len)
+        if not found:
+            return
+        smallest, *others = found
+        self.found = {n: h for n, h in smallest.items() if all(n in o for o in others)}
+        self.exact = all(c.exact for c in self.children)
+
+    def ordered(self) -> list[_Node]:
+        """
+        Children sorted so the ones that are cheap and discard more hosts go first
+        """
+        return sorted(
+            self.children,
+            key=lambda c: c.cost / max(1.0 - c.selectivity(self.total), 1e-3),
+        )
+
+    def _check(self) -> Matcher:
+        return self._check_children(self.ordered())
+
+    @staticmethod
+    def _check_children(children: list[_Node]) -> Matcher:
+        matchers = [c.matcher() for c in children]
+
+        def check(host: Host) -> bool:
+            return all(m(host) for m in matchers)
+
+        return check
+
+    def residual(self) -> Matcher | None:
+        """
+        Returns a function that checks the children that weren't answered exactly by
+        the indexes, for the hosts in ``found``
+        """
+        remaining = [c for c in self.ordered() if not (c.exact and c.found is not None)]
+        if not remaining:
+            return None
+        return self._check_children(remaining)
+
+    def describe(self) -> str:
+        return "AND"
+
+    def explain(self, depth: int) -> list[str]:
+        lines = super().explain(depth)
+        # children answered by the indexes first, then the rest in evaluation order
+        ordered = self.ordered()
+        answered = sorted(
+            (c for c in ordered if c.found is not None), key=lambda c: len(c.found or {})
+        )
+        for c in answered + [c for c in ordered if c.found is None]:
+            lines.extend(c.explain(depth + 1))
+        return lines
+
+
+class _Or(_Node):
+    def __init__(self, children: list[_Node]) -> None:
+        super().__init__()
+        self.children = children
+        self.cost = sum(c.cost for c in children)
+
+    def prepare(self, inventory: Inventory) -> None:
+        for c in self.children:
+            c.prepare(inventory)
+
+        if any(c.found is None for c in self.children):
+            return
+        found: dict[str, Host] = {}
+        for c in self.children:
+            found.update(c.found or {})
+        # keep the order of the inventory
+        self.found = {n: found[n] for n in inventory.hosts if n in found}
+        self.exact = all(c.exact for c in self.children)
+
+    def ordered(self) -> list[_Node]:
+        return sorted(self.children, key=lambda c: c.cost)
+
+    def _check(self) -> Matcher:
+        matchers = [c.matcher() for c in self.ordered()]
+
+        def check(host: Host) -> bool:
+            return any(m(host) for m in matchers)
+
+        return check
+
+    def describe(self) -> str:
+        return "OR"
+
+    def explain(self, depth: int) -> list[str]:
+        lines = super().explain(depth)
+        for c in self.ordered():
+            lines.extend(c.explain(depth + 1))
+        return lines
+
+
+def _is_equality(key: str) -> bool:
+    """
+    Whether ``F(key=value)`` is equivalent to ``host.get(key) == value``, which is the
+    case unless ``key`` refers to an operator or a method of the host
+    """
+    return (
+        "__" not in key
+        and key not in ("in", "any", "all")
+        # looked up in the classes as hosts don't see attributes of the metaclass,
+        # i.e. __name__
+        and not any("__{}__".format(key) in vars(c) for c in Host.__mro__)
+        and not callable(getattr(Host, key, None))
+    )
+
+
+def _to_rule(key: str, value: Any) -> _Node:
+    if _is_equality(key):
+        return _Equal(key, value)
+    base_key, _, rule = key.rpartition("__")
+    if rule == "in" and (values := _index_values(base_key, value)) is not None:
+        return _In(base_key, values)
+    return _Rule(key, value, negate=False)
+
+
+def _to_keyword_rule(key: str, value: Any) -> _Node:
+    # names are strings so a collection of names can only mean any of them
+    if key == "name" and (values := _index_values(key, value)) is not None:
+        return _In(key, values)
+    return _Equal(key, value)
+
+
+def _to_node(f: Callable[..., bool], kwargs: dict[str, Any]) -> _Node:
+    if kwargs:
+        return _Call(f, kwargs)
+
+    if type(f) in (AND, OR):
+        op1, op2 = _to_node(f.op1, {}), _to_node(f.op2, {})  # type: ignore[attr-defined]
+        cls = _And if type(f) is AND else _Or
+        children: list[_Node] = []
+        for op in (op1, op2):
+            children.extend(op.children if type(op) is cls else [op])
+        return cls(children)
+
+    if type(f) is F:
+        rules = list(starmap(_to_rule, f.filters.items()))
+        return rules[0] if len(rules) == 1 else _And(rules)
+
+    if type(f) is NOT_F:
+        negated: list[_Node] = [_Rule(k, v, negate=True) for k, v in f.filters.items()]
+        return negated[0] if len(negated) == 1 else _And(negated)
+
+    return _Call(f, kwargs)
+
+
+class FilterPlan:
+    """
+    Plans how to select the hosts of an inventory matching a set of filters.
+
+    :class:`F`, :class:`AND`, :class:`OR` and :class:`NOT_F` objects are broken down
+    into their rules and the conjuncts are reordered so the cheap and selective ones
+    are evaluated first. Equalities (``F(site="a")`` or ``inventory.filter(site="a")``)
+    and memberships (``F(site__in=["a", "b"])`` or ``inventory.filter(name=["h1", "h2"])``)
+    over keys indexed with :meth:`nornir.core.inventory.Inventory.create_index`, and
+    over ``name``, which is always indexed, are answered with the index, so the rest of
+    the rules are only evaluated for the hosts they yield; rules over other keys are
+    checked host by host. Custom filter
+    functions are assumed to be expensive and evaluated last.
+
+    Rules are evaluated in a different order than they were written so filter
+    functions with side effects may be called for a different set of hosts.
+
+    Arguments:
+        filters: pairs of filter and keyword arguments to call it with, if the filter is
+            ``None`` hosts are matched with ``host.get(key) == value`` for each argument,
+            except for ``name``, which can also be a list of names
+    """
+
+    def __init__(
+        self, filters: Iterable[tuple[Callable[..., bool] | None, dict[str, Any]]]
+    ) -> None:
+        nodes: list[_Node] = []
+        for f, kwargs in filters:
+            if f is None:
+                node: _Node = _And(list(starmap(_to_keyword_rule, kwargs.items())))
+            else:
+                node = _to_node(f, kwargs)
+            nodes.extend(node.children if type(node) is _And else [node])
+        self.root: _Node = nodes[0] if len(nodes) == 1 else _And(nodes)
+        self.executed = False
+        self.total = 0
+        self.candidates = 0
+        self.matched = 0
+
+    def execute(
+        self, inventory: Inventory, hosts: Hosts | None = None
+    ) -> Iterator[tuple[str, Host]]:
+        """
+        Yields the name and host of the hosts matching the filters, in the order of
+        the inventory.
+
+        Arguments:
+            inventory: inventory whose indexes are used
+            hosts: hosts to select from, defaults to ``inventory.hosts``. If given, it
+                must contain the same hosts, in the same order, as ``inventory.hosts``
+        """
+        root = self.root
+        root.prepare(inventory)
+        if hosts is None:
+            hosts = inventory.hosts
+        candidates: dict[str, Host] = root.found if root.found is not None else hosts
+
+        check: Matcher | None
+        if root.found is None:
+            check = root.matcher()
+        elif isinstance(root, _And):
+            check = root.residual()
+        else:
+            check = None if root.exact else root.matcher()
+
+        self.executed = True
+        self.total = len(inventory.hosts)
+        self.candidates = len(candidates)
+        self.matched = 0
+        if not isinstance(hosts, Hosts):
+            for name, host in candidates.items():
+                if check is None or check(host):
+                    self.matched += 1
+                    yield name, host
+            return
+
+        # hosts are inspected without keeping them, only those that match are (see LazyHosts)
+        scan = hosts._scan() if candidates is hosts else candidates.items()
+        for name, host in scan:
+            if check is None or check(host):
+                self.matched += 1
+                yield name, hosts._keep(name, host)
+
+    def explain(self) -> str:
+        """
+        Returns a description of the plan. If it was executed it includes how many hosts
+        the indexes yielded and how many hosts were evaluated and passed each rule.
+        """
+        if self.executed:
+            header = "{} of {} hosts selected from {} candidates".format(
+                self.matched, self.total, self.candidates
+            )
+        else:
+            header = "not executed"
+        return "\n".join([header, *self.root.explain(0)])
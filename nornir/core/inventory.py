@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import contextlib
+import hashlib
+import math
+import threading
+from collections import ChainMap, deque
+from collections.abc import ItemsView, Mapping, ValuesView
 from typing import (
     TYPE_CHECKING,
     Any,
     Protocol,
     TypeVar,
+    overload,
 )
 
 from nornir.core.configuration import Config
@@ -13,13 +20,126 @@ from nornir.core.plugins.connections import ConnectionPlugin, ConnectionPluginRe
 
 if TYPE_CHECKING:
     import builtins
-    from collections.abc import ItemsView, Iterator, KeysView, ValuesView
+    import types
+    from collections.abc import Callable, Collection, Iterable, Iterator, KeysView, Sequence
+    from typing import SupportsIndex
+
+    from nornir.core.filter import FilterPlan
 
 HostOrGroup = TypeVar("HostOrGroup", "Host", "Group")
 
+BASE_ATTRIBUTES = frozenset(("hostname", "port", "username", "password", "platform"))
+# attributes that, when changed, may change the values a host resolves via inheritance
+_TRACKED_ATTRIBUTES = BASE_ATTRIBUTES | {"groups", "defaults", "extras", "connection_options"}
+
+
+class _Generation:
+    """
+    Monotonic counters bumped every time an inventory element changes in a way that
+    may affect inheritance:
+
+        * ``value`` moves on any change except changes to ``data``
+        * ``groups`` only moves when the group hierarchy changes
+        * ``data`` only moves when ``data`` is replaced or modified
+
+    Elements are stamped with the value of ``value`` they last changed at, see
+    :meth:`InventoryElement._inheritance`. The latest changes to the group hierarchy
+    are kept in ``group_changes`` along with the value of ``groups`` they moved it to
+    and the element whose groups changed, or ``None`` if it isn't known, so indexes
+    can catch up with them, see :meth:`_GroupIndex.sync`.
+    """
+
+    __slots__ = ("_lock", "data", "group_changes", "groups", "value")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.value = 0
+        self.groups = 0
+        self.data = 0
+        self.group_changes: deque[tuple[int, InventoryElement | None]] = deque(
+            maxlen=_GROUP_CHANGES
+        )
+
+    def bump(self) -> int:
+        with self._lock:
+            self.value += 1
+            return self.value
+
+    def bump_groups(self, element: InventoryElement | None) -> int:
+        with self._lock:
+            self.groups += 1
+            self.value += 1
+            self.group_changes.append((self.groups, element))
+            return self.value
+
+    def changes_since(self, groups: int) -> list[InventoryElement | None] | None:
+        """
+        Returns the elements whose groups changed since ``groups`` was the value of
+        the counter, or ``None`` if some of those changes were already forgotten
+        """
+        with self._lock:
+            changes = [e for g, e in self.group_changes if g > groups]
+            if len(changes) != self.groups - groups:
+                return None
+            return changes
+
+    def bump_data(self) -> None:
+        with self._lock:
+            self.data += 1
+
+
+# changes to the group hierarchy an index can catch up with before it's rebuilt
+_GROUP_CHANGES = 1024
+_generation = _Generation()
+
+
+class _Inheritance:
+    """
+    Values an element derives from its parent groups and defaults. ``version`` is the
+    latest version of the element, its parent groups and its defaults when they were
+    computed, the values are discarded once one of them changes.
+    """
+
+    __slots__ = ("attributes", "connection_parameters", "extended_groups", "version")
+
+    def __init__(self, version: int, extended_groups: tuple[Group, ...]) -> None:
+        self.version = version
+        self.extended_groups = extended_groups
+        self.attributes: dict[str, Any] = {}
+        self.connection_parameters: dict[str | None, ConnectionOptions] = {}
+
+
+_OUTDATED = _Inheritance(-1, ())
+
+
+class _ElementCache:
+    """
+    Inheritance of an element along with the value of ``_generation.value`` it was
+    last checked to be current at. Until the counter moves nothing changed so there
+    is nothing to check.
+    """
+
+    __slots__ = ("checked", "inheritance")
+
+    def __init__(self) -> None:
+        self.checked = -1
+        self.inheritance = _OUTDATED
+
+    def __reduce__(self) -> tuple[type[_ElementCache], tuple[()]]:
+        # stamps are only meaningful within the process that computed them
+        return (_ElementCache, ())
+
 
 class BaseAttributes:
-    __slots__ = ("hostname", "password", "platform", "port", "username")
+    __slots__ = ("_version", "hostname", "password", "platform", "port", "username")
+
+    # value of _generation.value at the last change affecting inheritance
+    _version: int
+    hostname: str | None
+    port: int | None
+    username: str | None
+    password: str | None
+    platform: str | None
 
     def __init__(
         self,
@@ -29,11 +149,14 @@ class BaseAttributes:
         password: str | None = None,
         platform: str | None = None,
     ) -> None:
-        self.hostname = hostname
-        self.port = port
-        self.username = username
-        self.password = password
-        self.platform = platform
+        # a new object can't be part of anything cached yet, so during initialization
+        # attributes are set bypassing the change tracking done by __setattr__
+        object.__setattr__(self, "_version", 0)
+        object.__setattr__(self, "hostname", hostname)
+        object.__setattr__(self, "port", port)
+        object.__setattr__(self, "username", username)
+        object.__setattr__(self, "password", password)
+        object.__setattr__(self, "platform", platform)
 
     @classmethod
     def schema(cls) -> dict[str, Any]:
@@ -45,19 +168,84 @@ class BaseAttributes:
             "platform": "str",
         }
 
+    def __getstate__(self) -> tuple[None, dict[str, Any]]:
+        # slots are read directly as getattr would return the inherited values
+        state = {}
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get("__slots__", ()):
+                with contextlib.suppress(AttributeError):
+                    state[name] = cls.__dict__[name].__get__(self, cls)
+        # versions are only meaningful within the process that handed them out
+        del state["_version"]
+        return None, state
+
+    def __setstate__(self, state: tuple[None, dict[str, Any]]) -> None:
+        # same as in __init__, a new object doesn't need its changes tracked
+        object.__setattr__(self, "_version", 0)
+        for name, value in state[1].items():
+            object.__setattr__(self, name, value)
+        if isinstance(state[1].get("groups"), ParentGroups):
+            state[1]["groups"]._adopt(self)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "connection_options" and not isinstance(value, _ConnectionOptionsMap):
+            value = _ConnectionOptionsMap(value)
+        elif name == "data" and not isinstance(value, _Data):
+            value = _Data(value)
+        elif name == "groups" and not isinstance(value, ParentGroups):
+            value = ParentGroups(value or ())
+        object.__setattr__(self, name, value)
+        if name == "groups":
+            element = self if isinstance(self, InventoryElement) else None
+            if element is not None:
+                value._adopt(element)
+            object.__setattr__(self, "_version", _generation.bump_groups(element))
+        elif name == "data":
+            _generation.bump_data()
+        elif name in _TRACKED_ATTRIBUTES:
+            object.__setattr__(self, "_version", _generation.bump())
+
+    def _own_version(self) -> int:
+        """
+        Returns the version of the element at its last change affecting inheritance,
+        including changes to the groups and connection options it holds
+        """
+        return self._version
+
     def dict(self) -> dict[str, Any]:
         return {
-            "hostname": object.__getattribute__(self, "hostname"),
-            "port": object.__getattribute__(self, "port"),
-            "username": object.__getattribute__(self, "username"),
-            "password": object.__getattribute__(self, "password"),
-            "platform": object.__getattribute__(self, "platform"),
+            "hostname": _own_attribute(self, "hostname"),
+            "port": _own_attribute(self, "port"),
+            "username": _own_attribute(self, "username"),
+            "password": _own_attribute(self, "password"),
+            "platform": _own_attribute(self, "platform"),
         }
 
 
+# descriptors of the slots of BaseAttributes, which hold the value set on the element
+# itself even for hosts and groups, where the attributes resolve inheritance
+_SLOTS: dict[str, types.MemberDescriptorType] = {
+    name: BaseAttributes.__dict__[name] for name in BASE_ATTRIBUTES
+}
+
+
+def _options_version(options: dict[str, ConnectionOptions]) -> int:
+    version: int = getattr(options, "_version", 0)
+    for o in options.values():
+        version = max(version, o._version)
+    return version
+
+
+def _own_attribute(element: BaseAttributes, name: str) -> Any:
+    """Returns the value of the base attribute ``name`` set on ``element`` itself"""
+    return _SLOTS[name].__get__(element, BaseAttributes)
+
+
 class ConnectionOptions(BaseAttributes):
     __slots__ = ("extras",)
 
+    extras: dict[str, Any] | None
+
     def __init__(
         self,
         hostname: str | None = None,
@@ -67,7 +255,7 @@ class ConnectionOptions(BaseAttributes):
         platform: str | None = None,
         extras: dict[str, Any] | None = None,
     ) -> None:
-        self.extras = extras
+        object.__setattr__(self, "extras", extras)
         super().__init__(
             hostname=hostname,
             port=port,
@@ -90,7 +278,129 @@ class ConnectionOptions(BaseAttributes):
         }
 
 
+class _ConnectionOptionsMap(dict[str, ConnectionOptions]):
+    """
+    Dictionary of connection options. Adding or removing options invalidates the
+    connection parameters hosts have cached.
+    """
+
+    _version = 0
+
+    def _changed(self) -> None:
+        self._version = _generation.bump()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # versions are only meaningful within the process that set them
+        return {k: v for k, v in self.__dict__.items() if k != "_version"}
+
+    def __setitem__(self, name: str, options: ConnectionOptions) -> None:
+        super().__setitem__(name, options)
+        self._changed()
+
+    def __delitem__(self, name: str) -> None:
+        super().__delitem__(name)
+        self._changed()
+
+    def __ior__(self, other: Any) -> _ConnectionOptionsMap:  # type: ignore[misc,override]
+        super().__ior__(other)
+        self._changed()
+        return self
+
+    def pop(self, *args: Any) -> Any:
+        r = super().pop(*args)
+        self._changed()
+        return r
+
+    def popitem(self) -> tuple[str, ConnectionOptions]:
+        r = super().popitem()
+        self._changed()
+        return r
+
+    def clear(self) -> None:
+        super().clear()
+        self._changed()
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self._changed()
+
+    def setdefault(self, name: str, options: ConnectionOptions) -> ConnectionOptions:
+        r = super().setdefault(name, options)
+        self._changed()
+        return r
+
+
+class _Data(dict[str, Any]):
+    """
+    Data of an inventory element. Modifying it invalidates the indexes built over data
+    keys, see :meth:`Inventory.create_index`.
+    """
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        super().__setitem__(key, value)
+        _generation.bump_data()
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        _generation.bump_data()
+
+    def __ior__(self, other: Any) -> _Data:  # type: ignore[misc,override]
+        super().__ior__(other)
+        _generation.bump_data()
+        return self
+
+    def pop(self, *args: Any) -> Any:
+        r = super().pop(*args)
+        _generation.bump_data()
+        return r
+
+    def popitem(self) -> tuple[str, Any]:
+        r = super().popitem()
+        _generation.bump_data()
+        return r
+
+    def clear(self) -> None:
+        super().clear()
+        _generation.bump_data()
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        _generation.bump_data()
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key in self:
+            return self[key]
+        self[key] = default
+        return default
+
+
 class ParentGroups(list["Group"]):
+    """
+    List of parent groups. Any change to the list invalidates the values hosts
+    have cached based on their inheritance.
+    """
+
+    _version = 0
+    # element holding the list, if only one does
+    _owner: InventoryElement | None = None
+    _shared = False
+
+    def _adopt(self, element: InventoryElement) -> None:
+        if self._owner is None:
+            self._owner = element
+        elif self._owner is not element:
+            self._shared = True
+
+    def _changed(self) -> None:
+        self._version = _generation.bump_groups(None if self._shared else self._owner)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # versions are only meaningful within the process that set them and owners
+        # adopt the list again when they are unpickled
+        return {
+            k: v for k, v in self.__dict__.items() if k not in {"_version", "_owner", "_shared"}
+        }
+
     def __contains__(self, value: object) -> bool:
         if isinstance(value, str):
             return any(value == g.name for g in self)
@@ -109,9 +419,141 @@ class ParentGroups(list["Group"]):
         if not self.__contains__(group):
             self.append(group)
 
+    def append(self, group: Group) -> None:
+        super().append(group)
+        self._changed()
+
+    def extend(self, groups: Iterable[Group]) -> None:
+        super().extend(groups)
+        self._changed()
+
+    def insert(self, index: SupportsIndex, group: Group) -> None:
+        super().insert(index, group)
+        self._changed()
+
+    def remove(self, group: Group) -> None:
+        super().remove(group)
+        self._changed()
+
+    def pop(self, index: SupportsIndex = -1) -> Group:
+        group = super().pop(index)
+        self._changed()
+        return group
+
+    def clear(self) -> None:
+        super().clear()
+        self._changed()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._changed()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        self._changed()
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        super().__setitem__(index, value)
+        self._changed()
+
+    def __delitem__(self, index: Any) -> None:
+        super().__delitem__(index)
+        self._changed()
+
+    def __iadd__(self, groups: Iterable[Group]) -> ParentGroups:  # type: ignore[misc,override]
+        super().__iadd__(groups)
+        self._changed()
+        return self
+
+    def __imul__(self, n: SupportsIndex) -> ParentGroups:
+        super().__imul__(n)
+        self._changed()
+        return self
+
+
+class _ExtendedDataItemsView(ItemsView[str, Any]):
+    _mapping: ExtendedData
+
+    def __iter__(self) -> Iterator[tuple[str, Any]]:
+        return self._mapping._iter_items()
+
+
+class _ExtendedDataValuesView(ValuesView[Any]):
+    _mapping: ExtendedData
+
+    def __iter__(self) -> Iterator[Any]:
+        return (v for _, v in self._mapping._iter_items())
+
+
+class ExtendedData(Mapping[str, Any]):
+    """
+    Read-only view of the data of a host merged with the data of its parent groups
+    and its defaults, in the order given by :meth:`InventoryElement.extended_groups`.
+
+    Nothing is copied, lookups go to the underlying dictionaries so changes made to
+    them are visible through the view right away.
+    """
+
+    __slots__ = ("_chain",)
+
+    def __init__(self, *maps: dict[str, Any]) -> None:
+        self._chain = ChainMap(*maps)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._chain[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._chain
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._chain.get(key, default)
+
+    def __iter__(self) -> Iterator[str]:
+        seen: set[str] = set()
+        for m in self._chain.maps:
+            for k in m:
+                if k not in seen:
+                    seen.add(k)
+                    yield k
+
+    def __len__(self) -> int:
+        return len(set().union(*self._chain.maps))
+
+    def _iter_items(self) -> Iterator[tuple[str, Any]]:
+        seen: set[str] = set()
+        for m in self._chain.maps:
+            for k, v in m.items():
+                if k not in seen:
+                    seen.add(k)
+                    yield k, v
+
+    def items(self) -> ItemsView[str, Any]:
+        return _ExtendedDataItemsView(self)
+
+    def values(self) -> ValuesView[Any]:
+        return _ExtendedDataValuesView(self)
+
+    def __repr__(self) -> str:
+        return "{}({})".format(self.__class__.__name__, dict(self._iter_items()))
+
 
 class InventoryElement(BaseAttributes):
-    __slots__ = ("connection_options", "data", "groups")
+    """
+    Base class of hosts and groups.
+
+    ``data`` is copied into a dictionary that tracks its changes, so indexes over data
+    keys stay current (see :meth:`Inventory.create_index`), when it's passed to the
+    constructor or assigned. The element then no longer shares it with the caller:
+    after ``host.data = d`` changes to ``d`` aren't seen by ``host.data`` and
+    ``host.data is d`` is ``False``. Modify ``host.data`` instead. ``groups`` is
+    likewise converted to :class:`ParentGroups` if it isn't one.
+    """
+
+    __slots__ = ("_cache", "connection_options", "data", "groups")
+
+    groups: ParentGroups
+    data: dict[str, Any]
+    connection_options: dict[str, ConnectionOptions]
 
     def __init__(
         self,
@@ -124,9 +566,16 @@ class InventoryElement(BaseAttributes):
         data: dict[str, Any] | None = None,
         connection_options: dict[str, ConnectionOptions] | None = None,
     ) -> None:
-        self.groups = groups or ParentGroups()
-        self.data = data or {}
-        self.connection_options = connection_options or {}
+        self._cache = _ElementCache()
+        object.__setattr__(self, "data", _Data(data or {}))
+        # plain lists are converted so changes made to them in place are noticed
+        if not isinstance(groups, ParentGroups):
+            groups = ParentGroups(groups or ())
+        groups._adopt(self)
+        object.__setattr__(self, "groups", groups)
+        object.__setattr__(
+            self, "connection_options", _ConnectionOptionsMap(connection_options or {})
+        )
         super().__init__(
             hostname=hostname,
             port=port,
@@ -147,7 +596,7 @@ class InventoryElement(BaseAttributes):
     def dict(self) -> dict[str, Any]:
         return {
             "groups": [g.name for g in self.groups],
-            "data": self.data,
+            "data": dict(self.data),
             "connection_options": {k: v.dict() for k, v in self.connection_options.items()},
             **super().dict(),
         }
@@ -179,22 +628,72 @@ class InventoryElement(BaseAttributes):
 
         this will return [group_a, group_1, group_X, group_2, group_b, group_3]
         """
-        groups: list[Group] = []
+        return list(self._extended_groups())
 
+    def _extended_groups(self) -> tuple[Group, ...]:
+        """
+        Same as :meth:`extended_groups` but returns the linearization cached by the
+        element, see :meth:`_inheritance`.
+        """
+        return self._inheritance().extended_groups
+
+    def _linearize(self) -> tuple[Group, ...]:
+        # dicts keep insertion order so they double as an ordered set
+        linearized: dict[Group, None] = {}
+        for g in self.groups:
+            linearized[g] = None
+            for sg in g._extended_groups():
+                linearized.setdefault(sg, None)
+        return tuple(linearized)
+
+    def _own_version(self) -> int:
+        return max(
+            self._version,
+            getattr(self.groups, "_version", 0),
+            _options_version(self.connection_options),
+        )
+
+    def _inheritance_version(self) -> int:
+        """
+        Returns the latest version of the element and the elements it inherits from.
+        Parent groups are checked with :meth:`_inheritance`, so each group is only
+        checked once after a change however many hosts belong to it
+        """
+        version = self._own_version()
         for g in self.groups:
-            if g not in groups:
-                groups.append(g)
+            version = max(version, g._inheritance().version)
+        return version
 
-            for sg in g.extended_groups():
-                if sg not in groups:
-                    groups.append(sg)
+    def _inheritance(self) -> _Inheritance:
+        """
+        Returns the values the element derives from its parent groups and defaults.
 
-        return groups
+        They are kept until the element, one of its parent groups or its defaults
+        change; a change to any other element of the inventory only costs checking
+        the versions of those once.
+        """
+        cache = self._cache
+        now = _generation.value
+        inheritance = cache.inheritance
+        if cache.checked == now:
+            return inheritance
+
+        # versions are read before linearizing so changes made meanwhile are noticed
+        # next time
+        version = self._inheritance_version()
+        if version != inheritance.version:
+            inheritance = _Inheritance(version, self._linearize())
+            cache.inheritance = inheritance
+        cache.checked = now
+        return inheritance
 
 
 class Defaults(BaseAttributes):
     __slots__ = ("connection_options", "data")
 
+    data: dict[str, Any]
+    connection_options: dict[str, ConnectionOptions]
+
     def __init__(
         self,
         hostname: str | None = None,
@@ -205,8 +704,10 @@ class Defaults(BaseAttributes):
         data: dict[str, Any] | None = None,
         connection_options: dict[str, ConnectionOptions] | None = None,
     ) -> None:
-        self.data = data or {}
-        self.connection_options = connection_options or {}
+        object.__setattr__(self, "data", _Data(data or {}))
+        object.__setattr__(
+            self, "connection_options", _ConnectionOptionsMap(connection_options or {})
+        )
         super().__init__(
             hostname=hostname,
             port=port,
@@ -225,15 +726,60 @@ class Defaults(BaseAttributes):
 
     def dict(self) -> dict[str, Any]:
         return {
-            "data": self.data,
+            "data": dict(self.data),
             "connection_options": {k: v.dict() for k, v in self.connection_options.items()},
             **super().dict(),
         }
 
+    def _own_version(self) -> int:
+        return max(self._version, _options_version(self.connection_options))
+
+
+class _InheritedAttribute:
+    """
+    Data descriptor for the base attributes of hosts and groups. The value set on the
+    element is stored in the slot defined by :class:`BaseAttributes`, when it's ``None``
+    the value is resolved through the parent groups and the defaults instead
+    """
+
+    __slots__ = ("name", "slot")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.slot = _SLOTS[name]
+
+    @overload
+    def __get__(self, obj: None, objtype: type[Host] | None = None) -> _InheritedAttribute: ...
+
+    @overload
+    def __get__(self, obj: Host, objtype: type[Host] | None = None) -> Any: ...
+
+    def __get__(self, obj: Host | None, objtype: type[Host] | None = None) -> Any:
+        if obj is None:
+            return self
+        v = self.slot.__get__(obj, objtype)
+        if v is None:
+            return obj._inherited_attribute(self.name)
+        return v
+
+    def __set__(self, obj: Host, value: Any) -> None:
+        self.slot.__set__(obj, value)
+
+    def __delete__(self, obj: Host) -> None:
+        self.slot.__delete__(obj)
+
 
 class Host(InventoryElement):
     __slots__ = ("connections", "defaults", "name")
 
+    defaults: Defaults
+
+    hostname = _InheritedAttribute("hostname")
+    port = _InheritedAttribute("port")
+    username = _InheritedAttribute("username")
+    password = _InheritedAttribute("password")
+    platform = _InheritedAttribute("platform")
+
     def __init__(
         self,
         name: str,
@@ -248,7 +794,9 @@ class Host(InventoryElement):
         defaults: Defaults | None = None,
     ) -> None:
         self.name = name
-        self.defaults = defaults or Defaults(None, None, None, None, None, None, None)
+        object.__setattr__(
+            self, "defaults", defaults or Defaults(None, None, None, None, None, None, None)
+        )
         self.connections: dict[str, ConnectionPlugin] = {}
         super().__init__(
             hostname=hostname,
@@ -261,25 +809,23 @@ class Host(InventoryElement):
             connection_options=connection_options,
         )
 
+    def _inheritance_version(self) -> int:
+        return max(super()._inheritance_version(), self.defaults._own_version())
+
     def extended_data(self) -> dict[str, Any]:
         """
         Returns the data associated with the object including inherited data
         """
-        processed = []
-        result = {}
-        for k, v in self.data.items():
-            processed.append(k)
-            result[k] = v
-        for g in self.extended_groups():
-            for k, v in g.data.items():
-                if k not in processed:
-                    processed.append(k)
-                    result[k] = v
-        for k, v in self.defaults.data.items():
-            if k not in processed:
-                processed.append(k)
-                result[k] = v
-        return result
+        return dict(self.extended_data_view()._iter_items())
+
+    def extended_data_view(self) -> ExtendedData:
+        """
+        Returns a read-only view of the data associated with the object including
+        inherited data. Unlike :meth:`extended_data` the data is not copied.
+        """
+        return ExtendedData(
+            self.data, *[g.data for g in self._extended_groups()], self.defaults.data
+        )
 
     @classmethod
     def schema(cls) -> dict[str, Any]:
@@ -296,6 +842,9 @@ class Host(InventoryElement):
             **super().dict(),
         }
 
+    # keys, values, items and iterating over the host work on a copy so the host can
+    # be modified meanwhile, use extended_data_view to avoid copying
+
     def keys(self) -> KeysView[str]:
         """Returns the keys of the attribute ``data`` and of the parent(s) groups."""
         return self.extended_data().keys()
@@ -319,14 +868,14 @@ class Host(InventoryElement):
         return self._has_parent_group_by_object(group)
 
     def _has_parent_group_by_name(self, group: str) -> bool:
-        for g in self.groups:
-            if g.name == group or g.has_parent_group(group):
+        for g in self._extended_groups():
+            if g.name == group:
                 return True
         return False
 
     def _has_parent_group_by_object(self, group: Group) -> bool:
-        for g in self.groups:
-            if g is group or g.has_parent_group(group):
+        for g in self._extended_groups():
+            if g is group:
                 return True
         return False
 
@@ -335,7 +884,7 @@ class Host(InventoryElement):
             return self.data[item]
 
         except KeyError:
-            for g in self.extended_groups():
+            for g in self._extended_groups():
                 try:
                     return g.data[item]
                 except KeyError:
@@ -347,19 +896,28 @@ class Host(InventoryElement):
 
             raise
 
-    def __getattribute__(self, name: str) -> Any:
-        if name not in ("hostname", "port", "username", "password", "platform"):
-            return object.__getattribute__(self, name)
-        v = object.__getattribute__(self, name)
-        if v is None:
-            for g in self.extended_groups():
-                r = object.__getattribute__(g, name)
-                if r is not None:
-                    return r
+    def _inherited_attribute(self, name: str) -> Any:
+        """
+        Resolves ``name`` through the parent groups and defaults. Results are cached
+        until the host, its parent groups or its defaults change.
+        """
+        inheritance = self._inheritance()
+        resolved = inheritance.attributes
+        try:
+            return resolved[name]
+        except KeyError:
+            pass
 
-            return object.__getattribute__(self.defaults, name)
+        r = None
+        for g in inheritance.extended_groups:
+            r = _own_attribute(g, name)
+            if r is not None:
+                break
+        else:
+            r = _own_attribute(self.defaults, name)
 
-        return v
+        resolved[name] = r
+        return r
 
     def __bool__(self) -> bool:
         return bool(self.name)
@@ -368,10 +926,10 @@ class Host(InventoryElement):
         self.data[item] = value
 
     def __len__(self) -> int:
-        return len(self.extended_data().keys())
+        return len(self.extended_data_view())
 
     def __iter__(self) -> Iterator[str]:
-        return self.extended_data().__iter__()
+        return iter(list(self.extended_data_view()))
 
     def __str__(self) -> str:
         return self.name
@@ -387,8 +945,10 @@ class Host(InventoryElement):
             item(``str``): The variable to get
             default(``any``): Return value if item not found
         """
-        if hasattr(self, item):
+        try:
             return getattr(self, item)
+        except AttributeError:
+            pass
         try:
             return self.__getitem__(item)
 
@@ -396,61 +956,61 @@ class Host(InventoryElement):
             return default
 
     def get_connection_parameters(self, connection: str | None = None) -> ConnectionOptions:
-        if not connection:
-            d = ConnectionOptions(
-                hostname=self.hostname,
-                port=self.port,
-                username=self.username,
-                password=self.password,
-                platform=self.platform,
-                extras={},
-            )
-        else:
-            r = self._get_connection_options_recursively(connection)
-            if r is not None:
-                d = ConnectionOptions(
-                    hostname=r.hostname if r.hostname is not None else self.hostname,
-                    port=r.port if r.port is not None else self.port,
-                    username=r.username if r.username is not None else self.username,
-                    password=r.password if r.password is not None else self.password,
-                    platform=r.platform if r.platform is not None else self.platform,
-                    extras=r.extras if r.extras is not None else {},
-                )
-            else:
-                d = ConnectionOptions(
-                    hostname=self.hostname,
-                    port=self.port,
-                    username=self.username,
-                    password=self.password,
-                    platform=self.platform,
-                    extras={},
-                )
-        return d
-
-    def _get_connection_options_recursively(self, connection: str) -> ConnectionOptions | None:
-        p = self.connection_options.get(connection)
-        if p is None:
-            p = ConnectionOptions(None, None, None, None, None, None)
+        """
+        Returns the parameters to use when opening the connection ``connection``.
 
-        for g in self.groups:
-            sp = g._get_connection_options_recursively(connection)
-            if sp is not None:
-                p.hostname = p.hostname if p.hostname is not None else sp.hostname
-                p.port = p.port if p.port is not None else sp.port
-                p.username = p.username if p.username is not None else sp.username
-                p.password = p.password if p.password is not None else sp.password
-                p.platform = p.platform if p.platform is not None else sp.platform
-                p.extras = p.extras if p.extras is not None else sp.extras
-
-        sp = self.defaults.connection_options.get(connection, None)
-        if sp is not None:
-            p.hostname = p.hostname if p.hostname is not None else sp.hostname
-            p.port = p.port if p.port is not None else sp.port
-            p.username = p.username if p.username is not None else sp.username
-            p.password = p.password if p.password is not None else sp.password
-            p.platform = p.platform if p.platform is not None else sp.platform
-            p.extras = p.extras if p.extras is not None else sp.extras
-        return p
+        Each parameter is taken from the first of the following that sets it: the
+        connection options of the host, the connection options of its groups (in the
+        order given by :meth:`extended_groups`), the connection options of the defaults
+        and, lastly, the attributes of the host itself.
+
+        The parameters are cached until the host, its parent groups or its defaults
+        change. Each call returns a new object so callers are free to modify it, note
+        that values inside ``extras`` are still shared with the inventory.
+        """
+        resolved = self._inheritance().connection_parameters
+        try:
+            params = resolved[connection]
+        except KeyError:
+            params = self._resolve_connection_parameters(connection)
+            resolved[connection] = params
+
+        return ConnectionOptions(
+            hostname=params.hostname,
+            port=params.port,
+            username=params.username,
+            password=params.password,
+            platform=params.platform,
+            extras=dict(params.extras) if params.extras is not None else None,
+        )
+
+    def _resolve_connection_parameters(self, connection: str | None) -> ConnectionOptions:
+        hostname = port = username = password = platform = extras = None
+        if connection:
+            elements: tuple[InventoryElement | Defaults, ...] = (
+                self,
+                *self._extended_groups(),
+                self.defaults,
+            )
+            for element in elements:
+                o = element.connection_options.get(connection)
+                if o is None:
+                    continue
+                hostname = hostname if hostname is not None else o.hostname
+                port = port if port is not None else o.port
+                username = username if username is not None else o.username
+                password = password if password is not None else o.password
+                platform = platform if platform is not None else o.platform
+                extras = extras if extras is not None else o.extras
+
+        return ConnectionOptions(
+            hostname=hostname if hostname is not None else self.hostname,
+            port=port if port is not None else self.port,
+            username=username if username is not None else self.username,
+            password=password if password is not None else self.password,
+            platform=platform if platform is not None else self.platform,
+            extras=extras if extras is not None else {},
+        )
 
     def get_connection(self, connection: str, configuration: Config) -> Any:
         """
@@ -557,7 +1117,244 @@ class Group(Host):
 
 
 class Hosts(dict[str, Host]):
-    pass
+    """
+    Hosts keyed by name. Adding or removing hosts bumps ``_version`` so indexes built
+    over the hosts know when they need to be rebuilt.
+    """
+
+    _version = 0
+
+    def _changed(self) -> None:
+        self._version += 1
+
+    def __setitem__(self, name: str, host: Host) -> None:
+        super().__setitem__(name, host)
+        self._changed()
+
+    def __delitem__(self, name: str) -> None:
+        super().__delitem__(name)
+        self._changed()
+
+    def __ior__(self, other: Any) -> Hosts:  # type: ignore[misc,override]
+        super().__ior__(other)
+        self._changed()
+        return self
+
+    def pop(self, *args: Any) -> Any:
+        r = super().pop(*args)
+        self._changed()
+        return r
+
+    def popitem(self) -> tuple[str, Host]:
+        r = super().popitem()
+        self._changed()
+        return r
+
+    def clear(self) -> None:
+        super().clear()
+        self._changed()
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self._changed()
+
+    def setdefault(self, name: str, host: Host) -> Host:
+        r = super().setdefault(name, host)
+        self._changed()
+        return r
+
+    def _scan(self) -> Iterable[tuple[str, Host]]:
+        """
+        Iterates over the hosts to inspect them, i.e. to evaluate a filter. Unlike
+        ``items()``, :class:`LazyHosts` doesn't keep the hosts it builds for this unless
+        they are passed to :meth:`_keep`.
+        """
+        return self.items()
+
+    def _peek(self, name: str) -> Host:
+        """Returns a host to inspect it, see :meth:`_scan`"""
+        return self[name]
+
+    def _keep(self, name: str, host: Host) -> Host:
+        """
+        Keeps a host returned by :meth:`_scan` or :meth:`_peek`, returns the host stored
+        under ``name``
+        """
+        return host
+
+
+_BUILT = object()
+
+
+class LazyHosts(Hosts):
+    """
+    Hosts built on demand from the records they are defined by.
+
+    ``factory(name, record)`` builds a host the first time it's retrieved, i.e. with
+    ``hosts[name]``, ``get`` or iterating over ``values()`` or ``items()``; from then on
+    the same host is returned. Checking if a host exists, iterating over the names or
+    counting the hosts doesn't build them.
+
+    Filtering with :meth:`Inventory.filter` evaluates the filter over hosts built just
+    for that and only keeps those that match, so startup time and memory grow with the
+    hosts that are actually used rather than with the size of the inventory.
+
+    ``factory`` and the functions passed to :meth:`defer` need to be picklable for the
+    hosts to be picklable.
+    """
+
+    def __init__(self, records: dict[str, Any], factory: Callable[[str, Any], Host]) -> None:
+        super().__init__()
+        # all the names, in order, mapped to their record or to _BUILT
+        self._records: dict[str, Any] = dict(records)
+        self._factory = factory
+        self._transforms: list[Callable[[Host], None]] = []
+
+    def defer(self, transform: Callable[[Host], None]) -> None:
+        """
+        Applies ``transform`` to the hosts built so far and to the rest of the hosts
+        when they are built
+        """
+        for host in super().values():
+            transform(host)
+        self._transforms.append(transform)
+
+    def pending(self) -> int:
+        """Number of hosts not built yet"""
+        return len(self._records) - super().__len__()
+
+    def _build(self, name: str, record: Any) -> Host:
+        host = self._factory(name, record)
+        for transform in self._transforms:
+            transform(host)
+        return host
+
+    def __missing__(self, name: str) -> Host:
+        record = self._records.get(name, _BUILT)
+        if record is _BUILT:
+            raise KeyError(name)
+        return self._keep(name, self._build(name, record))
+
+    def _keep(self, name: str, host: Host) -> Host:
+        if dict.__contains__(self, name):
+            return dict.__getitem__(self, name)
+        # adding a host that was already defined doesn't change the hosts
+        dict.__setitem__(self, name, host)
+        self._records[name] = _BUILT
+        return host
+
+    def _peek(self, name: str) -> Host:
+        record = self._records[name]
+        if record is _BUILT:
+            return dict.__getitem__(self, name)
+        return self._build(name, record)
+
+    def _scan(self) -> Iterator[tuple[str, Host]]:
+        for name, record in self._records.items():
+            if record is _BUILT:
+                yield name, dict.__getitem__(self, name)
+            else:
+                yield name, self._build(name, record)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._records
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyHosts):
+            other = dict(other.items())
+        return dict(self.items()) == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+    def keys(self) -> KeysView[str]:  # type: ignore[override]
+        return self._records.keys()
+
+    def values(self) -> ValuesView[Host]:  # type: ignore[override]
+        return ValuesView(self)
+
+    def items(self) -> ItemsView[str, Host]:  # type: ignore[override]
+        return ItemsView(self)
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return self[name] if name in self._records else default
+
+    def copy(self) -> dict[str, Host]:
+        return dict(self.items())
+
+    def __setitem__(self, name: str, host: Host) -> None:
+        super().__setitem__(name, host)
+        self._records[name] = _BUILT
+
+    def __delitem__(self, name: str) -> None:
+        del self._records[name]
+        if dict.__contains__(self, name):
+            dict.__delitem__(self, name)
+        self._changed()
+
+    def __ior__(self, other: Any) -> LazyHosts:  # type: ignore[misc,override]
+        self.update(other)
+        return self
+
+    def pop(self, *args: Any) -> Any:
+        name = args[0]
+        if name not in self._records:
+            if len(args) > 1:
+                return args[1]
+            raise KeyError(name)
+        host = self[name]
+        del self[name]
+        return host
+
+    def popitem(self) -> tuple[str, Host]:
+        if not self._records:
+            raise KeyError("popitem(): dictionary is empty")
+        name = next(reversed(self._records))
+        return name, self.pop(name)
+
+    def clear(self) -> None:
+        self._records.clear()
+        super().clear()
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for name, host in dict(*args, **kwargs).items():
+            self[name] = host
+
+    def setdefault(self, name: str, host: Host) -> Host:
+        if name in self._records:
+            return self[name]
+        self[name] = host
+        return host
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        pending = {n: r for n, r in self._records.items() if r is not _BUILT}
+        built = dict(super().items())
+        return (
+            _unpickle_lazy_hosts,
+            (list(self._records), pending, built, self._factory, self._transforms),
+        )
+
+
+def _unpickle_lazy_hosts(
+    names: list[str],
+    pending: dict[str, Any],
+    built: dict[str, Host],
+    factory: Callable[[str, Any], Host],
+    transforms: list[Callable[[Host], None]],
+) -> LazyHosts:
+    hosts = LazyHosts({n: pending.get(n, _BUILT) for n in names}, factory)
+    hosts._transforms = transforms
+    for name, host in built.items():
+        dict.__setitem__(hosts, name, host)
+    return hosts
 
 
 class Groups(dict[str, Group]):
@@ -568,12 +1365,260 @@ class TransformFunction(Protocol):
     def __call__(self, host: Host, **kwargs: Any) -> None: ...
 
 
+class BatchTransformFunction(Protocol):
+    def __call__(self, hosts: list[Host], **kwargs: Any) -> None: ...
+
+
 class FilterObj(Protocol):
     def __call__(self, host: Host, **kwargs: Any) -> bool: ...
 
 
+class _GroupIndex:
+    """
+    Maps groups to the names of the hosts that belong to them, directly or via
+    inheritance. The index is built once for a given set of hosts and then kept up to
+    date with the changes to the group hierarchy, only revisiting the hosts that
+    belong to the elements whose groups changed.
+    """
+
+    __slots__ = ("_lock", "by_group", "by_host", "by_name", "stamp", "synced")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.stamp: tuple[int, int] | None = None
+        self.synced = -1
+        self.by_host: dict[str, tuple[Group, ...]] = {}
+        self.by_group: dict[Group, set[str]] = {}
+        self.by_name: dict[str, set[str]] = {}
+
+    def __reduce__(self) -> tuple[type[_GroupIndex], tuple[()]]:
+        # stamps are only meaningful within a process, unpickle to an empty index
+        return _GroupIndex, ()
+
+    def members(self, hosts: Hosts, group: str | Group) -> set[str]:
+        """Returns the names of the hosts in ``hosts`` that belong to ``group``"""
+        with self._lock:
+            self.sync(hosts)
+            if isinstance(group, str):
+                return set(self.by_name.get(group, ()))
+            return set(self.by_group.get(group, ()))
+
+    def sync(self, hosts: Hosts) -> None:
+        """
+        Brings the index up to date, rebuilding it if hosts were added or removed or it
+        can't tell which elements changed their groups since it was last synced
+        """
+        synced = _generation.groups
+        stamp = (id(hosts), hosts._version)
+        if self.stamp == stamp and self.synced == synced:
+            return
+
+        changes = _generation.changes_since(self.synced) if self.stamp == stamp else None
+        if changes is None or None in changes:
+            self.by_host.clear()
+            self.by_group.clear()
+            self.by_name.clear()
+            for name, host in hosts._scan():
+                self._update(name, host)
+        else:
+            outdated: set[str] = set()
+            for element in changes:
+                if isinstance(element, Group):
+                    outdated.update(self.by_group.get(element, ()))
+                elif isinstance(element, Host) and element.name in hosts:
+                    outdated.add(element.name)
+            for name in outdated:
+                self._update(name, hosts._peek(name))
+        self.stamp = stamp
+        self.synced = synced
+
+    def _update(self, name: str, host: Host) -> None:
+        old = self.by_host.get(name, ())
+        new = host._extended_groups()
+        if old == new:
+            return
+
+        self.by_host[name] = new
+        for g in set(old).difference(new):
+            members = self.by_group[g]
+            members.discard(name)
+            if not members:
+                del self.by_group[g]
+        for g in new:
+            self.by_group.setdefault(g, set()).add(name)
+
+        # different group objects may share a name, should be rare
+        old_names = {g.name for g in old}
+        new_names = {g.name for g in new}
+        for n in old_names - new_names:
+            members = self.by_name[n]
+            members.discard(name)
+            if not members:
+                del self.by_name[n]
+        for n in new_names:
+            self.by_name.setdefault(n, set()).add(name)
+
+
+class _HostIndex:
+    """
+    Maps the values hosts resolve for ``key`` via :meth:`Host.get` to the names of the
+    hosts. Hosts with unhashable values are kept aside and compared one by one.
+
+    Indexes are stamped with the state of the inventory they were built for, see
+    :meth:`Inventory._lookup`. The stamp is published along with the contents in
+    ``state`` so readers never see an index being built.
+    """
+
+    __slots__ = ("key", "state")
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+        # stamp, hosts by value, unhashable values by host and position of the hosts
+        self.state: tuple[
+            tuple[int, int, int, int] | None, dict[Any, list[str]], dict[str, Any], dict[str, int]
+        ] = (None, {}, {}, {})
+
+    @property
+    def stamp(self) -> tuple[int, int, int, int] | None:
+        return self.state[0]
+
+    @staticmethod
+    def build(indexes: list[_HostIndex], hosts: Hosts, stamp: tuple[int, int, int, int]) -> None:
+        """Builds the indexes going over the hosts only once"""
+        # only names and values are kept so hosts built to inspect them can be discarded
+        positions: dict[str, int] = {}
+        built: list[tuple[_HostIndex, dict[Any, list[str]], dict[str, Any]]] = [
+            (index, {}, {}) for index in indexes
+        ]
+        for i, (name, host) in enumerate(hosts._scan()):
+            positions[name] = i
+            for index, values, unhashable in built:
+                v = host.get(index.key)
+                try:
+                    values.setdefault(v, []).append(name)
+                except TypeError:
+                    unhashable[name] = v
+        for index, values, unhashable in built:
+            index.state = (stamp, values, unhashable, positions)
+
+    def lookup(self, hosts: Hosts, values: Collection[Any]) -> dict[str, Host]:
+        """
+        Returns the hosts whose value equals any of ``values``, in the order of ``hosts``
+        """
+        _, by_value, unhashable, positions = self.state
+        if len(values) == 1 and not unhashable:
+            names = by_value.get(next(iter(values)), [])
+        else:
+            found = {n for v in values for n in by_value.get(v, ())}
+            found.update(n for n, v in unhashable.items() if any(v == x for x in values))
+            names = sorted(found, key=positions.__getitem__)
+        return {n: hosts._peek(n) for n in names}
+
+    def __reduce__(self) -> tuple[type[_HostIndex], tuple[str]]:
+        # stamps are only meaningful within a process, unpickle to an index to be built
+        return _HostIndex, (self.key,)
+
+
+class _ShardFilter:
+    """
+    Selects the hosts assigned to a shard using weighted rendezvous hashing: every
+    shard gets a score for the key of the host and the host goes to the shard with
+    the highest one. The score only depends on the key and the shard, so the
+    assignment of a host never changes when other hosts are added or removed, and
+    changing the number of shards only moves the hosts of the shards added or removed
+    """
+
+    __slots__ = ("index", "key", "weights")
+
+    def __init__(
+        self, index: int, key: Callable[[Host], str] | None, weights: tuple[float, ...]
+    ) -> None:
+        self.index = index
+        self.key = key
+        self.weights = weights
+
+    def shard_of(self, key: str) -> int:
+        """Returns the shard ``key`` is assigned to"""
+        encoded = key.encode()
+        best, best_score = 0, -math.inf
+        for shard, weight in enumerate(self.weights):
+            digest = hashlib.blake2b(encoded, digest_size=8, salt=shard.to_bytes(8, "little"))
+            # maps the hash to (0, 1) so the logarithm is always defined and negative
+            point = (int.from_bytes(digest.digest(), "little") + 1) / (2**64 + 1)
+            score = -weight / math.log(point)
+            if score > best_score:
+                best, best_score = shard, score
+        return best
+
+    def __call__(self, host: Host, **kwargs: Any) -> bool:
+        key = host.name if self.key is None else self.key(host)
+        return self.shard_of(key) == self.index
+
+
+class InventoryChanges:
+    """
+    Names of the elements added, removed and updated by :meth:`Inventory.patch`
+    """
+
+    __slots__ = (
+        "defaults_updated",
+        "groups_added",
+        "groups_removed",
+        "groups_updated",
+        "hosts_added",
+        "hosts_removed",
+        "hosts_updated",
+    )
+
+    def __init__(self) -> None:
+        self.defaults_updated = False
+        self.hosts_added: list[str] = []
+        self.hosts_removed: list[str] = []
+        self.hosts_updated: list[str] = []
+        self.groups_added: list[str] = []
+        self.groups_removed: list[str] = []
+        self.groups_updated: list[str] = []
+
+    def __bool__(self) -> bool:
+        return self.defaults_updated or any(
+            getattr(self, attr) for attr in self.__slots__ if attr != "defaults_updated"
+        )
+
+    def __repr__(self) -> str:
+        changes = ", ".join(
+            "{}={}".format(attr, getattr(self, attr))
+            for attr in self.__slots__
+            if getattr(self, attr)
+        )
+        return "{}({})".format(self.__class__.__name__, changes)
+
+
+def _patch_element(
+    target: Defaults | InventoryElement, source: Defaults | InventoryElement
+) -> None:
+    """Copies the attributes of ``source`` that differ into ``target``"""
+    for attr in BASE_ATTRIBUTES:
+        value = _own_attribute(source, attr)
+        if _own_attribute(target, attr) != value:
+            setattr(target, attr, value)
+    if target.data != source.data:
+        target.data = source.data
+    if {k: v.dict() for k, v in target.connection_options.items()} != {
+        k: v.dict() for k, v in source.connection_options.items()
+    }:
+        target.connection_options = source.connection_options
+
+
+def _patch_parents(target: InventoryElement, source: InventoryElement, groups: Groups) -> None:
+    """Makes ``target`` belong to the groups in ``groups`` named like the ones of ``source``"""
+    names = [g.name for g in source.groups]
+    current = [g.name for g in target.groups]
+    if current != names or any(g is not groups[g.name] for g in target.groups):
+        target.groups = ParentGroups([groups[n] for n in names])
+
+
 class Inventory:
-    __slots__ = ("defaults", "groups", "hosts")
+    __slots__ = ("_group_index", "_indexes", "defaults", "groups", "hosts")
 
     def __init__(
         self,
@@ -586,39 +1631,226 @@ class Inventory:
         self.hosts = hosts
         self.groups = groups or Groups()
         self.defaults = defaults or Defaults(None, None, None, None, None, None, None)
+        self._group_index: _GroupIndex | None = None
+        self._indexes = {"name": _HostIndex("name")}
 
     def filter(
         self,
         filter_obj: FilterObj | None = None,
         filter_func: FilterObj | None = None,
         **kwargs: Any,
-    ) -> Inventory:
-        filter_func = filter_obj or filter_func
-        if filter_func:
-            filtered = Hosts({n: h for n, h in self.hosts.items() if filter_func(h, **kwargs)})
-        else:
-            filtered = Hosts(
-                {
-                    n: h
-                    for n, h in self.hosts.items()
-                    if all(h.get(k) == v for k, v in kwargs.items())
-                }
-            )
-        return Inventory(hosts=filtered, groups=self.groups, defaults=self.defaults)
+    ) -> InventoryView:
+        """
+        Returns an inventory with the hosts that match the filter.
+
+        If ``filter_obj`` or ``filter_func`` is given a host matches when calling it with
+        the host and ``kwargs`` returns ``True``. Otherwise a host matches when
+        ``host.get(key) == value`` for each key/value pair in ``kwargs``; ``name`` can also
+        be a list of names to select any of them.
+
+        The hosts are selected right away, use :meth:`view` to defer it.
+        """
+        view = InventoryView(self, filter_obj or filter_func, kwargs)
+        view.materialize()
+        return view
+
+    def view(
+        self,
+        filter_obj: FilterObj | None = None,
+        filter_func: FilterObj | None = None,
+        **kwargs: Any,
+    ) -> InventoryView:
+        """
+        Same as :meth:`filter` but the hosts are only selected once the returned
+        view is used, see :class:`InventoryView`.
+        """
+        return InventoryView(self, filter_obj or filter_func, kwargs)
+
+    def shard(
+        self,
+        count: int,
+        index: int,
+        key: Callable[[Host], str] | None = None,
+        weights: Sequence[float] | None = None,
+    ) -> InventoryView:
+        """
+        Splits the hosts in ``count`` shards and returns a view of the inventory with
+        the hosts in shard ``index``, so the hosts can be spread across several workers
+        by giving each one a different ``index``.
+
+        Hosts are assigned using rendezvous hashing over ``key``, which is
+        deterministic across processes and machines. Adding or removing hosts doesn't
+        move any other host to a different shard and changing ``count`` only moves the
+        hosts assigned to the shards added or removed.
+
+        Arguments:
+            count: number of shards
+            index: shard to return, from ``0`` to ``count - 1``
+            key: function returning the string used to assign a host to a shard,
+                defaults to the name of the host
+            weights: relative capacity of each shard, a shard with twice the weight
+                of another gets twice as many hosts. Defaults to the same for all
+
+        Raises:
+            ValueError: if the arguments are out of range
+        """
+        if count < 1:
+            raise ValueError(f"count must be at least 1, got {count}")
+        if not 0 <= index < count:
+            raise ValueError(f"index must be between 0 and {count - 1}, got {index}")
+        shard_weights = tuple(weights) if weights is not None else (1.0,) * count
+        if len(shard_weights) != count:
+            raise ValueError(f"expected {count} weights, got {len(shard_weights)}")
+        if any(w <= 0 for w in shard_weights):
+            raise ValueError("weights must be positive")
+        return self.filter(filter_func=_ShardFilter(index, key, shard_weights))
 
     def __len__(self) -> int:
         return self.hosts.__len__()
 
+    def create_index(self, *keys: str) -> None:
+        """
+        Declares indexes over the given keys so filtering with ``key=value`` is answered
+        with a hash lookup instead of checking every host. Keys are resolved with
+        :meth:`Host.get`, so they can be attributes (i.e. ``platform``) or data keys,
+        including inherited ones. ``name`` is always indexed.
+
+        Indexes are built on first use and rebuilt after hosts are added or removed or
+        inventory elements change, including changes to their ``data``. Values nested
+        within ``data`` are not tracked, i.e. ``host.data["a"]["b"] = 1`` isn't noticed,
+        replace the top level value instead.
+
+        Arguments:
+            keys: keys to index
+        """
+        for key in keys:
+            self._indexes.setdefault(key, _HostIndex(key))
+
+    def _lookup(self, key: str, value: Any) -> dict[str, Host] | None:
+        """
+        Returns the hosts for which ``host.get(key) == value`` using the index over
+        ``key``. Returns ``None`` if ``key`` is not indexed or ``value`` can't be hashed.
+        Hosts are returned as with :meth:`Hosts._peek`.
+        """
+        return self._lookup_any(key, (value,))
+
+    def _lookup_any(self, key: str, values: Collection[Any]) -> dict[str, Host] | None:
+        """
+        Same as :meth:`_lookup` but returns the hosts whose value equals any of ``values``
+        """
+        index = self._indexes.get(key)
+        hosts = self.hosts
+        if index is None or not isinstance(hosts, Hosts):
+            return None
+        try:
+            for value in values:
+                hash(value)
+        except TypeError:
+            return None
+
+        # indexes are rebuilt whenever hosts are added or removed or any element changes,
+        # all the outdated indexes are rebuilt at once to go over the hosts only once
+        stamp = (_generation.value, _generation.data, id(hosts), hosts._version)
+        if index.stamp != stamp:
+            outdated = [i for i in self._indexes.values() if i.stamp != stamp]
+            _HostIndex.build(outdated, hosts, stamp)
+        return index.lookup(hosts, values)
+
+    def patch(self, inventory: Inventory) -> InventoryChanges:
+        """
+        Updates the inventory in place to match ``inventory``, usually a fresh copy of
+        the same inventory loaded again from its source.
+
+        Hosts, groups and defaults are compared and only the elements that changed are
+        modified; hosts and groups defined in both inventories are kept, so hosts that
+        didn't change keep their open connections. Connections of hosts that were
+        removed are closed, as are the connections whose parameters changed (i.e. because
+        the ``hostname`` or the password inherited from a group changed). New hosts are
+        added at the end.
+
+        Arguments:
+            inventory: inventory to copy the changes from, its elements may be moved
+                into this inventory so it shouldn't be used afterwards
+
+        Returns:
+            the names of the elements that were added, removed or updated
+        """
+        changes = InventoryChanges()
+        hosts = self.hosts
+
+        # only hosts already built can have connections (see LazyHosts)
+        connected = {
+            name: {c: host.get_connection_parameters(c).dict() for c in host.connections}
+            for name, host in dict.items(hosts)
+            if host.connections
+        }
+
+        if self.defaults.dict() != inventory.defaults.dict():
+            _patch_element(self.defaults, inventory.defaults)
+            changes.defaults_updated = True
+
+        self._patch_groups(inventory.groups, changes)
+        self._patch_hosts(inventory.hosts, changes)
+
+        for name, parameters in connected.items():
+            if name not in hosts:
+                continue
+            connected_host = hosts[name]
+            for connection, params in parameters.items():
+                if connected_host.get_connection_parameters(connection).dict() != params:
+                    connected_host.close_connection(connection)
+
+        return changes
+
+    def _patch_groups(self, groups: Groups, changes: InventoryChanges) -> None:
+        # groups are added first so the hierarchy can be rebuilt with them
+        for name, group in groups.items():
+            if name not in self.groups:
+                group.defaults = self.defaults
+                self.groups[name] = group
+                changes.groups_added.append(name)
+        for name, group in groups.items():
+            current = self.groups[name]
+            if current is group:
+                _patch_parents(group, group, self.groups)
+            elif current.dict() != group.dict():
+                _patch_element(current, group)
+                _patch_parents(current, group, self.groups)
+                changes.groups_updated.append(name)
+        for name in [n for n in self.groups if n not in groups]:
+            del self.groups[name]
+            changes.groups_removed.append(name)
+
+    def _patch_hosts(self, hosts: Hosts, changes: InventoryChanges) -> None:
+        for name, host in hosts._scan():
+            if name not in self.hosts:
+                host.defaults = self.defaults
+                _patch_parents(host, host, self.groups)
+                self.hosts[name] = host
+                changes.hosts_added.append(name)
+                continue
+            current = self.hosts._peek(name)
+            if current.dict() != host.dict():
+                _patch_element(current, host)
+                _patch_parents(current, host, self.groups)
+                self.hosts._keep(name, current)
+                changes.hosts_updated.append(name)
+        for name in [n for n in self.hosts if n not in hosts]:
+            self.hosts.pop(name).close_connections()
+            changes.hosts_removed.append(name)
+
     def children_of_group(self, group: str | Group) -> set[Host]:
         """
         Returns set of hosts that belongs to a group including those that belong
         indirectly via inheritance
         """
-        hosts: set[Host] = set()
-        for host in self.hosts.values():
-            if host.has_parent_group(group):
-                hosts.add(host)
-        return hosts
+        if not isinstance(self.hosts, Hosts):
+            return {host for host in self.hosts.values() if host.has_parent_group(group)}
+
+        index = self._group_index
+        if index is None:
+            index = self._group_index = _GroupIndex()
+        return {self.hosts[name] for name in index.members(self.hosts, group)}
 
     @classmethod
     def schema(cls) -> dict[str, Any]:
@@ -640,3 +1872,99 @@ class Inventory:
             "groups": {n: g.dict() for n, g in self.groups.items()},
             "defaults": self.defaults.dict(),
         }
+
+
+class InventoryView(Inventory):
+    """
+    Filtered inventory returned by :meth:`Inventory.filter` and :meth:`Inventory.view`.
+
+    :meth:`Inventory.filter` selects the matching hosts when it's called. A view
+    returned by :meth:`Inventory.view` instead keeps a reference to the hosts of the
+    inventory it was created from along with the filter. Filtering such a view again
+    composes both filters, so chaining filters doesn't create intermediate copies.
+
+    Iterating over an unselected view yields the matching hosts lazily. The selection
+    is only materialized the first time :attr:`hosts` is accessed (which is what most
+    operations, like :meth:`nornir.core.Nornir.run`, do); from then on the view behaves
+    like a regular inventory. This means the filter is evaluated when the view is
+    first used, so hosts changed in between are selected based on their new values and
+    exceptions raised by the filter are raised then.
+
+    Filters are evaluated with a :class:`nornir.core.filter.FilterPlan`, use
+    :meth:`explain` to see how.
+    """
+
+    __slots__ = ("_base", "_filters", "_plan", "_selected", "_source")
+
+    _base: Hosts
+    _filters: tuple[tuple[FilterObj | None, dict[str, Any]], ...]
+    _source: Inventory
+
+    def __init__(
+        self,
+        inventory: Inventory,
+        filter_func: FilterObj | None,
+        filter_kwargs: dict[str, Any],
+    ) -> None:
+        step = (filter_func, filter_kwargs)
+        if isinstance(inventory, InventoryView) and inventory._selected is None:
+            self._source = inventory._source
+            self._base = inventory._base
+            self._filters = (*inventory._filters, step)
+        else:
+            self._source = inventory
+            self._base = inventory.hosts
+            self._filters = (step,)
+        self._selected: Hosts | None = None
+        self._plan: FilterPlan | None = None
+        self.groups = inventory.groups
+        self.defaults = inventory.defaults
+        self._group_index = None
+        self._indexes = {key: _HostIndex(key) for key in inventory._indexes}
+
+    @property
+    def hosts(self) -> Hosts:
+        """Hosts matching the filter, selected the first time they are accessed"""
+        selected = self._selected
+        if selected is None:
+            selected = self.materialize()
+        return selected
+
+    @hosts.setter
+    def hosts(self, hosts: Hosts) -> None:
+        self._selected = hosts
+        self._source = self
+        self._base = hosts
+        self._filters = ()
+
+    def materialize(self) -> Hosts:
+        """
+        Selects the hosts that match the filter and stores them so the filter is not
+        evaluated again. Returns the selected hosts.
+        """
+        self.hosts = Hosts(self._iter_selected())
+        return self.hosts
+
+    def _iter_selected(self) -> Iterator[tuple[str, Host]]:
+        # imported here as nornir.core.filter depends on this module
+        from nornir.core.filter import FilterPlan  # noqa: PLC0415
+
+        self._plan = FilterPlan(self._filters)
+        return self._plan.execute(self._source, self._base)
+
+    def explain(self) -> str:
+        """
+        Returns how the filter was evaluated, see :meth:`nornir.core.filter.FilterPlan.explain`.
+        If the view wasn't used yet it returns the plan that would be used.
+        """
+        if self._plan is None:
+            from nornir.core.filter import FilterPlan  # noqa: PLC0415
+
+            return FilterPlan(self._filters).explain()
+        return self._plan.explain()
+
+    def __iter__(self) -> Iterator[Host]:
+        """Yields the hosts matching the filter without materializing the selection"""
+        if self._selected is not None:
+            return iter(self._selected.values())
+        return (host for _, host in self._iter_selected())
@@ -22,5 +22,9 @@ class RunnerPlugin(Protocol):
         """
         raise NotImplementedError("needs to be implemented by the plugin")
 
+    # Runners can optionally implement ``run_iter(task, hosts) -> Iterator[MultiResult]``,
+    # yielding the results of each host as soon as it completes the task, which is used
+    # by :meth:`nornir.core.Nornir.run_iter`
+
 
 RunnersPluginRegister: PluginRegister[type[RunnerPlugin]] = PluginRegister(RUNNERS_PLUGIN_PATH)
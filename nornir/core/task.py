@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import inspect
 import logging
 import traceback
 from typing import TYPE_CHECKING, Any, cast
@@ -82,6 +84,9 @@ class Task:
         """
         Run the task for the given host.
 
+        If ``task`` is a coroutine function it's run to completion on a new event loop,
+        use :meth:`start_async` to run it on the current one instead.
+
         Arguments:
             host (:obj:`nornir.core.inventory.Host`): Host we are operating with. Populated right
               before calling the ``task``
@@ -91,37 +96,63 @@ class Task:
         Returns:
             host (:obj:`nornir.core.task.MultiResult`): Results of the task and its subtasks
         """
+        self._instance_started(host)
+        try:
+            logger.debug("Host %r: running task %r", self.host.name, self.name)
+            r = self.task(self, **self.params)
+            if inspect.iscoroutine(r):
+                r = asyncio.run(r)
+        except Exception as e:
+            r = self._failed(e)
+        return self._instance_completed(r)
+
+    async def start_async(self, host: Host) -> MultiResult:
+        """
+        Same as :meth:`start` but awaits the result of the ``task`` if it's a coroutine
+        function, so it runs on the current event loop.
+
+        Arguments:
+            host (:obj:`nornir.core.inventory.Host`): Host we are operating with. Populated right
+              before calling the ``task``
+
+        Returns:
+            host (:obj:`nornir.core.task.MultiResult`): Results of the task and its subtasks
+        """
+        self._instance_started(host)
+        try:
+            logger.debug("Host %r: running task %r", self.host.name, self.name)
+            r = self.task(self, **self.params)
+            if inspect.isawaitable(r):
+                r = await r
+        except Exception as e:
+            r = self._failed(e)
+        return self._instance_completed(r)
+
+    def _instance_started(self, host: Host) -> None:
         self.host = host
 
         if self.parent_task is not None:
             self.processors.subtask_instance_started(self, host)
         else:
             self.processors.task_instance_started(self, host)
-        try:
-            logger.debug("Host %r: running task %r", self.host.name, self.name)
-            r = self.task(self, **self.params)
-            if not isinstance(r, Result):
-                r = Result(host=host, result=r)
-
-        except NornirSubTaskError as e:
-            tb = traceback.format_exc()
-            logger.error(
-                "Host %r: task %r failed with traceback:\n%s",
-                self.host.name,
-                self.name,
-                tb,
-            )
-            r = Result(host, exception=e, result=str(e), failed=True)
 
-        except Exception as e:
-            tb = traceback.format_exc()
-            logger.error(
-                "Host %r: task %r failed with traceback:\n%s",
-                self.host.name,
-                self.name,
-                tb,
-            )
-            r = Result(host, exception=e, result=tb, failed=True)
+    def _failed(self, e: Exception) -> Result:
+        """Builds the result of a task that raised ``e``, must be called while handling it"""
+        tb = traceback.format_exc()
+        logger.error(
+            "Host %r: task %r failed with traceback:\n%s",
+            self.host.name,
+            self.name,
+            tb,
+        )
+        if isinstance(e, NornirSubTaskError):
+            return Result(self.host, exception=e, result=str(e), failed=True)
+        return Result(self.host, exception=e, result=tb, failed=True)
+
+    def _instance_completed(self, r: Any) -> MultiResult:
+        host = self.host
+        if not isinstance(r, Result):
+            r = Result(host=host, result=r)
 
         r.name = self.name
 
@@ -151,6 +182,22 @@ class Task:
 
         This method will ensure the subtask is run only for the host in the current thread.
         """
+        run_task = self._subtask(task, kwargs)
+        return self._subtask_completed(run_task, run_task.start(self.host))
+
+    async def run_async(self, task: Callable[..., Any], **kwargs: Any) -> MultiResult:
+        """
+        Same as :meth:`run` but for coroutine tasks, the subtask runs on the current
+        event loop. For instance:
+
+            async def grouped_tasks(task):
+                await task.run_async(my_first_async_task)
+                await task.run_async(my_second_async_task)
+        """
+        run_task = self._subtask(task, kwargs)
+        return self._subtask_completed(run_task, await run_task.start_async(self.host))
+
+    def _subtask(self, task: Callable[..., Any], kwargs: dict[str, Any]) -> Task:
         if not self.host:
             msg = (
                 "You have to call this after setting host and nornir attributes. ",
@@ -161,7 +208,7 @@ class Task:
         if "severity_level" not in kwargs:
             kwargs["severity_level"] = self.severity_level
 
-        run_task = Task(
+        return Task(
             task,
             self.nornir,
             global_dry_run=self.global_dry_run,
@@ -169,7 +216,8 @@ class Task:
             parent_task=self,
             **kwargs,
         )
-        r = run_task.start(self.host)
+
+    def _subtask_completed(self, run_task: Task, r: MultiResult) -> MultiResult:
         self.results.append(r[0] if len(r) == 1 else cast("Result", r))
 
         if r.failed:
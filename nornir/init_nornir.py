@@ -1,10 +1,20 @@
 from __future__ import annotations
 
-from typing import Any
+import functools
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, cast
 
 from nornir.core import Nornir
 from nornir.core.configuration import Config
-from nornir.core.inventory import Inventory
+from nornir.core.inventory import (
+    BatchTransformFunction,
+    Host,
+    Inventory,
+    LazyHosts,
+    TransformFunction,
+    _patch_element,
+    _patch_parents,
+)
 from nornir.core.plugins.connections import ConnectionPluginRegister
 from nornir.core.plugins.inventory import (
     InventoryPluginRegister,
@@ -14,6 +24,77 @@ from nornir.core.plugins.runners import RunnerPlugin, RunnersPluginRegister
 from nornir.core.state import GlobalState
 
 
+def _transform_hosts(
+    function: TransformFunction | BatchTransformFunction,
+    options: dict[str, Any],
+    hosts: list[Host],
+    *,
+    batch: bool,
+) -> list[Host]:
+    if batch:
+        cast("BatchTransformFunction", function)(hosts, **options)
+    else:
+        for host in hosts:
+            cast("TransformFunction", function)(host, **options)
+    return hosts
+
+
+def _chunks(hosts: list[Host], count: int) -> list[list[Host]]:
+    size = max(1, -(-len(hosts) // count))
+    return [hosts[i : i + size] for i in range(0, len(hosts), size)]
+
+
+def transform_inventory(inv: Inventory, config: Config) -> None:
+    """
+    Applies the transform function in the configuration to the hosts of ``inv``.
+
+    With ``transform_function_workers`` greater than one the hosts are transformed
+    concurrently by that many threads or processes, depending on
+    ``transform_function_executor``. Processes work on copies of the hosts, the
+    changes they make are copied back once they are done.
+
+    With ``transform_function_batch`` the function gets a list of hosts instead of
+    one host at a time, either all of them or, with several workers, a slice per
+    worker. Hosts of a :class:`nornir.core.inventory.LazyHosts` are transformed one
+    by one when they are built, unless the function takes a batch of hosts, in which
+    case they are all built right away.
+    """
+    TransformFunctionRegister.auto_register()
+    function = TransformFunctionRegister.get_plugin(config.inventory.transform_function)
+    options = config.inventory.transform_function_options or {}
+    batch = config.inventory.transform_function_batch
+    workers = config.inventory.transform_function_workers
+    executor = config.inventory.transform_function_executor
+    if executor not in ("thread", "process"):
+        raise ValueError(
+            f"transform_function_executor must be 'thread' or 'process', got {executor!r}"
+        )
+
+    if isinstance(inv.hosts, LazyHosts) and not batch:
+        # hosts that aren't built yet are transformed when they are
+        inv.hosts.defer(functools.partial(function, **options))
+        return
+
+    hosts = list(inv.hosts.values())
+    if workers <= 1:
+        _transform_hosts(function, options, hosts, batch=batch)
+    elif executor == "thread":
+        with ThreadPoolExecutor(workers) as pool:
+            if batch:
+                transform = functools.partial(_transform_hosts, function, options, batch=True)
+                list(pool.map(transform, _chunks(hosts, workers)))
+            else:
+                list(pool.map(functools.partial(function, **options), hosts))
+    else:
+        chunks = _chunks(hosts, workers)
+        with ProcessPoolExecutor(workers) as pool:
+            transform = functools.partial(_transform_hosts, function, options, batch=batch)
+            for chunk, transformed in zip(chunks, pool.map(transform, chunks), strict=True):
+                for host, copy in zip(chunk, transformed, strict=True):
+                    _patch_element(host, copy)
+                    _patch_parents(host, copy, inv.groups)
+
+
 def load_inventory(
     config: Config,
 ) -> Inventory:
@@ -22,12 +103,7 @@ def load_inventory(
     inv = inventory_plugin(**config.inventory.options).load()
 
     if config.inventory.transform_function:
-        TransformFunctionRegister.auto_register()
-        transform_function = TransformFunctionRegister.get_plugin(
-            config.inventory.transform_function
-        )
-        for h in inv.hosts.values():
-            transform_function(h, **(config.inventory.transform_function_options or {}))
+        transform_inventory(inv, config)
 
     return inv
 
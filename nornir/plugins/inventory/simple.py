@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import functools
+import hashlib
 import logging
+import os
 import pathlib
-from typing import Any
+import pickle  # noqa: S403
+import sys
+from typing import TYPE_CHECKING, Any, NoReturn
 
 import ruamel.yaml
 
+import nornir
 from nornir.core.inventory import (
     ConnectionOptions,
     Defaults,
@@ -15,11 +21,113 @@ from nornir.core.inventory import (
     HostOrGroup,
     Hosts,
     Inventory,
+    LazyHosts,
     ParentGroups,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
 logger = logging.getLogger(__name__)
 
+# bump when the layout of the snapshot or of the inventory objects changes
+_SNAPSHOT_VERSION = 3
+
+
+class _FrozenDict(dict[str, Any]):
+    """
+    A dict shared by several inventory elements, modifying it in place isn't allowed.
+
+    This is deliberately read-only rather than copy-on-write: the same copy is held by
+    many parents and can't tell which of them a write comes through, so it couldn't
+    replace itself with a private copy in the right one. Failing loudly is preferred
+    over a write silently leaking into every element sharing the value.
+    """
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError(
+            "this value is shared by several hosts and can't be modified in place, "
+            "assign a modified copy instead"
+        )
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (self.__class__, (dict(self),))
+
+
+class _FrozenList(list[Any]):
+    """A list shared by several inventory elements, read-only like :class:`_FrozenDict`"""
+
+    _readonly = _FrozenDict._readonly
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = clear = extend = insert = pop = remove = reverse = sort = _readonly
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (self.__class__, (list(self),))
+
+
+class _Interner:
+    """
+    Replaces equal values with a single shared copy. Strings are interned and dicts and
+    lists are frozen so modifying the copy of one host doesn't modify the rest.
+    ``saved`` accumulates the size of the objects that were replaced
+    """
+
+    def __init__(self) -> None:
+        self.pool: dict[Hashable, Any] = {}
+        self.saved = 0
+
+    def __call__(self, value: Any) -> Any:
+        shared: Any
+        key: Hashable
+        if isinstance(value, str):
+            shared = sys.intern(value)
+            if shared is not value:
+                self.saved += sys.getsizeof(value)
+            return shared
+        if isinstance(value, dict):
+            shared = _FrozenDict({self(k): self(v) for k, v in value.items()})
+            # values are already shared so they can be compared by identity
+            key = (dict, tuple((k, id(v)) for k, v in shared.items()))
+        elif isinstance(value, list):
+            shared = _FrozenList(self(v) for v in value)
+            key = (list, tuple(id(v) for v in shared))
+        elif isinstance(value, float):
+            # -0.0 equals 0.0 and nan doesn't equal itself, the representation tells
+            # them apart
+            shared = value
+            key = (float, value.hex())
+        elif isinstance(value, int):
+            shared = value
+            key = (type(value), value)
+        else:
+            return value
+
+        pooled = self.pool.setdefault(key, shared)
+        if pooled is not shared:
+            self.saved += sys.getsizeof(value)
+        return pooled
+
+    def record(self, record: dict[str, Any]) -> dict[str, Any]:
+        """
+        Interns the values of a host or group definition, ``data`` is copied so the
+        element can still add or replace its own keys
+        """
+        interned = {}
+        for k, v in record.items():
+            if k == "data" and isinstance(v, dict):
+                interned[k] = {self(dk): self(dv) for dk, dv in v.items()}
+            else:
+                interned[k] = self(v)
+        return interned
+
+    def records(self, records: dict[str, Any]) -> dict[str, Any]:
+        """Interns the definitions of several hosts or groups, indexed by name"""
+        return {self(name): self.record(record) for name, record in records.items()}
+
 
 def _get_connection_options(data: dict[str, Any]) -> dict[str, ConnectionOptions]:
     cp = {}
@@ -64,6 +172,12 @@ def _get_inventory_element(
     )
 
 
+def _build_host(name: str, data: dict[str, Any], groups: Groups, defaults: Defaults) -> Host:
+    # resolve the groups before building the host, which then adopts the list
+    parents = ParentGroups([groups[g] for g in data.get("groups") or ()])
+    return _get_inventory_element(Host, {**data, "groups": parents}, name, defaults)
+
+
 class SimpleInventory:
     def __init__(
         self,
@@ -71,6 +185,9 @@ class SimpleInventory:
         group_file: str = "groups.yaml",
         defaults_file: str = "defaults.yaml",
         encoding: str = "utf-8",
+        snapshot_file: str | None = None,
+        lazy: bool = False,
+        intern: bool = False,
     ) -> None:
         """
         SimpleInventory is an inventory plugin that loads data from YAML files.
@@ -84,50 +201,134 @@ class SimpleInventory:
           defaults_file: path to file with defaults definition.
                 If it doesn't exist it will be skipped
           encoding: Encoding used to save inventory files. Defaults to utf-8
+          snapshot_file: path to a file where to cache the parsed inventory. If set,
+                the inventory is stored there in binary form the first time it's loaded
+                and later loads read it from there instead of parsing the YAML files,
+                as long as the size, modification time and contents of the YAML files
+                didn't change. The snapshot is a pickle so make sure only trusted users
+                can write to it
+          lazy: if set, hosts are only built when they are used or selected by a
+                filter, see :class:`nornir.core.inventory.LazyHosts`
+          intern: if set, equal values found in the definitions of different hosts
+                and groups are stored only once. Nested dicts and lists under ``data``
+                and ``connection_options`` are then shared and read-only, modifying
+                them in place raises ``TypeError``; assign a modified copy instead
+                (i.e. ``host["tags"] = [*host["tags"], "new"]``). Top level keys of
+                ``data`` can still be set as usual
         """
 
         self.host_file = pathlib.Path(host_file).expanduser()
         self.group_file = pathlib.Path(group_file).expanduser()
         self.defaults_file = pathlib.Path(defaults_file).expanduser()
         self.encoding = encoding
+        self.snapshot_file = pathlib.Path(snapshot_file).expanduser() if snapshot_file else None
+        self.lazy = lazy
+        self.intern = intern
 
     def load(self) -> Inventory:
+        if self.snapshot_file is None:
+            return self._load_yaml()
+
+        key = self._snapshot_key()
+        inventory = self._load_snapshot(self.snapshot_file, key)
+        if inventory is None:
+            inventory = self._load_yaml()
+            self._save_snapshot(self.snapshot_file, key, inventory)
+        return inventory
+
+    def _snapshot_key(self) -> dict[str, Any]:
+        """Identifies the contents of the inventory files the snapshot was built from"""
+        files: dict[str, tuple[int, int, str] | None] = {}
+        for path in (self.host_file, self.group_file, self.defaults_file):
+            try:
+                stat = path.stat()
+                digest = hashlib.sha256(path.read_bytes()).hexdigest()
+            except FileNotFoundError:
+                files[str(path.resolve())] = None
+                continue
+            files[str(path.resolve())] = (stat.st_size, stat.st_mtime_ns, digest)
+        return {
+            "version": _SNAPSHOT_VERSION,
+            # the pickled objects are only understood by the nornir and python they
+            # were created with
+            "nornir": nornir.__version__,
+            "python": sys.version_info[:2],
+            "encoding": self.encoding,
+            "lazy": self.lazy,
+            "intern": self.intern,
+            "files": files,
+        }
+
+    @staticmethod
+    def _load_snapshot(path: pathlib.Path, key: dict[str, Any]) -> Inventory | None:
+        if not path.exists():
+            return None
+        try:
+            with open(path, "rb") as f:
+                if pickle.load(f) != key:  # noqa: S301
+                    logger.debug("inventory snapshot '%s' is outdated", path)
+                    return None
+                inventory = pickle.load(f)  # noqa: S301
+        except Exception:
+            logger.warning(
+                "couldn't read inventory snapshot '%s', ignoring it", path, exc_info=True
+            )
+            return None
+        if not isinstance(inventory, Inventory):
+            logger.warning("'%s' doesn't contain an inventory snapshot, ignoring it", path)
+            return None
+        logger.debug("loaded inventory from snapshot '%s'", path)
+        return inventory
+
+    @staticmethod
+    def _save_snapshot(path: pathlib.Path, key: dict[str, Any], inventory: Inventory) -> None:
+        # the key goes first so outdated snapshots are detected without reading the rest
+        tmp = path.with_name("{}.{}.tmp".format(path.name, os.getpid()))
+        try:
+            with open(tmp, "wb") as f:
+                pickle.dump(key, f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(inventory, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp.replace(path)
+        except OSError:
+            logger.warning("couldn't write inventory snapshot '%s'", path, exc_info=True)
+            tmp.unlink(missing_ok=True)
+
+    def _read_yaml(
+        self,
+        yml: ruamel.yaml.YAML,
+        path: pathlib.Path,
+        what: str,
+        intern: Callable[[dict[str, Any]], dict[str, Any]] | None,
+    ) -> Any:
+        with open(path, "r", encoding=self.encoding) as f:
+            data = yml.load(f) or {}
+        if data == {}:
+            logger.warning(
+                "'%s' is empty or contains only comments, defaulting to empty %s.", path, what
+            )
+        return intern(data) if intern else data
+
+    def _load_yaml(self) -> Inventory:
         yml = ruamel.yaml.YAML(typ="safe")
+        interner = _Interner() if self.intern else None
 
         if self.defaults_file.exists():
-            with open(self.defaults_file, "r", encoding=self.encoding) as f:
-                defaults_dict = yml.load(f) or {}
-            if defaults_dict == {}:
-                logger.warning(
-                    "'%s' is empty or contains only comments, defaulting to empty defaults.",
-                    self.defaults_file,
-                )
+            defaults_dict = self._read_yaml(
+                yml, self.defaults_file, "defaults", interner.record if interner else None
+            )
             defaults = _get_defaults(defaults_dict)
         else:
             defaults = Defaults()
 
-        hosts = Hosts()
-        with open(self.host_file, "r", encoding=self.encoding) as f:
-            hosts_dict = yml.load(f) or {}
-        if hosts_dict == {}:
-            logger.warning(
-                "'%s' is empty or contains only comments, defaulting to empty hosts inventory.",
-                self.host_file,
-            )
-
-        for n, h in hosts_dict.items():
-            hosts[n] = _get_inventory_element(Host, h, n, defaults)
+        hosts_dict = self._read_yaml(
+            yml, self.host_file, "hosts inventory", interner.records if interner else None
+        )
 
         groups = Groups()
         if self.group_file.exists():
-            with open(self.group_file, "r", encoding=self.encoding) as f:
-                groups_dict = yml.load(f) or {}
-            if groups_dict == {}:
-                logger.warning(
-                    "'%s' is empty or contains only comments, "
-                    "defaulting to empty groups inventory.",
-                    self.group_file,
-                )
+            groups_dict = self._read_yaml(
+                yml, self.group_file, "groups inventory", interner.records if interner else None
+            )
 
             for n, g in groups_dict.items():
                 groups[n] = _get_inventory_element(Group, g, n, defaults)
@@ -135,7 +336,16 @@ class SimpleInventory:
             for g in groups.values():
                 g.groups = ParentGroups([groups[g] for g in g.groups])
 
-        for h in hosts.values():
-            h.groups = ParentGroups([groups[g] for g in h.groups])
+        hosts: Hosts
+        if self.lazy:
+            factory = functools.partial(_build_host, groups=groups, defaults=defaults)
+            hosts = LazyHosts(hosts_dict, factory)
+        else:
+            hosts = Hosts()
+            for n, h in hosts_dict.items():
+                hosts[n] = _build_host(n, h, groups, defaults)
+
+        if interner:
+            logger.info("interning the inventory saved about %d bytes", interner.saved)
 
         return Inventory(hosts=hosts, groups=groups, defaults=defaults)
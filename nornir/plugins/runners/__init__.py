@@ -1,9 +1,41 @@
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import contextlib
+import heapq
+import inspect
+import itertools
+import logging
+import multiprocessing
+import pickle  # noqa: S403
+import threading
+import time
+import traceback
+import weakref
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import TYPE_CHECKING, Any
 
+from nornir.core.exceptions import NornirSubTaskError, RemoteTaskError
 from nornir.core.inventory import Host
-from nornir.core.task import AggregatedResult, Task
+from nornir.core.processor import Processors
+from nornir.core.task import AggregatedResult, MultiResult, Result, Task
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Hashable, Iterable, Iterator, Mapping
+
+    LimitKey = str | Callable[[Host], Hashable]
+
+logger = logging.getLogger(__name__)
+
+# task and hosts of the run a ProcessPoolRunner worker process was started for
+_worker_state: tuple[Task, dict[str, Host]] | None = None
 
 
 class SerialRunner:
@@ -20,27 +52,773 @@ class SerialRunner:
             result[host.name] = task.copy().start(host)
         return result
 
+    def run_iter(self, task: Task, hosts: list[Host]) -> Iterator[MultiResult]:
+        for host in hosts:
+            yield task.copy().start(host)
+
+
+def _key_values(key: LimitKey, host: Host) -> Iterable[Hashable]:
+    if callable(key):
+        return [key(host)]
+    if key == "groups":
+        return sorted(g.name for g in host.extended_groups())
+    return [host.get(key)]
+
+
+class ConcurrencyLimits:
+    """
+    Caps how many hosts sharing a key run the task at the same time, on top of the
+    number of workers of the runner, i.e. to keep a high parallelism while running at
+    most a few hosts of each site behind a slow link.
+
+    ``limits`` maps keys to limits. Keys are either:
+
+        * the name of an attribute or data of the host, resolved with
+          :meth:`nornir.core.inventory.Host.get`, i.e. ``"platform"`` or ``"site"``
+        * ``"groups"``, the groups the host belongs to, directly or through other groups
+        * a function returning the key of a host
+
+    Limits are either a number, applied to each value of the key separately, or a dict
+    with the limits of some values, leaving the rest unlimited. Hosts whose key is
+    ``None`` aren't limited. For example::
+
+        ConcurrencyLimits({
+            "platform": {"ios": 10, "junos": 5},  # 10 ios and 5 junos hosts at a time
+            "groups": {"wan_sites": 2},  # 2 hosts of the group wan_sites at a time
+            "site": 4,  # 4 hosts of each site at a time
+        })
+
+    Limits apply to each run separately.
+    """
+
+    def __init__(self, limits: Mapping[LimitKey, int | Mapping[Hashable, int]]) -> None:
+        for key, limit in limits.items():
+            values = [limit] if isinstance(limit, int) else limit.values()
+            if any(v < 1 for v in values):
+                raise ValueError("limits of {!r} have to be at least 1".format(key))
+        self.limits = dict(limits)
+
+    def slots(self, host: Host) -> list[tuple[Hashable, int]]:
+        """
+        Returns the slots the host takes while it runs the task and how many hosts fit
+        in each of them, always in the same order for all hosts
+        """
+        slots: list[tuple[Hashable, int]] = []
+        for i, (key, limit) in enumerate(self.limits.items()):
+            for value in _key_values(key, host):
+                size = limit if isinstance(limit, int) else limit.get(value)
+                if value is not None and size is not None:
+                    slots.append(((i, value), size))
+        return slots
+
+
+def _concurrency_limits(
+    limits: ConcurrencyLimits | Mapping[LimitKey, Any] | None,
+) -> ConcurrencyLimits | None:
+    # limits set in the configuration come as a dict
+    if limits is None or isinstance(limits, ConcurrencyLimits):
+        return limits
+    return ConcurrencyLimits(limits)
+
+
+class RateLimit:
+    """
+    Limits how many hosts start the task per second with a token bucket. Each host takes
+    a token to start and the bucket gets ``rate`` tokens per second up to ``burst``, so
+    after a quiet period up to ``burst`` hosts can start at once.
+
+    With a ``key``, in the format of the keys of :class:`ConcurrencyLimits`, each value
+    of the key gets its own bucket and hosts whose key is ``None`` aren't limited. For
+    example::
+
+        RateLimit(5, burst=20)  # 5 hosts per second, 20 at once after being idle
+        RateLimit(1, key="site")  # 1 host of each site per second
+
+    Buckets are kept across runs, so consecutive runs don't start with full buckets.
+
+    Arguments:
+        rate: tokens added to each bucket per second
+        burst: maximum number of tokens in each bucket
+        key: key of the hosts to keep a bucket for each of its values
+    """
+
+    def __init__(self, rate: float, burst: int = 1, key: LimitKey | None = None) -> None:
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate has to be positive and burst at least 1")
+        self.rate = rate
+        self.burst = burst
+        self.key = key
+        self._buckets: dict[Hashable, tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def buckets(self, host: Host) -> list[Hashable]:
+        """Returns the buckets the host takes a token from to start"""
+        if self.key is None:
+            return [None]
+        return [v for v in _key_values(self.key, host) if v is not None]
+
+    def try_acquire(self, host: Host) -> tuple[Hashable, float] | None:
+        """
+        Takes a token from each bucket of the host. If a bucket is empty no token is
+        taken and the bucket is returned along with the seconds until it has a token
+        """
+        buckets = self.buckets(host)
+        now = time.monotonic()
+        with self._lock:
+            tokens = [self._tokens(b, now) for b in buckets]
+            for bucket, t in zip(buckets, tokens, strict=True):
+                if t < 1:
+                    return bucket, (1 - t) / self.rate
+            for bucket, t in zip(buckets, tokens, strict=True):
+                self._buckets[bucket] = (t - 1, now)
+        return None
+
+    def delay(self, bucket: Hashable) -> float:
+        """Returns the seconds until the bucket has a token"""
+        with self._lock:
+            tokens = self._tokens(bucket, time.monotonic())
+        return max(0.0, (1 - tokens) / self.rate)
+
+    def _tokens(self, bucket: Hashable, now: float) -> float:
+        tokens, updated = self._buckets.get(bucket, (self.burst, now))
+        return min(float(self.burst), tokens + (now - updated) * self.rate)
+
+
+def _rate_limit(rate_limit: RateLimit | Mapping[str, Any] | None) -> RateLimit | None:
+    # rate limits set in the configuration come as a dict
+    if rate_limit is None or isinstance(rate_limit, RateLimit):
+        return rate_limit
+    return RateLimit(**rate_limit)
+
+
+class _HostQueue:
+    """
+    Hands out the hosts in order, holding back the ones exceeding the concurrency limits
+    until a host taking the same slot is released, and the ones exceeding the rate limit
+    until their bucket has a token again
+    """
+
+    def __init__(
+        self,
+        hosts: list[Host],
+        limits: ConcurrencyLimits | None,
+        rate_limit: RateLimit | None,
+    ) -> None:
+        self._remaining = enumerate(hosts)
+        self._limits = limits
+        self._rate_limit = rate_limit
+        self._semaphores: dict[Hashable, threading.BoundedSemaphore] = {}
+        self._ready: deque[tuple[int, Host]] = deque()
+        self._waiting: dict[Hashable, deque[tuple[int, Host]]] = {}
+        self._taken: dict[int, list[Hashable]] = {}
+        # when the buckets with hosts waiting on them have a token again
+        self._wakeups: list[tuple[float, int, Hashable]] = []
+        self._scheduled: set[Hashable] = set()
+        self._sequence = itertools.count()
+
+    def next(self) -> tuple[int, Host] | None:
+        """Returns the next host that can start and its position, if any"""
+        if self._limits is None and self._rate_limit is None:
+            return next(self._remaining, None)
+        while True:
+            self._wake()
+            if not self._ready:
+                break
+            i, host = self._ready.popleft()
+            if self._acquire(i, host):
+                return i, host
+        for i, host in self._remaining:
+            if self._acquire(i, host):
+                return i, host
+            if self._waiting.get(("rate", None)):
+                # the bucket shared by all hosts is empty, no point in looking further
+                return None
+        return None
+
+    def timeout(self) -> float | None:
+        """Returns the seconds until a host held back by the rate limit can be retried"""
+        if not self._wakeups:
+            return None
+        return max(0.0, self._wakeups[0][0] - time.monotonic())
+
+    def release(self, i: int) -> None:
+        """Frees the slots taken by the host in position ``i``"""
+        for slot in self._taken.pop(i, ()):
+            self._release(slot)
+
+    def _acquire(self, i: int, host: Host) -> bool:
+        try:
+            return self._try_acquire(i, host)
+        finally:
+            if self._rate_limit is not None:
+                for bucket in self._rate_limit.buckets(host):
+                    self._schedule(("rate", bucket))
+
+    def _try_acquire(self, i: int, host: Host) -> bool:
+        taken: list[Hashable] = []
+        for slot, size in self._limits.slots(host) if self._limits is not None else ():
+            semaphore = self._semaphores.get(slot)
+            if semaphore is None:
+                semaphore = self._semaphores[slot] = threading.BoundedSemaphore(size)
+            if not semaphore.acquire(blocking=False):
+                self._hold(i, host, slot, taken)
+                return False
+            taken.append(slot)
+        if self._rate_limit is not None:
+            empty = self._rate_limit.try_acquire(host)
+            if empty is not None:
+                self._hold(i, host, ("rate", empty[0]), taken)
+                return False
+        self._taken[i] = taken
+        return True
+
+    def _hold(self, i: int, host: Host, slot: Hashable, taken: list[Hashable]) -> None:
+        for t in taken:
+            self._release(t)
+        self._waiting.setdefault(slot, deque()).append((i, host))
+
+    def _release(self, slot: Hashable) -> None:
+        self._semaphores[slot].release()
+        waiting = self._waiting.get(slot)
+        if waiting:
+            self._ready.append(waiting.popleft())
+
+    def _schedule(self, slot: tuple[str, Hashable]) -> None:
+        if self._rate_limit is None or slot in self._scheduled or not self._waiting.get(slot):
+            return
+        self._scheduled.add(slot)
+        wakeup = time.monotonic() + self._rate_limit.delay(slot[1])
+        heapq.heappush(self._wakeups, (wakeup, next(self._sequence), slot))
+
+    def _wake(self) -> None:
+        now = time.monotonic()
+        while self._wakeups and self._wakeups[0][0] <= now:
+            _, _, slot = heapq.heappop(self._wakeups)
+            self._scheduled.discard(slot)
+            waiting = self._waiting.get(slot)
+            if waiting:
+                self._ready.append(waiting.popleft())
+
 
 class ThreadedRunner:
     """
     ThreadedRunner runs the task over each host using threads
 
+    The threads are started the first time the runner is used and reused by later runs
+    until :meth:`close` is called, which :class:`nornir.core.Nornir` does when used as a
+    context manager, or the runner is garbage collected.
+
+    Hosts are handed to the threads as they become free, at most ``max_pending`` at a
+    time, so the memory used to keep track of the hosts in flight doesn't grow with the
+    number of hosts. Hosts exceeding the ``concurrency_limits`` are held back, without
+    taking a thread, until a host sharing their key completes, and hosts exceeding the
+    ``rate_limit`` until their bucket has a token again.
+
     Arguments:
         num_workers: number of threads to use
+        max_pending: maximum number of hosts submitted to the threads at a time,
+            defaults to twice ``num_workers``
+        concurrency_limits: limits of the hosts running at the same time per group,
+            platform, etc. See :class:`ConcurrencyLimits` for the format
+        rate_limit: limit of the hosts starting per second, either a :class:`RateLimit`
+            or a dict with its arguments
     """
 
-    def __init__(self, num_workers: int = 20) -> None:
+    def __init__(
+        self,
+        num_workers: int = 20,
+        max_pending: int | None = None,
+        concurrency_limits: ConcurrencyLimits | Mapping[LimitKey, Any] | None = None,
+        rate_limit: RateLimit | Mapping[str, Any] | None = None,
+    ) -> None:
         self.num_workers = num_workers
+        self.max_pending = max_pending or 2 * num_workers
+        self.concurrency_limits = _concurrency_limits(concurrency_limits)
+        self.rate_limit = _rate_limit(rate_limit)
+        self._pool: ThreadPoolExecutor | None = None
+        self._finalizer: weakref.finalize[..., Any] | None = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
 
     def run(self, task: Task, hosts: list[Host]) -> AggregatedResult:
+        completed = dict(self._execute(task, hosts))
         result = AggregatedResult(task.name)
-        futures = []
-        with ThreadPoolExecutor(self.num_workers) as pool:
+        for i in range(len(hosts)):
+            worker_result = completed.pop(i)
+            result[worker_result.host.name] = worker_result
+        return result
+
+    def run_iter(self, task: Task, hosts: list[Host]) -> Iterator[MultiResult]:
+        """Same as :meth:`run` but yields the results of each host as soon as it completes"""
+        for _, worker_result in self._execute(task, hosts):
+            yield worker_result
+
+    def _execute(self, task: Task, hosts: list[Host]) -> Iterator[tuple[int, MultiResult]]:
+        if getattr(self._local, "worker", False):
+            # a task running in the pool waiting on the pool could wait forever
+            with ThreadPoolExecutor(self.num_workers) as pool:
+                yield from self._submit(pool, task, hosts)
+            return
+        yield from self._submit(self._get_pool(), task, hosts)
+
+    def _submit(
+        self, pool: ThreadPoolExecutor, task: Task, hosts: list[Host]
+    ) -> Iterator[tuple[int, MultiResult]]:
+        """
+        Yields the position of each host in ``hosts`` and its results in the order they
+        complete, submitting the next host every time one completes
+        """
+        queue = _HostQueue(hosts, self.concurrency_limits, self.rate_limit)
+        pending: dict[Future[MultiResult], int] = {}
+
+        def fill() -> None:
+            while len(pending) < self.max_pending and (item := queue.next()) is not None:
+                i, host = item
+                pending[pool.submit(self._start, task, host)] = i
+
+        try:
+            fill()
+            while pending or queue.timeout() is not None:
+                if not pending:
+                    # every host left is waiting on the rate limit
+                    time.sleep(queue.timeout() or 0)
+                    fill()
+                    continue
+                done, _ = wait(pending, timeout=queue.timeout(), return_when=FIRST_COMPLETED)
+                if not done:
+                    fill()
+                for future in done:
+                    i = pending.pop(future)
+                    queue.release(i)
+                    fill()
+                    yield i, future.result()
+        finally:
+            # hosts that didn't start yet are skipped if the caller stops iterating
+            for future in pending:
+                future.cancel()
+
+    def _start(self, task: Task, host: Host) -> MultiResult:
+        return task.copy().start(host)
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                # the threads mustn't reference the runner so it can be collected when
+                # it's not closed, which then stops the threads
+                self._pool = ThreadPoolExecutor(
+                    self.num_workers,
+                    thread_name_prefix="nornir",
+                    initializer=_mark_worker,
+                    initargs=(self._local,),
+                )
+                self._finalizer = weakref.finalize(self, self._pool.shutdown, wait=False)
+            return self._pool
+
+    def close(self) -> None:
+        """Stops the threads, a later run starts them again"""
+        with self._lock:
+            pool, self._pool = self._pool, None
+            finalizer, self._finalizer = self._finalizer, None
+        if finalizer is not None:
+            finalizer.detach()
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+
+def _mark_worker(local: threading.local) -> None:
+    local.worker = True
+
+
+class AdaptiveDecision:
+    """
+    A change of the number of hosts :class:`AdaptiveRunner` runs at the same time
+    """
+
+    __slots__ = ("completed", "failure_rate", "latency", "limit", "previous", "reason")
+
+    def __init__(
+        self,
+        completed: int,
+        previous: int,
+        limit: int,
+        reason: str,
+        latency: float,
+        failure_rate: float,
+    ) -> None:
+        #: hosts completed in the run when the decision was taken
+        self.completed = completed
+        self.previous = previous
+        self.limit = limit
+        self.reason = reason
+        #: average latency of the recent hosts, in seconds
+        self.latency = latency
+        #: ratio of the recent hosts that failed
+        self.failure_rate = failure_rate
+
+    def __repr__(self) -> str:
+        return "{}({} -> {} after {} hosts, {}, latency={:.3f}s, failure_rate={:.2f})".format(
+            self.__class__.__name__,
+            self.previous,
+            self.limit,
+            self.completed,
+            self.reason,
+            self.latency,
+            self.failure_rate,
+        )
+
+
+class AdaptiveRunner(ThreadedRunner):
+    """
+    AdaptiveRunner runs the task over the hosts using threads like :class:`ThreadedRunner`
+    but adjusts how many hosts run at the same time, between ``min_workers`` and
+    ``max_workers``, as hosts complete. It follows an AIMD rule (additive increase,
+    multiplicative decrease), like TCP congestion control:
+
+        * while things go well the limit grows by ``increase`` for every ``limit`` hosts
+          that complete, that is, by ``increase`` every round of hosts
+        * when more than ``max_failure_rate`` of the last ``sample_size`` hosts failed, or
+          their average latency is over ``latency_tolerance`` times the baseline, the
+          limit is multiplied by ``decrease``. It isn't decreased again until the hosts
+          that were running by then complete
+
+    The baseline is the lowest average latency seen, slowly moving towards the current
+    one so the runner adapts if the network gets slower for good. The limit is kept
+    across runs and the decisions of the last run are in :attr:`decisions` and logged.
+    Note that :meth:`nornir.core.Nornir.close_connections` is a run too.
+
+    Arguments:
+        min_workers: minimum number of hosts to run at the same time
+        max_workers: maximum number of hosts to run at the same time, also the number of
+            threads used
+        initial_workers: number of hosts to run at the same time when starting, defaults
+            to ``min_workers``
+        increase: hosts added to the limit every round of hosts without problems
+        decrease: factor the limit is multiplied by when there are problems
+        latency_tolerance: how many times the baseline latency is considered a problem
+        min_latency: latency, in seconds, never considered a problem, so the jitter of
+            tasks that complete in a few milliseconds doesn't decrease the limit
+        max_failure_rate: ratio of failed hosts considered a problem
+        sample_size: number of recent hosts the latency and failure rate are computed over
+        concurrency_limits: same as in :class:`ThreadedRunner`
+        rate_limit: same as in :class:`ThreadedRunner`
+    """
+
+    def __init__(
+        self,
+        min_workers: int = 1,
+        max_workers: int = 100,
+        initial_workers: int | None = None,
+        *,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        latency_tolerance: float = 2.0,
+        min_latency: float = 0.01,
+        max_failure_rate: float = 0.1,
+        sample_size: int = 20,
+        concurrency_limits: ConcurrencyLimits | Mapping[LimitKey, Any] | None = None,
+        rate_limit: RateLimit | Mapping[str, Any] | None = None,
+    ) -> None:
+        initial_workers = initial_workers or min_workers
+        if not 1 <= min_workers <= initial_workers <= max_workers:
+            raise ValueError("min_workers <= initial_workers <= max_workers has to hold")
+        if not 0 < decrease < 1:
+            raise ValueError("decrease has to be between 0 and 1")
+        super().__init__(max_workers, initial_workers, concurrency_limits, rate_limit)
+        self.min_workers = min_workers
+        self.max_workers = max_workers
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_tolerance = latency_tolerance
+        self.min_latency = min_latency
+        self.max_failure_rate = max_failure_rate
+        self.sample_size = sample_size
+        self.decisions: list[AdaptiveDecision] = []
+        self._limit = float(initial_workers)
+        self._samples: deque[tuple[float, bool]] = deque(maxlen=sample_size)
+        self._baseline: float | None = None
+        self._completed = 0
+        self._cooldown = 0
+        self._state_lock = threading.Lock()
+
+    def _execute(self, task: Task, hosts: list[Host]) -> Iterator[tuple[int, MultiResult]]:
+        if not getattr(self._local, "worker", False):
+            with self._state_lock:
+                self.decisions = []
+                self._completed = 0
+        yield from super()._execute(task, hosts)
+
+    def _start(self, task: Task, host: Host) -> MultiResult:
+        started = time.monotonic()
+        result = super()._start(task, host)
+        self._observe(time.monotonic() - started, result.failed)
+        return result
+
+    def _observe(self, latency: float, failed: bool) -> None:
+        with self._state_lock:
+            self._completed += 1
+            self._cooldown -= 1
+            self._samples.append((latency, failed))
+            average = sum(sample[0] for sample in self._samples) / len(self._samples)
+            failure_rate = sum(sample[1] for sample in self._samples) / len(self._samples)
+            if self._baseline is None or average < self._baseline:
+                self._baseline = average
+            else:
+                self._baseline += (average - self._baseline) / (10 * self.sample_size)
+
+            max_latency = max(self.min_latency, self.latency_tolerance * self._baseline)
+            if failure_rate > self.max_failure_rate:
+                reason = "failure rate over {:.2f}".format(self.max_failure_rate)
+            elif average > max_latency:
+                reason = "latency over {:.3f}s".format(max_latency)
+            else:
+                reason = ""
+
+            previous = int(self._limit)
+            if reason and self._cooldown <= 0:
+                self._limit = max(float(self.min_workers), previous * self.decrease)
+                self._cooldown = previous
+                # the hosts that were running don't tell much about the new limit
+                self._samples.clear()
+            elif not reason:
+                self._limit = min(
+                    float(self.max_workers), self._limit + self.increase / self._limit
+                )
+                reason = "no problems"
+            self.max_pending = int(self._limit)
+            if self.max_pending != previous:
+                self._decide(previous, reason, average, failure_rate)
+
+    def _decide(self, previous: int, reason: str, latency: float, failure_rate: float) -> None:
+        decision = AdaptiveDecision(
+            self._completed, previous, self.max_pending, reason, latency, failure_rate
+        )
+        logger.debug("%r", decision)
+        self.decisions.append(decision)
+
+
+class AsyncioRunner:
+    """
+    AsyncioRunner runs the task over the hosts concurrently on an asyncio event loop.
+
+    Tasks that are coroutine functions run on the event loop, so a single thread can wait
+    on thousands of hosts at the same time. Other tasks are run on a pool of threads.
+
+    Arguments:
+        num_workers: maximum number of hosts to run the task for at the same time
+        num_threads: number of threads used to run tasks that aren't coroutine functions
+        concurrency_limits: limits of the hosts running at the same time per group,
+            platform, etc. See :class:`ConcurrencyLimits` for the format
+        rate_limit: limit of the hosts starting per second, either a :class:`RateLimit`
+            or a dict with its arguments
+    """
+
+    def __init__(
+        self,
+        num_workers: int = 1000,
+        num_threads: int = 20,
+        concurrency_limits: ConcurrencyLimits | Mapping[LimitKey, Any] | None = None,
+        rate_limit: RateLimit | Mapping[str, Any] | None = None,
+    ) -> None:
+        self.num_workers = num_workers
+        self.num_threads = num_threads
+        self.concurrency_limits = _concurrency_limits(concurrency_limits)
+        self.rate_limit = _rate_limit(rate_limit)
+
+    def run(self, task: Task, hosts: list[Host]) -> AggregatedResult:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.run_async(task, hosts))
+
+        # asyncio.run can't be called from a running event loop (i.e. in a notebook)
+        with ThreadPoolExecutor(1) as pool:
+            return pool.submit(asyncio.run, self.run_async(task, hosts)).result()
+
+    async def run_async(self, task: Task, hosts: list[Host]) -> AggregatedResult:
+        """Same as :meth:`run` but runs on the current event loop"""
+        semaphores: dict[Hashable, asyncio.Semaphore] = {None: asyncio.Semaphore(self.num_workers)}
+        if inspect.iscoroutinefunction(task.task):
+
+            async def start(host: Host) -> MultiResult:
+                async with self._slots(host, semaphores):
+                    return await task.copy().start_async(host)
+
+            results = await asyncio.gather(*(start(host) for host in hosts))
+        else:
+            loop = asyncio.get_running_loop()
+            with ThreadPoolExecutor(self.num_threads) as pool:
+
+                async def start(host: Host) -> MultiResult:
+                    async with self._slots(host, semaphores):
+                        return await loop.run_in_executor(pool, task.copy().start, host)
+
+                results = await asyncio.gather(*(start(host) for host in hosts))
+
+        result = AggregatedResult(task.name)
+        for host, host_result in zip(hosts, results, strict=True):
+            result[host.name] = host_result
+        return result
+
+    @contextlib.asynccontextmanager
+    async def _slots(
+        self, host: Host, semaphores: dict[Hashable, asyncio.Semaphore]
+    ) -> AsyncIterator[None]:
+        """
+        Waits for the slots of the host, for a worker and for the tokens of the rate limit.
+        The slots are taken in the same order by all hosts so they can't wait on each other
+        """
+        async with contextlib.AsyncExitStack() as stack:
+            if self.concurrency_limits is not None:
+                for slot, size in self.concurrency_limits.slots(host):
+                    semaphore = semaphores.get(slot)
+                    if semaphore is None:
+                        semaphore = semaphores[slot] = asyncio.Semaphore(size)
+                    await stack.enter_async_context(semaphore)
+            await stack.enter_async_context(semaphores[None])
+            if self.rate_limit is not None:
+                # buckets fill up with time, there is no event to wait for
+                while (empty := self.rate_limit.try_acquire(host)) is not None:  # noqa: ASYNC110
+                    await asyncio.sleep(empty[1])
+            yield
+
+
+def _init_worker(task: Task, hosts: dict[str, Host]) -> None:
+    global _worker_state  # noqa: PLW0603
+    _worker_state = (task, hosts)
+
+
+def _run_on_worker(name: str) -> bytes:
+    if _worker_state is None:
+        raise RuntimeError("worker process wasn't initialized")
+    task, hosts = _worker_state
+    host = hosts[name]
+    try:
+        result = task.copy().start(host)
+    finally:
+        # connections can't be sent back to the main process
+        with contextlib.suppress(Exception):
+            host.close_connections()
+    _detach_results(result)
+    # pickled here so a result that can't be sent back only fails its own host
+    try:
+        return pickle.dumps(result)
+    except Exception as e:  # noqa: BLE001
+        return pickle.dumps(_failed_result(task.name, name, e))
+
+
+def _failed_result(task_name: str, host_name: str, exception: Exception) -> MultiResult:
+    """
+    Result of a host whose result was lost, must be called while handling ``exception``.
+    The host has to be attached with :func:`_attach_results`
+    """
+    tb = traceback.format_exc()
+    logger.error("Host %r: result of task %r was lost:\n%s", host_name, task_name, tb)
+    r = Result(
+        None,
+        exception=_portable_exception(exception),
+        result=tb,
+        failed=True,
+        severity_level=logging.ERROR,
+        name=task_name,
+    )
+    result = MultiResult(task_name)
+    result.append(r)
+    return result
+
+
+def _portable_exception(exception: BaseException) -> BaseException:
+    # subtask errors reference the task, and through it the whole inventory
+    if not isinstance(exception, NornirSubTaskError):
+        with contextlib.suppress(Exception):
+            pickle.loads(pickle.dumps(exception))  # noqa: S301
+            return exception
+    return RemoteTaskError(type(exception).__name__, str(exception))
+
+
+def _detach_results(results: MultiResult) -> None:
+    """Prepares results to be sent to the main process, which has its own hosts"""
+    for r in results:
+        if isinstance(r, MultiResult):
+            _detach_results(r)
+            continue
+        r.host = None
+        if r.exception is not None:
+            r.exception = _portable_exception(r.exception)
+
+
+def _attach_results(results: MultiResult, host: Host) -> None:
+    for r in results:
+        if isinstance(r, MultiResult):
+            _attach_results(r, host)
+        elif isinstance(r, Result):
+            r.host = host
+
+
+class ProcessPoolRunner:
+    """
+    ProcessPoolRunner runs the task over the hosts using a pool of processes, so CPU bound
+    tasks (parsing, rendering templates, etc.) can use several CPUs.
+
+    Each worker process receives the task and the hosts once, when it starts, and then
+    only the names of the hosts are sent to the workers and the results sent back. With
+    the ``fork`` start method workers inherit them from the main process without
+    pickling them; with ``spawn`` and ``forkserver`` the task function has to be
+    importable and the task and inventory picklable. Which one is used by default
+    depends on the platform and the python version, see
+    :func:`multiprocessing.get_start_method`.
+
+    Tasks run on copies of the hosts living in the worker processes, so the following
+    doesn't survive the run:
+
+        * changes to the hosts, i.e. ``task.host["key"] = value``
+        * connections opened by the task, they are closed once the task is done
+        * changes to ``task.nornir`` and its global state
+        * events of subtasks, processors only see the events of the task itself and
+          they are called from the main process. ``task_instance_started`` is called
+          when the host is handed to the pool, not when a worker actually starts it
+
+    Exceptions that can't be sent back, including
+    :obj:`nornir.core.exceptions.NornirSubTaskError`, are replaced by
+    :obj:`nornir.core.exceptions.RemoteTaskError`; the traceback is in the result as usual.
+    Hosts whose result can't be sent back, i.e. because it can't be pickled, or whose
+    worker dies fail with the error that prevented getting their result.
+
+    Arguments:
+        num_workers: number of processes to use, defaults to the number of CPUs
+        start_method: start method of the processes (``fork``, ``spawn`` or
+            ``forkserver``), defaults to the one of the platform
+    """
+
+    def __init__(self, num_workers: int | None = None, start_method: str | None = None) -> None:
+        self.num_workers = num_workers
+        self.start_method = start_method
+
+    def run(self, task: Task, hosts: list[Host]) -> AggregatedResult:
+        shipped = task.copy()
+        shipped.processors = Processors()
+        context = multiprocessing.get_context(self.start_method)
+        result = AggregatedResult(task.name)
+        with ProcessPoolExecutor(
+            self.num_workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(shipped, {host.name: host for host in hosts}),
+        ) as pool:
+            started = []
             for host in hosts:
-                future = pool.submit(task.copy().start, host)
-                futures.append(future)
+                host_task = task.copy()
+                host_task.host = host
+                task.processors.task_instance_started(host_task, host)
+                started.append((host_task, pool.submit(_run_on_worker, host.name)))
 
-        for future in futures:
-            worker_result = future.result()
-            result[worker_result.host.name] = worker_result
+            for host, (host_task, future) in zip(hosts, started, strict=True):
+                try:
+                    host_result = pickle.loads(future.result())  # noqa: S301
+                except Exception as e:  # noqa: BLE001
+                    # i.e. the worker died, only the hosts it didn't finish are failed
+                    host_result = _failed_result(task.name, host.name, e)
+                _attach_results(host_result, host)
+                host_task.results = host_result
+                task.processors.task_instance_completed(host_task, host, host_result)
+                result[host.name] = host_result
         return result
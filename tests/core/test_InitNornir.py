@@ -1,13 +1,15 @@
 import logging
 import logging.config
 import os
+import pathlib
+import shutil
 from typing import Any
 
 import pytest
 
 from nornir import InitNornir
 from nornir.core.exceptions import ConflictingConfigurationWarning
-from nornir.core.inventory import Defaults, Group, Groups, Host, Hosts, Inventory
+from nornir.core.inventory import Defaults, Group, Groups, Host, Hosts, Inventory, LazyHosts
 from nornir.core.plugins.inventory import (
     InventoryPluginRegister,
     TransformFunctionRegister,
@@ -45,6 +47,12 @@ def transform_func_with_options(host: Host, a: Any) -> None:
     host["a"] = a
 
 
+def transform_func_batch(hosts: list[Host], a: Any) -> None:
+    for host in hosts:
+        host["a"] = a
+        host["batch_size"] = len(hosts)
+
+
 class InventoryTest:
     def __init__(self, *args: Any, **kwargs: dict[str, Any]) -> None:
         pass
@@ -60,6 +68,7 @@ class InventoryTest:
 InventoryPluginRegister.register("inventory-test", InventoryTest)
 TransformFunctionRegister.register("transform_func", transform_func)
 TransformFunctionRegister.register("transform_func_with_options", transform_func_with_options)
+TransformFunctionRegister.register("transform_func_batch", transform_func_batch)
 
 
 class Test:
@@ -149,6 +158,92 @@ class Test:
         for host in nr.inventory.hosts.values():
             assert host["a"] == 1
 
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_InitNornir_transform_function_workers(self, executor: str) -> None:
+        nr = InitNornir(
+            inventory={
+                "plugin": "SimpleInventory",
+                "transform_function": "transform_func_with_options",
+                "transform_function_options": {"a": 1},
+                "transform_function_workers": 3,
+                "transform_function_executor": executor,
+                "options": {
+                    "host_file": "tests/inventory_data/hosts.yaml",
+                    "group_file": "tests/inventory_data/groups.yaml",
+                    "defaults_file": "tests/inventory_data/defaults.yaml",
+                },
+            },
+        )
+        group_1 = nr.inventory.groups["group_1"]
+        for host in nr.inventory.hosts.values():
+            assert host["a"] == 1
+        assert nr.inventory.hosts["dev1.group_1"].groups[0] is group_1
+
+    @pytest.mark.parametrize(("workers", "batch_sizes"), [(1, [3, 3, 3]), (2, [2, 2, 1])])
+    def test_InitNornir_transform_function_batch(
+        self, workers: int, batch_sizes: list[int]
+    ) -> None:
+        nr = InitNornir(
+            inventory={
+                "plugin": "inventory-test",
+                "transform_function": "transform_func_batch",
+                "transform_function_options": {"a": 1},
+                "transform_function_batch": True,
+                "transform_function_workers": workers,
+            },
+        )
+        assert [h["a"] for h in nr.inventory.hosts.values()] == [1, 1, 1]
+        assert [h["batch_size"] for h in nr.inventory.hosts.values()] == batch_sizes
+
+    def test_InitNornir_transform_function_batch_lazy(self) -> None:
+        nr = InitNornir(
+            inventory={
+                "plugin": "SimpleInventory",
+                "options": {
+                    "host_file": "tests/inventory_data/hosts.yaml",
+                    "group_file": "tests/inventory_data/groups.yaml",
+                    "defaults_file": "tests/inventory_data/defaults.yaml",
+                    "lazy": True,
+                },
+                "transform_function": "transform_func_batch",
+                "transform_function_options": {"a": 1},
+                "transform_function_batch": True,
+                "transform_function_workers": 2,
+            },
+        )
+        assert isinstance(nr.inventory.hosts, LazyHosts)
+        assert nr.inventory.hosts.pending() == 0
+        assert [h["batch_size"] for h in nr.inventory.hosts.values()] == [3] * 6
+
+    def test_refresh_inventory(self, tmp_path: pathlib.Path) -> None:
+        for f in ("hosts.yaml", "groups.yaml", "defaults.yaml"):
+            shutil.copy(os.path.join(dir_path, "..", "..", "inventory_data", f), tmp_path)
+        nr = InitNornir(
+            inventory={
+                "plugin": "SimpleInventory",
+                "options": {
+                    "host_file": str(tmp_path / "hosts.yaml"),
+                    "group_file": str(tmp_path / "groups.yaml"),
+                    "defaults_file": str(tmp_path / "defaults.yaml"),
+                },
+                "transform_function": "transform_func",
+            },
+        )
+        dev1 = nr.inventory.hosts["dev1.group_1"]
+
+        hosts_file = tmp_path / "hosts.yaml"
+        hosts_file.write_text(
+            hosts_file.read_text().replace("www_server: nginx", "www_server: apache")
+        )
+        changes = nr.refresh_inventory()
+
+        assert changes.hosts_updated == ["dev1.group_1"]
+        assert nr.inventory.hosts["dev1.group_1"] is dev1
+        assert dev1["www_server"] == "apache"
+        assert dev1["processed_by_transform_function"]
+        with pytest.raises(ValueError, match="filtered"):
+            nr.filter(site="site1").refresh_inventory()
+
     def test_InitNornir_different_transform_function_by_string_with_bad_options(self) -> None:
         with pytest.raises(TypeError):
             nr = InitNornir(
@@ -20,6 +20,9 @@ class Test:
                 "options": {},
                 "transform_function": "",
                 "transform_function_options": {},
+                "transform_function_workers": 1,
+                "transform_function_executor": "thread",
+                "transform_function_batch": False,
             },
             "ssh": {"config_file": str(Path("~/.ssh/config").expanduser())},
             "logging": {
@@ -43,6 +46,9 @@ class Test:
                 "options": {},
                 "transform_function": "",
                 "transform_function_options": {},
+                "transform_function_workers": 1,
+                "transform_function_executor": "thread",
+                "transform_function_batch": False,
             },
             "ssh": {"config_file": str(Path("~/.ssh/config").expanduser())},
             "logging": {
@@ -69,6 +75,9 @@ class Test:
                 "options": {},
                 "transform_function": "",
                 "transform_function_options": {},
+                "transform_function_workers": 1,
+                "transform_function_executor": "thread",
+                "transform_function_batch": False,
             },
             "runner": {"options": {"a": 1, "b": 2}, "plugin": "serial"},
             "ssh": {"config_file": str(Path("~/.ssh/config").expanduser())},
@@ -1,7 +1,47 @@
+import pickle  # noqa: S403
+from typing import Any
+
 import pytest
 
 from nornir.core import Nornir
-from nornir.core.filter import AND, OR, F
+from nornir.core.filter import AND, F_BASE, OR, F, FilterPlan
+from nornir.core.inventory import Host, Hosts, Inventory
+
+
+def verify_rule(data: Any, rule: str, value: Any) -> bool:
+    operator = "__{}__".format(rule)
+    if hasattr(data, operator):
+        return getattr(data, operator)(value) is True
+
+    if hasattr(data, rule):
+        if callable(getattr(data, rule)):
+            return bool(getattr(data, rule)(value))
+        return bool(getattr(data, rule) == value)
+
+    if rule == "in":
+        return bool(data in value)
+
+    if rule == "any":
+        if isinstance(data, list):
+            return any(x in data for x in value)
+        return any(x == data for x in value)
+
+    if rule == "all":
+        if isinstance(data, list):
+            return all(x in data for x in value)
+        return False
+
+    return bool(data.get(rule) == value)
+
+
+def verify_rules(data: Any, rule: list[str], value: Any) -> bool:
+    """Checks ``data`` against a filter key without the compiled closures of ``F``"""
+    if len(rule) > 1:
+        try:
+            return verify_rules(data.get(rule[0], {}), rule[1:], value)
+        except AttributeError:
+            return False
+    return verify_rule(data, rule[0], value)
 
 
 class Test:
@@ -197,3 +237,170 @@ class Test:
     )
     def test_compare_filter_not_equal(self, filter_a: F, filter_b: F) -> None:
         assert filter_a != filter_b
+
+    @pytest.mark.parametrize(
+        "filters",
+        [
+            {"site": "site1"},
+            {"platform": "linux", "role": "www"},
+            {"groups__contains": "group_1"},
+            {"nested_data__a_dict__c": 3},
+            {"nested_data__a_list__any": [1, 5]},
+            {"nested_data__a_list__all": [1, 2]},
+            {"nested_data__a_string__contains": "sdf"},
+            {"site__in": ["site1", "site2"]},
+            {"port__startswith": "a"},
+            {"not_existing__eq": "test"},
+            {"my_var__any": ["comes_from_dev1.group_1"]},
+        ],
+    )
+    def test_compiled_matches_interpreted(self, nornir: Nornir, filters: dict[str, Any]) -> None:
+        f, not_f = F(**filters), ~F(**filters)
+        for host in nornir.inventory.hosts.values():
+            expected = all(verify_rules(host, k.split("__"), v) for k, v in filters.items())
+            assert f(host) is expected
+            assert not_f(host) is not any(
+                verify_rules(host, k.split("__"), v) for k, v in filters.items()
+            )
+
+    def test_compiled_with_custom_filter(self, nornir: Nornir) -> None:
+        class IsWWW(F_BASE):
+            def __call__(self, host: Host) -> bool:
+                return bool(host.get("role") == "www")
+
+        f = AND(F(site="site1"), IsWWW()) | F(site="site2")
+        filtered = sorted(nornir.inventory.filter(f).hosts.keys())
+
+        assert filtered == ["dev1.group_1", "dev3.group_2", "dev4.group_2", "dev6.group_3"]
+
+    def test_pickle(self, nornir: Nornir) -> None:
+        f = (F(site="site1") & ~F(role="db")) | F(groups__contains="group_2")
+        restored = pickle.loads(pickle.dumps(f))  # noqa: S301
+
+        assert restored == f
+        for host in nornir.inventory.hosts.values():
+            assert restored(host) is f(host)
+
+    @pytest.mark.parametrize(
+        "f",
+        [
+            F(site="site1"),
+            F(site="site1", role="www"),
+            F(site="site1") | F(site="site2"),
+            (F(site="site1") | F(groups__contains="group_2")) & ~F(role="db"),
+            F(platform__in=["linux", "junos"]) & (F(role="www") | F(site="site2")),
+            ~F(site="site1", role="db"),
+            F(nested_data__a_list__any=[1, 5]) | F(my_var="comes_from_dev1.group_1"),
+            F(site=["unhashable"]),
+        ],
+    )
+    def test_plan_matches_filter(self, nornir: Nornir, f: F) -> None:
+        plan = FilterPlan([(f, {})])
+        expected = [n for n, h in nornir.inventory.hosts.items() if f(h)]
+
+        assert [n for n, _ in plan.execute(nornir.inventory)] == expected
+        assert list(nornir.inventory.filter(f).hosts) == expected
+
+    def test_filter_does_not_create_indexes(self) -> None:
+        hosts = {f"h{i}": Host(name=f"h{i}", data={"site": f"s{i % 2}"}) for i in range(4)}
+        inv = Inventory(hosts=Hosts(hosts))
+        assert list(inv.filter(site="s0").hosts) == ["h0", "h2"]
+        assert list(inv.filter(F(site="s1")).hosts) == ["h1", "h3"]
+        assert list(inv._indexes) == ["name"]
+
+        # changes made in place to data are seen by the next filter
+        hosts["h0"].data["site"] = "s1"
+        assert list(inv.filter(site="s0").hosts) == ["h2"]
+        assert list(inv.filter(F(site="s1")).hosts) == ["h0", "h1", "h3"]
+
+    def test_in_uses_index(self) -> None:
+        hosts = {f"h{i}": Host(name=f"h{i}", data={"site": f"s{i % 10}"}) for i in range(1000)}
+        inv = Inventory(hosts=Hosts(hosts))
+
+        view = inv.view(F(name__in=["h7", "h2", "missing"]))
+        assert list(view.hosts) == ["h2", "h7"]
+        assert view.explain().splitlines() == [
+            "2 of 1000 hosts selected from 2 candidates",
+            "name__in=['h7', 'h2', 'missing']: 2 hosts from index",
+        ]
+
+        view = inv.view(name=["h7", "h2"])
+        assert list(view.hosts) == ["h2", "h7"]
+        assert "evaluated" not in view.explain()
+
+        inv.create_index("site")
+        view = inv.view(F(site__in=("s1", "s2")) & F(name__in={"h1", "h2", "h3"}))
+        assert list(view.hosts) == ["h1", "h2"]
+        assert view.explain().splitlines()[0] == "2 of 1000 hosts selected from 2 candidates"
+        assert "evaluated 1000" not in view.explain()
+
+        # values the index can't answer are checked host by host
+        view = inv.view(F(site__in=["s1", None]))
+        assert len(view.hosts) == 100
+        assert "evaluated 1000" in view.explain()
+
+    def test_plan_calls_filter_func_last(self, nornir: Nornir) -> None:
+        calls = []
+
+        def is_www(host: Host) -> bool:
+            calls.append(host.name)
+            return bool(host.get("role") == "www")
+
+        filtered = nornir.inventory.view(filter_func=is_www).view(
+            F(site="site2") & ~F(platform="junos")
+        )
+
+        assert list(filtered.hosts) == ["dev3.group_2"]
+        assert calls == [
+            n
+            for n, h in nornir.inventory.hosts.items()
+            if h.get("site") == "site2" and h.platform != "junos"
+        ]
+
+    def test_plan_explain(self, nornir: Nornir) -> None:
+        nornir.inventory.create_index("site", "role")
+        filtered = nornir.inventory.view(F(site="site1") & F(platform__in=["eos"])).view(role="www")
+        assert filtered.explain().splitlines()[0] == "not executed"
+
+        assert list(filtered.hosts) == ["dev1.group_1"]
+        assert filtered.explain().splitlines() == [
+            "1 of 6 hosts selected from 1 candidates",
+            "AND: 1 hosts from index",
+            "  site == 'site1': 2 hosts from index",
+            "  role == 'www': 2 hosts from index",
+            "  platform__in=['eos']: evaluated 1, passed 1",
+        ]
+
+    @pytest.mark.parametrize(
+        "f",
+        [
+            F(),
+            F(site="site1"),
+            F(platform="linux", role="www"),
+            F(nested_data__a_dict__c=3) | F(nested_data__a_list__all=[1, 2]),
+            ~F(groups__contains="group_1") & F(port__startswith="a"),
+            (F(site="site1") | F(site__in=["site2"])) & ~F(role="db", not_existing__eq="test"),
+            F(nested_data__a_string__contains="sdf") | ~F(my_var__any=["comes_from_dev1.group_1"]),
+        ],
+    )
+    def test_evaluate_many(self, nornir: Nornir, f: F) -> None:
+        hosts = list(nornir.inventory.hosts.values())
+
+        assert f.evaluate_many(hosts) == [f(h) for h in hosts]
+        assert f.evaluate_many(hosts, names=True) == [h.name for h in hosts if f(h)]
+
+    def test_evaluate_many_short_circuits(self, nornir: Nornir) -> None:
+        calls = []
+
+        class IsWWW(F_BASE):
+            def __call__(self, host: Host) -> bool:
+                calls.append(host.name)
+                return bool(host.get("role") == "www")
+
+        f = F(site="site2") & (F(platform="junos") | IsWWW())
+        hosts = nornir.inventory.hosts
+
+        assert f.evaluate_many(hosts.values(), names=True) == ["dev3.group_2"]
+        assert calls == [
+            n for n, h in hosts.items() if h.get("site") == "site2" and h.platform != "junos"
+        ]
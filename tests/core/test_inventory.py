@@ -1,4 +1,6 @@
 import os
+import pickle  # noqa: S403
+from typing import Any
 
 import pytest
 import ruamel.yaml
@@ -17,6 +19,18 @@ with open(f"{dir_path}/../inventory_data/defaults.yaml") as f:
 inv_dict = {"hosts": hosts, "groups": groups, "defaults": defaults}
 
 
+class _FakeConnection:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _lazy_host(name: str, record: dict[str, Any]) -> Host:
+    return Host(name=name, data=record)
+
+
 class Test:
     def test_host(self) -> None:
         h = inventory.Host(name="host1", hostname="host1")
@@ -645,3 +659,480 @@ class Test:
 
         with pytest.raises(ValueError):
             h1.groups.remove(g3)
+
+    def test_attributes_resolution_cache_invalidation(self) -> None:
+        defaults = inventory.Defaults(platform="from_defaults")
+        g1 = inventory.Group(name="g1", defaults=defaults)
+        g2 = inventory.Group(name="g2", groups=inventory.ParentGroups([g1]), defaults=defaults)
+        g3 = inventory.Group(name="g3", platform="from_g3", defaults=defaults)
+        h1 = inventory.Host(name="h1", groups=inventory.ParentGroups([g2]), defaults=defaults)
+
+        assert h1.platform == "from_defaults"
+        assert h1.platform == "from_defaults"
+
+        defaults.platform = "changed_defaults"
+        assert h1.platform == "changed_defaults"
+
+        g1.platform = "from_g1"
+        assert h1.platform == "from_g1"
+
+        g2.groups.insert(0, g3)
+        assert h1.platform == "from_g3"
+
+        g2.groups.remove(g3)
+        assert h1.platform == "from_g1"
+
+        h1.groups = inventory.ParentGroups()
+        assert h1.platform == "changed_defaults"
+
+        h1.defaults = inventory.Defaults(platform="new_defaults")
+        assert h1.platform == "new_defaults"
+
+        h1.platform = "from_h1"
+        assert h1.platform == "from_h1"
+
+    def test_plain_list_groups_are_tracked(self) -> None:
+        g1 = inventory.Group(name="g1", platform="from_g1")
+        g2 = inventory.Group(name="g2", platform="from_g2")
+        h1 = inventory.Host(name="h1", groups=[g1])
+        h2 = inventory.Host(name="h2")
+        h2.groups = [g1]  # type: ignore[assignment]
+        for h in (h1, h2):
+            assert isinstance(h.groups, inventory.ParentGroups)
+            assert h.platform == "from_g1"
+            assert not h.has_parent_group("g2")
+            h.groups.insert(0, g2)
+            assert h.platform == "from_g2"
+            assert h.has_parent_group("g2")
+            h.groups.remove(g2)
+            assert h.platform == "from_g1"
+            assert not h.has_parent_group("g2")
+
+    def test_attributes_resolution_cache_scope(self) -> None:
+        defaults = inventory.Defaults()
+        g1 = inventory.Group(name="g1", platform="from_g1", defaults=defaults)
+        g2 = inventory.Group(name="g2", defaults=defaults)
+        h1 = inventory.Host(name="h1", groups=inventory.ParentGroups([g1]), defaults=defaults)
+        h2 = inventory.Host(name="h2", groups=inventory.ParentGroups([g1]), defaults=defaults)
+        assert h1.platform == h2.platform == "from_g1"
+        inheritance = h2._cache.inheritance
+
+        # changes to other elements don't discard what h2 resolved
+        h1.platform = "from_h1"
+        h1.groups.append(g2)
+        g2.connection_options["netmiko"] = inventory.ConnectionOptions(port=22)
+        assert h2.platform == "from_g1"
+        assert h2._cache.inheritance is inheritance
+
+        g1.connection_options["netmiko"] = inventory.ConnectionOptions(port=22)
+        assert h2.get_connection_parameters("netmiko").port == 22
+        g1.connection_options["netmiko"].port = 2222
+        assert h2.get_connection_parameters("netmiko").port == 2222
+        assert h2._cache.inheritance is not inheritance
+
+        h2 = pickle.loads(pickle.dumps(h2))  # noqa: S301
+        assert h2.get_connection_parameters("netmiko").port == 2222
+        assert h2.connection_options._version == 0
+        h2.groups[0].platform = "changed"
+        assert h2.platform == "changed"
+
+    def test_extended_groups_diamond(self) -> None:
+        gx = inventory.Group(name="gx")
+        g1 = inventory.Group(name="g1", groups=inventory.ParentGroups([gx]))
+        g2 = inventory.Group(name="g2")
+        g3 = inventory.Group(name="g3")
+        ga = inventory.Group(name="ga", groups=inventory.ParentGroups([g1, g2]))
+        gb = inventory.Group(name="gb", groups=inventory.ParentGroups([g2, g3]))
+        h1 = inventory.Host(name="h1", groups=inventory.ParentGroups([ga, gb]))
+
+        assert h1.extended_groups() == [ga, g1, gx, g2, gb, g3]
+
+        gb.groups.append(gx)
+        assert h1.extended_groups() == [ga, g1, gx, g2, gb, g3]
+
+        g2.groups.add(g3)
+        assert h1.extended_groups() == [ga, g1, gx, g2, g3, gb]
+
+        ga.groups = inventory.ParentGroups()
+        assert h1.extended_groups() == [ga, gb, g2, g3, gx]
+
+    def test_extended_data_view(self, inv: inventory.Inventory) -> None:
+        h = inv.hosts["dev1.group_1"]
+        view = h.extended_data_view()
+        assert dict(view) == h.extended_data()
+        assert list(view) == list(h.extended_data())
+        assert len(view) == len(h.extended_data())
+        assert view["my_var"] == "comes_from_dev1.group_1"
+        assert view["site"] == "site1"
+        assert view["only_default"] == "only_defined_in_default"
+        with pytest.raises(TypeError):
+            view["site"] = "site2"
+
+        inv.groups["parent_group"].data["added_later"] = "yes"
+        try:
+            assert view["added_later"] == "yes"
+            assert ("added_later", "yes") in view.items()
+        finally:
+            del inv.groups["parent_group"].data["added_later"]
+
+    def test_modify_while_iterating(self) -> None:
+        g = inventory.Group(name="g", data={"b": 2})
+        h = inventory.Host(name="h", groups=[g], data={"a": 1})
+        for k in h.keys():
+            h[k + "_keys"] = 1
+        for k, v in h.items():
+            h[k + "_items"] = v
+        for _ in h.values():
+            h[f"v{len(h)}"] = 1
+        for k in h:
+            h[k + "_iter"] = 1  # noqa: B909
+        assert "a_keys" in h
+        assert "b_items" in h
+        assert "a_keys_iter" in h
+
+    def test_children_of_group_index_updates(self) -> None:
+        g1 = inventory.Group(name="g1")
+        g2 = inventory.Group(name="g2", groups=inventory.ParentGroups([g1]))
+        g3 = inventory.Group(name="g3")
+        h1 = inventory.Host(name="h1", groups=inventory.ParentGroups([g2]))
+        h2 = inventory.Host(name="h2", groups=inventory.ParentGroups([g3]))
+        inv = inventory.Inventory(
+            hosts=inventory.Hosts({"h1": h1, "h2": h2}),
+            groups=inventory.Groups({"g1": g1, "g2": g2, "g3": g3}),
+        )
+        assert inv.children_of_group("g1") == {h1}
+        assert inv.children_of_group(g3) == {h2}
+
+        g3.groups.append(g1)
+        assert inv.children_of_group("g1") == {h1, h2}
+
+        h3 = inventory.Host(name="h3", groups=inventory.ParentGroups([g2]))
+        inv.hosts["h3"] = h3
+        assert inv.children_of_group("g2") == {h1, h3}
+
+        del inv.hosts["h1"]
+        assert inv.children_of_group("g1") == {h2, h3}
+
+        h3.groups = inventory.ParentGroups()
+        assert inv.children_of_group(g1) == {h2}
+
+        children = inv.children_of_group("g1")
+        children.add(h3)
+        assert inv.children_of_group("g1") == {h2}
+
+    def test_children_of_group_index_incremental(self) -> None:
+        g1 = inventory.Group(name="g1")
+        g2 = inventory.Group(name="g2")
+        hosts = {
+            f"h{i}": inventory.Host(name=f"h{i}", groups=inventory.ParentGroups([g1]))
+            for i in range(10)
+        }
+        inv = inventory.Inventory(hosts=inventory.Hosts(hosts))
+        assert len(inv.children_of_group("g1")) == 10
+        index = inv._group_index
+        assert index is not None
+        by_host = dict(index.by_host)
+
+        # only the hosts under the elements that changed are revisited
+        hosts["h1"].groups.append(g2)
+        assert inv.children_of_group("g2") == {hosts["h1"]}
+        g1.groups.append(g2)
+        assert inv.children_of_group("g2") == set(hosts.values())
+        hosts["h2"].groups = inventory.ParentGroups([g2])
+        assert inv.children_of_group("g1") == set(hosts.values()) - {hosts["h2"]}
+        assert index.by_host["h3"] is not by_host["h3"]
+        assert index.by_host["h2"] == (g2,)
+
+        by_host = dict(index.by_host)
+        hosts["h2"].groups.append(g1)
+        assert inv.children_of_group("g1") == set(hosts.values())
+        assert all(index.by_host[n] is by_host[n] for n in hosts if n != "h2")
+
+        # a list held by several hosts doesn't tell which host changed
+        shared = inventory.ParentGroups()
+        hosts["h3"].groups = shared
+        hosts["h4"].groups = shared
+        shared.append(g2)
+        assert inv.children_of_group("g1") == set(hosts.values()) - {hosts["h3"], hosts["h4"]}
+        assert inv.children_of_group("g2") == set(hosts.values())
+
+    def test_get_connection_parameters_does_not_modify_inventory(
+        self, inv: inventory.Inventory
+    ) -> None:
+        before = inv.dict()
+        for h in inv.hosts.values():
+            for connection in ("dummy", "dummy2", "paramiko", "not_defined"):
+                h.get_connection_parameters(connection)
+        assert inv.dict() == before
+
+    def test_get_connection_parameters_cache_invalidation(self) -> None:
+        defaults = inventory.Defaults(
+            username="from_defaults",
+            connection_options={"ssh": inventory.ConnectionOptions(port=22)},
+        )
+        g1 = inventory.Group(name="g1", defaults=defaults)
+        g2 = inventory.Group(
+            name="g2",
+            defaults=defaults,
+            connection_options={"ssh": inventory.ConnectionOptions(port=2222)},
+        )
+        h1 = inventory.Host(
+            name="h1",
+            hostname="h1.example",
+            groups=inventory.ParentGroups([g1, g2]),
+            defaults=defaults,
+        )
+
+        p = h1.get_connection_parameters("ssh")
+        assert (p.hostname, p.port, p.username, p.extras) == (
+            "h1.example",
+            2222,
+            "from_defaults",
+            {},
+        )
+
+        p.port = 1
+        p.extras["a"] = 1
+        p = h1.get_connection_parameters("ssh")
+        assert (p.port, p.extras) == (2222, {})
+
+        g1.connection_options["ssh"] = inventory.ConnectionOptions(port=8022)
+        assert h1.get_connection_parameters("ssh").port == 8022
+
+        g1.connection_options["ssh"].extras = {"a": 1}
+        assert h1.get_connection_parameters("ssh").extras == {"a": 1}
+
+        g1.connection_options = {}
+        assert h1.get_connection_parameters("ssh").port == 2222
+
+        g1.username = "from_g1"
+        assert h1.get_connection_parameters("ssh").username == "from_g1"
+        assert h1.get_connection_parameters().username == "from_g1"
+
+    def test_filter_is_eager(self, inv: inventory.Inventory) -> None:
+        def broken(host: Host) -> bool:
+            raise ValueError(host.name)
+
+        with pytest.raises(ValueError, match=r"dev1\.group_1"):
+            inv.filter(filter_func=broken)
+
+        filtered = inv.filter(site="site1")
+        inv.hosts["dev3.group_2"]["site"] = "site1"
+        try:
+            assert list(filtered.hosts) == ["dev1.group_1", "dev2.group_1"]
+        finally:
+            inv.hosts["dev3.group_2"]["site"] = "site2"
+
+    def test_view_is_lazy(self, inv: inventory.Inventory) -> None:
+        calls = []
+
+        def is_www(host: Host) -> bool:
+            calls.append(host.name)
+            return bool(host.get("role") == "www")
+
+        view = inv.view(filter_func=is_www).view(site="site1")
+        assert isinstance(view, inventory.InventoryView)
+        assert calls == []
+
+        assert [h.name for h in view] == ["dev1.group_1"]
+        # keyword filters are checked before filter functions
+        assert calls == ["dev1.group_1", "dev2.group_1"]
+
+        assert list(view.hosts.keys()) == ["dev1.group_1"]
+        assert view.hosts is view.hosts
+        assert len(view) == 1
+        calls.clear()
+        assert [h.name for h in view] == ["dev1.group_1"]
+        assert calls == []
+
+        assert list(view.filter(site="site2").hosts.keys()) == []
+
+    def test_filter_view_pickle(self, inv: inventory.Inventory) -> None:
+        view = inv.filter(role="www")
+        restored = pickle.loads(pickle.dumps(view))  # noqa: S301
+        assert sorted(restored.hosts.keys()) == sorted(view.hosts.keys())
+
+    def test_index_tracks_data_changes(self) -> None:
+        g1 = inventory.Group(name="g1", data={"site": "s1"})
+        h1 = inventory.Host(name="h1", groups=inventory.ParentGroups([g1]))
+        h2 = inventory.Host(name="h2", data={"site": "s2"})
+        inv = inventory.Inventory(hosts=inventory.Hosts({"h1": h1, "h2": h2}))
+        inv.create_index("site")
+        assert list(inv.filter(site="s1").hosts) == ["h1"]
+
+        h2.data["site"] = "s1"
+        assert list(inv.filter(site="s1").hosts) == ["h1", "h2"]
+        g1.data.update(site="s3")
+        assert list(inv.filter(site="s1").hosts) == ["h2"]
+        h2.data.pop("site")
+        assert list(inv.filter(site="s1").hosts) == []
+        h1.data = {"site": "s1"}
+        assert list(inv.filter(site="s1").hosts) == ["h1"]
+        assert type(h1.data) is not dict
+        assert type(h1.dict()["data"]) is dict
+
+    def test_data_is_copied(self) -> None:
+        d = {"a": 1}
+        h = inventory.Host(name="h", data=d)
+        d["b"] = 2
+        assert h.data == {"a": 1}
+        assert h.data is not d
+
+        h.data = d
+        d["c"] = 3
+        assert h.data == {"a": 1, "b": 2}
+        h.data["d"] = 4
+        assert "d" not in d
+
+    def test_filter_uses_index(self, inv: inventory.Inventory) -> None:
+        inv.create_index("site", "platform")
+        assert list(inv.filter(site="site1").hosts) == ["dev1.group_1", "dev2.group_1"]
+        assert list(inv.filter(name="dev3.group_2").hosts) == ["dev3.group_2"]
+        assert list(inv.filter(site="site1", role="db").hosts) == ["dev2.group_1"]
+        assert list(inv.filter(platform="linux").hosts) == [
+            h.name for h in inv.hosts.values() if h.platform == "linux"
+        ]
+
+        inv.hosts["dev3.group_2"]["site"] = "site1"
+        assert list(inv.filter(site="site1").hosts) == [
+            "dev1.group_1",
+            "dev2.group_1",
+            "dev3.group_2",
+        ]
+
+        inv.hosts["dev4.group_2"].platform = "linux"
+        assert "dev4.group_2" in inv.filter(platform="linux").hosts
+
+        inv.hosts["dev7"] = Host(name="dev7", data={"site": "site1"})
+        assert list(inv.filter(site="site1").hosts)[-1] == "dev7"
+        del inv.hosts["dev7"]
+        assert "dev7" not in inv.filter(site="site1").hosts
+
+        assert list(inv.filter(site="site1").filter(site="site2").hosts) == []
+
+    def test_filter_index_unhashable(self, inv: inventory.Inventory) -> None:
+        inv.create_index("tags")
+        inv.hosts["dev1.group_1"]["tags"] = ["a"]
+        inv.hosts["dev2.group_1"]["tags"] = "a"
+        assert list(inv.filter(tags=["a"]).hosts) == ["dev1.group_1"]
+        assert list(inv.filter(tags="a").hosts) == ["dev2.group_1"]
+
+    def test_lazy_hosts(self) -> None:
+        built = []
+
+        def factory(name: str, record: dict[str, Any]) -> Host:
+            built.append(name)
+            return Host(name=name, data=record)
+
+        hosts = inventory.LazyHosts({"h1": {"a": 1}, "h2": {"a": 2}, "h3": {"a": 1}}, factory)
+        assert len(hosts) == 3
+        assert list(hosts) == list(hosts.keys()) == ["h1", "h2", "h3"]
+        assert "h2" in hosts
+        assert "h4" not in hosts
+        assert hosts.get("h4") is None
+        assert built == []
+
+        assert hosts["h2"] is hosts["h2"]
+        assert built == ["h2"]
+        with pytest.raises(KeyError):
+            hosts["h4"]
+
+        hosts.defer(lambda h: h.data.update(b=True))
+        assert hosts["h2"]["b"] is True
+        assert [h.name for h in hosts.values()] == ["h1", "h2", "h3"]
+        assert all(h["b"] for h in hosts.values())
+        assert built == ["h2", "h1", "h3"]
+
+        hosts["h4"] = Host(name="h4")
+        del hosts["h1"]
+        assert hosts.pop("h3").name == "h3"
+        assert hosts.pop("h3", None) is None
+        assert list(hosts) == ["h2", "h4"]
+        assert hosts == {"h2": hosts["h2"], "h4": hosts["h4"]}
+
+    def test_lazy_hosts_filter(self) -> None:
+        hosts = inventory.LazyHosts({f"h{i}": {"a": i % 3} for i in range(9)}, _lazy_host)
+        inv = inventory.Inventory(hosts=hosts)
+
+        assert list(inv.filter(filter_func=lambda h: h["a"] == 1).hosts) == ["h1", "h4", "h7"]
+        assert hosts.pending() == 6
+        assert list(inv.filter(a=2).hosts) == ["h2", "h5", "h8"]
+        assert hosts.pending() == 3
+
+        restored = pickle.loads(pickle.dumps(hosts))  # noqa: S301
+        assert isinstance(restored, inventory.LazyHosts)
+        assert restored.pending() == 3
+        assert list(restored) == list(hosts)
+
+    def test_patch(self, inv: inventory.Inventory) -> None:
+        current = pickle.loads(pickle.dumps(inv))  # noqa: S301
+        new = pickle.loads(pickle.dumps(inv))  # noqa: S301
+        conns = {n: _FakeConnection() for n in ("dev1.group_1", "dev2.group_1", "dev3.group_2")}
+        for name, conn in conns.items():
+            current.hosts[name].connections["netmiko"] = conn
+        dev1 = current.hosts["dev1.group_1"]
+        group_1 = current.groups["group_1"]
+
+        new.hosts["dev1.group_1"]["www_server"] = "apache"
+        new.hosts["dev2.group_1"].hostname = "changed"
+        del new.hosts["dev3.group_2"]
+        new.hosts["dev7.group_1"] = inventory.Host(
+            name="dev7.group_1", groups=inventory.ParentGroups([new.groups["group_1"]])
+        )
+        new.groups["group_1"].data["new_var"] = 1
+
+        changes = current.patch(new)
+
+        assert changes.hosts_added == ["dev7.group_1"]
+        assert changes.hosts_removed == ["dev3.group_2"]
+        assert changes.hosts_updated == ["dev1.group_1", "dev2.group_1"]
+        assert changes.groups_updated == ["group_1"]
+        assert not changes.groups_added
+        assert not changes.groups_removed
+        assert not changes.defaults_updated
+        assert current.dict() == new.dict()
+
+        # elements are updated in place and the new ones point to them
+        assert current.hosts["dev1.group_1"] is dev1
+        assert current.groups["group_1"] is group_1
+        assert dev1["www_server"] == "apache"
+        assert dev1["new_var"] == 1
+        assert current.hosts["dev7.group_1"].groups[0] is group_1
+        assert current.hosts["dev7.group_1"].defaults is current.defaults
+
+        # only the connections of removed hosts or with new parameters are closed
+        assert dev1.connections == {"netmiko": conns["dev1.group_1"]}
+        assert not conns["dev1.group_1"].closed
+        assert current.hosts["dev2.group_1"].connections == {}
+        assert conns["dev2.group_1"].closed
+        assert conns["dev3.group_2"].closed
+
+        assert not current.patch(pickle.loads(pickle.dumps(current)))  # noqa: S301
+
+    def test_shard(self) -> None:
+        hosts = {f"h{i}": inventory.Host(name=f"h{i}") for i in range(1000)}
+        inv = inventory.Inventory(hosts=inventory.Hosts(hosts))
+
+        shards = [set(inv.shard(4, i).hosts) for i in range(4)]
+        assert set().union(*shards) == set(hosts)
+        assert sum(len(s) for s in shards) == len(hosts)
+        assert all(200 < len(s) < 300 for s in shards)
+        assert [set(inv.shard(4, i).hosts) for i in range(4)] == shards
+
+        # removing hosts doesn't move the rest, adding a shard only takes hosts
+        del inv.hosts["h0"]
+        assert set(inv.shard(4, 1).hosts) == shards[1] - {"h0"}
+        for i in range(4):
+            assert set(inv.shard(5, i).hosts) <= shards[i]
+
+        weighted = [len(inv.shard(2, i, weights=[1, 3]).hosts) for i in range(2)]
+        assert 150 < weighted[0] < 350
+        by_key = inv.shard(2, 0, key=lambda h: h.name[:2])
+        assert {n[:2] for n in by_key.hosts}.isdisjoint(
+            {n[:2] for n in inv.shard(2, 1, key=lambda h: h.name[:2]).hosts}
+        )
+
+        with pytest.raises(ValueError):
+            inv.shard(2, 2)
+        with pytest.raises(ValueError):
+            inv.shard(2, 0, weights=[1])
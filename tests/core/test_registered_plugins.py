@@ -3,7 +3,13 @@ from nornir_utils.plugins.inventory import YAMLInventory
 from nornir.core.plugins.inventory import InventoryPluginRegister
 from nornir.core.plugins.runners import RunnersPluginRegister
 from nornir.plugins.inventory import SimpleInventory
-from nornir.plugins.runners import SerialRunner, ThreadedRunner
+from nornir.plugins.runners import (
+    AdaptiveRunner,
+    AsyncioRunner,
+    ProcessPoolRunner,
+    SerialRunner,
+    ThreadedRunner,
+)
 
 
 class Test:
@@ -13,6 +19,9 @@ class Test:
         assert RunnersPluginRegister.available == {
             "threaded": ThreadedRunner,
             "serial": SerialRunner,
+            "asyncio": AsyncioRunner,
+            "process_pool": ProcessPoolRunner,
+            "adaptive": AdaptiveRunner,
         }
 
     def test_registered_inventory(self) -> None:
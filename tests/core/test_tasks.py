@@ -1,8 +1,12 @@
 import logging
 
+import pytest
+
 from nornir.core import Nornir
-from nornir.core.exceptions import NornirSubTaskError
-from nornir.core.task import Result, Task
+from nornir.core.exceptions import NornirExecutionError, NornirSubTaskError
+from nornir.core.plugins.runners import RunnerPlugin
+from nornir.core.task import AggregatedResult, Result, Task
+from nornir.plugins.runners import ProcessPoolRunner, ThreadedRunner
 
 
 class CustomException(Exception):
@@ -195,3 +199,29 @@ class Test:
         assert not r["dev1.group_1"][0].exception
         assert r["dev1.group_1"][0].result == "I captured this succcessfully"
         assert r["dev1.group_1"][1].exception.__class__ is CustomException
+
+    @pytest.mark.parametrize("runner", [None, ThreadedRunner(), ProcessPoolRunner(num_workers=2)])
+    def test_run_iter(self, nornir: Nornir, runner: RunnerPlugin | None) -> None:
+        nr = nornir.with_runner(runner) if runner else nornir
+        aggregate = AggregatedResult("a_task_for_testing")
+        seen = {}
+        for host, result in nr.run_iter(
+            a_task_for_testing, fail_on=["dev3.group_2"], aggregate=aggregate
+        ):
+            assert result.host is host
+            seen[host.name] = result
+        assert sorted(seen) == sorted(nornir.inventory.hosts)
+        assert aggregate == seen
+        assert seen["dev3.group_2"].failed
+        assert nornir.data.failed_hosts == {"dev3.group_2"}
+
+    def test_run_iter_raise_on_error(self, nornir: Nornir) -> None:
+        seen = []
+        with pytest.raises(NornirExecutionError) as e:
+            for host, _ in nornir.run_iter(
+                a_task_for_testing, fail_on=["dev3.group_2"], raise_on_error=True
+            ):
+                seen.append(host.name)
+        assert seen == list(nornir.inventory.hosts)
+        assert list(e.value.result) == ["dev3.group_2"]
+        assert not nornir.data.failed_hosts
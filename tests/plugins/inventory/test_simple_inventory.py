@@ -1,6 +1,17 @@
+import logging
+import math
 import os
+import pathlib
+import pickle  # ruff:ignore[suspicious-pickle-import]
+import shutil
 
-from nornir.plugins.inventory import SimpleInventory
+import pytest
+import ruamel.yaml
+
+import nornir
+from nornir.core.filter import F
+from nornir.core.inventory import LazyHosts
+from nornir.plugins.inventory import SimpleInventory, simple
 
 dir_path = os.path.dirname(os.path.realpath(__file__))
 
@@ -253,3 +264,151 @@ class Test:
         assert inv.hosts == {}
         assert inv.groups == {}
         assert inv.defaults.data == {}
+
+    def test_snapshot(self, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verify the inventory is loaded from the snapshot until the YAML files change."""
+        for name in ("hosts.yaml", "groups.yaml", "defaults.yaml"):
+            shutil.copy(f"{dir_path}/data/{name}", tmp_path / name)
+        host_file, group_file, defaults_file = (
+            str(tmp_path / name) for name in ("hosts.yaml", "groups.yaml", "defaults.yaml")
+        )
+        snapshot_file = tmp_path / "inventory.snapshot"
+
+        expected = SimpleInventory(host_file, group_file, defaults_file).load().dict()
+        inv = SimpleInventory(
+            host_file, group_file, defaults_file, snapshot_file=str(snapshot_file)
+        ).load()
+        assert inv.dict() == expected
+        assert snapshot_file.exists()
+
+        with monkeypatch.context() as m:
+            m.setattr(ruamel.yaml.YAML, "load", lambda *_: pytest.fail("YAML parsed"))
+            inv = SimpleInventory(
+                host_file, group_file, defaults_file, snapshot_file=str(snapshot_file)
+            ).load()
+        assert inv.dict() == expected
+        assert inv.hosts["dev2.group_1"].groups[0] is inv.groups["group_1"]
+        assert inv.hosts["dev1.group_1"].defaults is inv.defaults
+
+        with open(host_file, "a") as f:
+            f.write("dev7:\n    hostname: localhost\n")
+        inv = SimpleInventory(
+            host_file, group_file, defaults_file, snapshot_file=str(snapshot_file)
+        ).load()
+        assert "dev7" in inv.hosts
+
+    def test_snapshot_nornir_upgrade(
+        self, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify a snapshot written by another version of nornir is ignored."""
+        host_file = f"{dir_path}/data/hosts.yaml"
+        group_file = f"{dir_path}/data/groups.yaml"
+        defaults_file = f"{dir_path}/data/defaults.yaml"
+        snapshot_file = tmp_path / "inventory.snapshot"
+        SimpleInventory(
+            host_file, group_file, defaults_file, snapshot_file=str(snapshot_file)
+        ).load()
+        written = snapshot_file.read_bytes()
+
+        monkeypatch.setattr(nornir, "__version__", "0.0.0")
+        inv = SimpleInventory(
+            host_file, group_file, defaults_file, snapshot_file=str(snapshot_file)
+        ).load()
+        assert "dev1.group_1" in inv.hosts
+        assert snapshot_file.read_bytes() != written
+
+    def test_snapshot_corrupted(self, tmp_path: pathlib.Path) -> None:
+        """Verify a corrupted snapshot is ignored and replaced."""
+        host_file = f"{dir_path}/data/hosts.yaml"
+        group_file = f"{dir_path}/data/groups.yaml"
+        defaults_file = f"{dir_path}/data/defaults.yaml"
+        snapshot_file = tmp_path / "inventory.snapshot"
+        snapshot_file.write_bytes(b"not a snapshot")
+
+        inv = SimpleInventory(
+            host_file, group_file, defaults_file, snapshot_file=str(snapshot_file)
+        ).load()
+        assert len(inv.hosts) == 5
+        assert snapshot_file.read_bytes() != b"not a snapshot"
+
+    def test_lazy(self) -> None:
+        """Verify hosts are only built when used or selected by a filter."""
+        host_file = f"{dir_path}/data/hosts.yaml"
+        group_file = f"{dir_path}/data/groups.yaml"
+        defaults_file = f"{dir_path}/data/defaults.yaml"
+
+        expected = SimpleInventory(host_file, group_file, defaults_file).load()
+        inv = SimpleInventory(host_file, group_file, defaults_file, lazy=True).load()
+        assert isinstance(inv.hosts, LazyHosts)
+        assert inv.hosts.pending() == len(inv.hosts) == 5
+        assert list(inv.hosts) == list(expected.hosts)
+
+        selected = inv.filter(F(site="site2") & F(platform="linux")).hosts  # type: ignore[arg-type]
+        assert list(selected) == ["dev3.group_2", "dev4.group_2"]
+        assert selected["dev3.group_2"] is inv.hosts["dev3.group_2"]
+        assert inv.hosts.pending() == 3
+
+        assert inv.hosts["dev2.group_1"].groups[0] is inv.groups["group_1"]
+        assert inv.hosts["dev2.group_1"].password == "from_group1"
+        assert inv.hosts.pending() == 2
+
+        assert inv.dict() == expected.dict()
+        assert inv.hosts.pending() == 0
+
+    def test_intern(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Verify equal values are shared and can't be modified in place."""
+        host_file = f"{dir_path}/data/hosts.yaml"
+        group_file = f"{dir_path}/data/groups.yaml"
+        defaults_file = f"{dir_path}/data/defaults.yaml"
+
+        expected = SimpleInventory(host_file, group_file, defaults_file).load()
+        with caplog.at_level(logging.INFO, logger="nornir.plugins.inventory.simple"):
+            inv = SimpleInventory(host_file, group_file, defaults_file, intern=True).load()
+        assert "interning the inventory saved" in caplog.text
+        assert inv.dict() == expected.dict()
+
+        dev1, dev2 = inv.hosts["dev1.group_1"], inv.hosts["dev2.group_1"]
+        assert dev1.hostname is dev2.hostname
+        extras = dev1.connection_options["paramiko"].extras
+        assert extras is dev2.connection_options["paramiko"].extras
+        with pytest.raises(TypeError):
+            dev1["nested_data"]["a_list"].append(3)
+        with pytest.raises(TypeError):
+            dev1["nested_data"]["a_dict"]["a"] = 2
+
+        dev1["nested_data"] = {**dev1["nested_data"], "a_string": "changed"}
+        assert dev1["nested_data"]["a_string"] == "changed"
+        assert dev2["nested_data"]["a_string"] == "qwe"
+
+        restored = pickle.loads(pickle.dumps(inv))  # ruff:ignore[suspicious-pickle-usage]
+        assert restored.dict() == inv.dict()
+        with pytest.raises(TypeError):
+            restored.hosts["dev2.group_1"]["nested_data"]["a_list"].append(3)
+
+    def test_intern_floats(self) -> None:
+        """Verify floats that compare equal but are different values aren't mixed up."""
+        interner = simple._Interner()
+        assert math.copysign(1, interner(0.0)) == 1
+        assert math.copysign(1, interner(-0.0)) == -1
+        assert interner([0.0]) is not interner([-0.0])
+        nan = interner(float("nan"))
+        assert interner(float("nan")) is nan
+
+    def test_lazy_snapshot(self, tmp_path: pathlib.Path) -> None:
+        """Verify lazy hosts can be stored in snapshots."""
+        host_file = f"{dir_path}/data/hosts.yaml"
+        group_file = f"{dir_path}/data/groups.yaml"
+        defaults_file = f"{dir_path}/data/defaults.yaml"
+        snapshot_file = str(tmp_path / "inventory.snapshot")
+
+        expected = SimpleInventory(host_file, group_file, defaults_file).load().dict()
+        inv = SimpleInventory(
+            host_file, group_file, defaults_file, snapshot_file=snapshot_file, lazy=True
+        ).load()
+        inv.hosts["dev1.group_1"]
+        inv = SimpleInventory(
+            host_file, group_file, defaults_file, snapshot_file=snapshot_file, lazy=True
+        ).load()
+        assert isinstance(inv.hosts, LazyHosts)
+        assert inv.hosts.pending() == 5
+        assert inv.dict() == expected
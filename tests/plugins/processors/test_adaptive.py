@@ -0,0 +1,108 @@
+import itertools
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from nornir.core import Nornir
+from nornir.core.inventory import Host
+from nornir.core.processor import Processors
+from nornir.core.task import Task
+from nornir.plugins.runners import AdaptiveRunner
+
+
+class CustomException(Exception):
+    pass
+
+
+def blocking_task(task: Task, wait: float) -> None:
+    time.sleep(wait)
+
+
+def quick_task(task: Task) -> None:
+    time.sleep(0.01)
+
+
+def failing_task(task: Task) -> None:
+    raise CustomException(task.host.name)
+
+
+class SlowingDown:
+    """Task that gets slower after the first hosts"""
+
+    def __init__(self, fast_hosts: int) -> None:
+        self.fast_hosts = fast_hosts
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def task(self, task: Task) -> None:
+        with self._lock:
+            n = next(self._counter)
+        time.sleep(0.01 if n < self.fast_hosts else 0.1)
+
+
+def many_hosts(nornir: Nornir, times: int) -> list[Host]:
+    return list(nornir.inventory.hosts.values()) * times
+
+
+class Test:
+    def test_increase(self, nornir: Nornir) -> None:
+        runner = AdaptiveRunner(min_workers=1, max_workers=4, min_latency=1)
+        task = Task(quick_task, nornir, global_dry_run=False, processors=Processors())
+        hosts = many_hosts(nornir, 5)
+        results = list(runner.run_iter(task, hosts))
+        runner.close()
+        assert len(results) == len(hosts)
+        assert not any(r.failed for r in results)
+        assert [d.limit for d in runner.decisions] == [2, 3, 4]
+        assert all(d.reason == "no problems" for d in runner.decisions)
+        assert runner.max_pending == 4
+
+    def test_decrease_on_failures(self, nornir: Nornir) -> None:
+        runner = AdaptiveRunner(min_workers=2, max_workers=8, initial_workers=8)
+        result = nornir.with_runner(runner).run(failing_task)
+        runner.close()
+        assert list(result) == list(nornir.inventory.hosts)
+        for k, v in result.items():
+            assert isinstance(v.exception, CustomException), v
+            assert str(v.exception) == k
+        decision = runner.decisions[0]
+        assert (decision.previous, decision.limit) == (8, 4)
+        assert decision.reason == "failure rate over 0.10"
+        assert decision.failure_rate == 1
+        assert runner.max_pending >= 2
+
+    def test_decrease_on_latency(self, nornir: Nornir) -> None:
+        slowing_down = SlowingDown(fast_hosts=12)
+        runner = AdaptiveRunner(max_workers=4, initial_workers=4, increase=0, sample_size=4)
+        task = Task(slowing_down.task, nornir, global_dry_run=False, processors=Processors())
+        results = list(runner.run_iter(task, many_hosts(nornir, 4)))
+        runner.close()
+        assert not any(r.failed for r in results)
+        decision = runner.decisions[0]
+        assert (decision.previous, decision.limit) == (4, 2)
+        assert decision.reason.startswith("latency over")
+        assert decision.completed > 12
+
+    def test_decisions_reset_every_run(self, nornir: Nornir) -> None:
+        runner = AdaptiveRunner(min_workers=1, max_workers=2)
+        with nornir.with_runner(runner) as nr:
+            nr.run(blocking_task, wait=0)
+            assert [d.limit for d in runner.decisions] == [2]
+            nr.run(blocking_task, wait=0)
+            assert runner.decisions == []
+            assert runner.max_pending == 2
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"min_workers": 0},
+            {"min_workers": 5, "max_workers": 4},
+            {"initial_workers": 200},
+            {"decrease": 1},
+        ],
+    )
+    def test_invalid_arguments(self, kwargs: dict[str, Any]) -> None:
+        with pytest.raises(ValueError, match="has to"):
+            AdaptiveRunner(**kwargs)
@@ -0,0 +1,127 @@
+import asyncio
+import datetime
+import time
+from collections import Counter
+
+import pytest
+
+from nornir.core import Nornir
+from nornir.core.exceptions import NornirExecutionError
+from nornir.core.task import Result, Task
+from nornir.plugins.runners import AsyncioRunner, SerialRunner
+
+NUM_WORKERS = 20
+
+
+class CustomException(Exception):
+    pass
+
+
+async def async_blocking_task(task: Task, wait: float) -> None:
+    await asyncio.sleep(wait)
+
+
+def blocking_task(task: Task, wait: float) -> None:
+    time.sleep(wait)
+
+
+async def async_failing_task(task: Task) -> None:
+    await asyncio.sleep(0)
+    raise CustomException(task.host.name)
+
+
+async def async_subtask(task: Task) -> Result:
+    await asyncio.sleep(0)
+    return Result(host=task.host, result=task.host.name)
+
+
+async def async_group_task(task: Task, running: Counter[bool], max_running: Counter[bool]) -> None:
+    key = task.host.has_parent_group("group_1")
+    running[key] += 1
+    max_running[key] = max(max_running[key], running[key])
+    await asyncio.sleep(0.05)
+    running[key] -= 1
+
+
+async def async_grouped_task(task: Task) -> str:
+    r = await task.run_async(async_subtask)
+    return "{} done".format(r.result)
+
+
+class Test:
+    def test_blocking_async_task(self, nornir: Nornir) -> None:
+        t1 = datetime.datetime.now()
+        result = nornir.with_runner(AsyncioRunner()).run(async_blocking_task, wait=1)
+        t2 = datetime.datetime.now()
+        delta = t2 - t1
+        assert delta.seconds == 1, delta
+        assert list(result) == list(nornir.inventory.hosts)
+        assert not result.failed
+
+    def test_blocking_async_task_num_workers(self, nornir: Nornir) -> None:
+        t1 = datetime.datetime.now()
+        nornir.with_runner(AsyncioRunner(num_workers=1)).run(async_blocking_task, wait=0.2)
+        t2 = datetime.datetime.now()
+        delta = t2 - t1
+        assert delta.total_seconds() >= 0.2 * len(nornir.inventory.hosts), delta
+
+    def test_blocking_sync_task(self, nornir: Nornir) -> None:
+        t1 = datetime.datetime.now()
+        result = nornir.with_runner(AsyncioRunner(num_threads=NUM_WORKERS)).run(
+            blocking_task, wait=1
+        )
+        t2 = datetime.datetime.now()
+        delta = t2 - t1
+        assert delta.seconds == 1, delta
+        assert not result.failed
+
+    def test_failing_async_task(self, nornir: Nornir) -> None:
+        result = nornir.with_runner(AsyncioRunner()).run(async_failing_task)
+        assert result
+        for k, v in result.items():
+            assert isinstance(v.exception, CustomException), v
+            assert str(v.exception) == k
+
+    def test_failing_async_task_raise_on_error(self, nornir: Nornir) -> None:
+        with pytest.raises(NornirExecutionError) as e:
+            nornir.with_runner(AsyncioRunner()).run(async_failing_task, raise_on_error=True)
+        for v in e.value.result.values():
+            assert isinstance(v.exception, CustomException), v
+
+    def test_async_subtasks(self, nornir: Nornir) -> None:
+        result = nornir.with_runner(AsyncioRunner()).run(async_grouped_task)
+        for k, v in result.items():
+            assert v[0].result == "{} done".format(k)
+            assert v[1].result == k
+
+    def test_run_from_event_loop(self, nornir: Nornir) -> None:
+        async def main() -> None:
+            await asyncio.sleep(0)
+            result = nornir.with_runner(AsyncioRunner()).run(async_subtask)
+            assert {k: v.result for k, v in result.items()} == {k: k for k in result}
+
+        asyncio.run(main())
+
+    def test_async_task_with_sync_runner(self, nornir: Nornir) -> None:
+        result = nornir.with_runner(SerialRunner()).run(async_grouped_task)
+        for k, v in result.items():
+            assert v[0].result == "{} done".format(k)
+
+    def test_concurrency_limits(self, nornir: Nornir) -> None:
+        running: Counter[bool] = Counter()
+        max_running: Counter[bool] = Counter()
+        runner = AsyncioRunner(concurrency_limits={"groups": {"group_1": 1}, "platform": 3})
+        nr = nornir.with_runner(runner)
+        for _ in range(3):
+            result = nr.run(async_group_task, running=running, max_running=max_running)
+            assert not result.failed
+        assert max_running == {True: 1, False: 3}
+
+    def test_rate_limit(self, nornir: Nornir) -> None:
+        t1 = datetime.datetime.now()
+        runner = AsyncioRunner(rate_limit={"rate": 20, "burst": 3})
+        result = nornir.with_runner(runner).run(async_blocking_task, wait=0)
+        t2 = datetime.datetime.now()
+        assert not result.failed
+        # three hosts start right away, the other three once every 50ms
+        assert (t2 - t1).total_seconds() >= 0.14
@@ -0,0 +1,132 @@
+import os
+import threading
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from nornir.core import Nornir
+from nornir.core.exceptions import NornirExecutionError, RemoteTaskError
+from nornir.core.inventory import Host
+from nornir.core.task import AggregatedResult, MultiResult, Result, Task
+from nornir.plugins.runners import ProcessPoolRunner
+
+NUM_WORKERS = 2
+
+
+class CustomException(Exception):
+    pass
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.events: list[tuple[str, str]] = []
+
+    def task_started(self, task: Task) -> None:
+        pass
+
+    def task_completed(self, task: Task, result: AggregatedResult) -> None:
+        pass
+
+    def task_instance_started(self, task: Task, host: Host) -> None:
+        self.events.append(("started", host.name))
+
+    def task_instance_completed(self, task: Task, host: Host, result: MultiResult) -> None:
+        self.events.append(("completed", host.name))
+
+    def subtask_instance_started(self, task: Task, host: Host) -> None:
+        self.events.append(("subtask started", host.name))
+
+    def subtask_instance_completed(self, task: Task, host: Host, result: MultiResult) -> None:
+        self.events.append(("subtask completed", host.name))
+
+
+def get_pid(task: Task) -> int:
+    return os.getpid()
+
+
+def failing_task(task: Task) -> None:
+    raise CustomException(task.host.name)
+
+
+def failing_subtask(task: Task) -> None:
+    task.run(failing_task)
+
+
+def change_data(task: Task) -> Result:
+    task.host["changed_in_worker"] = True
+    return Result(host=task.host, result=task.host.hostname, changed=True)
+
+
+def unpicklable_result(task: Task) -> object:
+    return threading.Lock() if task.host.name == "dev1.group_1" else task.host.name
+
+
+def exit_worker(task: Task) -> None:
+    if task.host.name == "dev1.group_1":
+        os._exit(1)
+
+
+class Test:
+    @pytest.mark.parametrize("start_method", [None, "spawn"])
+    def test_runs_in_worker_processes(self, nornir: Nornir, start_method: str | None) -> None:
+        runner = ProcessPoolRunner(num_workers=NUM_WORKERS, start_method=start_method)
+        result = nornir.with_runner(runner).run(get_pid)
+        assert list(result) == list(nornir.inventory.hosts)
+        pids = {r.result for r in result.values()}
+        assert os.getpid() not in pids
+        assert len(pids) <= NUM_WORKERS
+
+    def test_results_reference_main_process_hosts(self, nornir: Nornir) -> None:
+        result = nornir.with_runner(ProcessPoolRunner(num_workers=NUM_WORKERS)).run(change_data)
+        for name, r in result.items():
+            host = nornir.inventory.hosts[name]
+            assert r.host is host
+            assert r.changed
+            assert r.result == host.hostname
+            assert "changed_in_worker" not in host.data
+
+    def test_failing_task(self, nornir: Nornir) -> None:
+        result = nornir.with_runner(ProcessPoolRunner(num_workers=NUM_WORKERS)).run(failing_task)
+        for k, v in result.items():
+            assert isinstance(v.exception, CustomException), v
+            assert str(v.exception) == k
+
+    def test_failing_subtask(self, nornir: Nornir) -> None:
+        with pytest.raises(NornirExecutionError) as e:
+            nornir.with_runner(ProcessPoolRunner(num_workers=NUM_WORKERS)).run(
+                failing_subtask, raise_on_error=True
+            )
+        for k, v in e.value.result.items():
+            assert isinstance(v[0].exception, RemoteTaskError), v
+            assert v[0].exception.exc_type == "NornirSubTaskError"
+            assert isinstance(v[1].exception, CustomException), v
+            assert v[1].host is nornir.inventory.hosts[k]
+
+    def test_unpicklable_result(self, nornir: Nornir) -> None:
+        runner = ProcessPoolRunner(num_workers=NUM_WORKERS)
+        result = nornir.with_runner(runner).run(unpicklable_result)
+        assert list(result) == list(nornir.inventory.hosts)
+        assert result.failed_hosts.keys() == {"dev1.group_1"}
+        failed = result["dev1.group_1"]
+        assert isinstance(failed.exception, TypeError)
+        assert "lock" in failed.result
+        assert failed.host is nornir.inventory.hosts["dev1.group_1"]
+        assert result["dev2.group_1"].result == "dev2.group_1"
+
+    def test_worker_dies(self, nornir: Nornir) -> None:
+        runner = ProcessPoolRunner(num_workers=NUM_WORKERS)
+        result = nornir.with_runner(runner).run(exit_worker)
+        assert list(result) == list(nornir.inventory.hosts)
+        assert isinstance(result["dev1.group_1"].exception, BrokenProcessPool)
+        for r in result.values():
+            assert r.failed or r.result is None
+
+    def test_processors(self, nornir: Nornir) -> None:
+        recorder = Recorder()
+        nornir.with_runner(ProcessPoolRunner(num_workers=NUM_WORKERS)).with_processors(
+            [recorder]
+        ).run(failing_subtask)
+        hosts = list(nornir.inventory.hosts)
+        assert recorder.events == [("started", h) for h in hosts] + [
+            ("completed", h) for h in hosts
+        ]
@@ -1,12 +1,19 @@
 import datetime
+import gc
+import itertools
+import threading
 import time
+from collections import Counter
+from collections.abc import Callable, Hashable, Iterator
 
 import pytest
 
 from nornir.core import Nornir
 from nornir.core.exceptions import NornirExecutionError
+from nornir.core.inventory import Host
+from nornir.core.processor import Processors
 from nornir.core.task import Task
-from nornir.plugins.runners import ThreadedRunner
+from nornir.plugins.runners import ConcurrencyLimits, RateLimit, ThreadedRunner
 
 NUM_WORKERS = 20
 
@@ -40,6 +47,63 @@ def verify_data_change(task: Task) -> None:
     assert task.host["my_changed_var"] == task.host.name
 
 
+def get_thread(task: Task) -> int:
+    return threading.get_ident()
+
+
+def nested_run(task: Task) -> bool:
+    result = task.nornir.filter(name=task.host.name).run(get_thread)
+    return not result.failed
+
+
+class RunningTracker:
+    """Records how many hosts sharing a key ran the task at the same time"""
+
+    def __init__(self, key: Callable[[Host], Hashable]) -> None:
+        self.key = key
+        self.running: Counter[Hashable] = Counter()
+        self.max_running: Counter[Hashable] = Counter()
+        self._lock = threading.Lock()
+
+    def task(self, task: Task) -> None:
+        key = self.key(task.host)
+        with self._lock:
+            self.running[key] += 1
+            self.max_running[key] = max(self.max_running[key], self.running[key])
+        time.sleep(0.05)
+        with self._lock:
+            self.running[key] -= 1
+
+
+class StartTimes(dict[str, float]):
+    """Records when each host started the task"""
+
+    def task(self, task: Task) -> None:
+        self[task.host.name] = time.monotonic()
+
+
+class TrackedHosts(list[Host]):
+    """Records how many hosts were taken but didn't complete the task yet"""
+
+    def __init__(self, hosts: list[Host]) -> None:
+        super().__init__(hosts)
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def __iter__(self) -> Iterator[Host]:
+        for host in super().__iter__():
+            with self.lock:
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            yield host
+
+    def completed(self, task: Task) -> None:
+        time.sleep(0.01)
+        with self.lock:
+            self.in_flight -= 1
+
+
 class Test:
     def test_blocking_task_multithreading(self, nornir: Nornir) -> None:
         t1 = datetime.datetime.now()
@@ -86,3 +150,121 @@ class Test:
         nornir.with_runner(ThreadedRunner(num_workers=NUM_WORKERS)).run(
             verify_data_change,
         )
+
+    def test_threads_are_reused(self, nornir: Nornir) -> None:
+        runner = ThreadedRunner(num_workers=NUM_WORKERS)
+        nr = nornir.with_runner(runner)
+        first = {r.result for r in nr.run(get_thread).values()}
+        second = {r.result for r in nr.run(get_thread).values()}
+        assert first | second <= {t.ident for t in threading.enumerate()}
+        runner.close()
+        assert not first & {t.ident for t in threading.enumerate()}
+
+        # the pool is started again after closing it
+        assert not nr.run(get_thread).failed
+        runner.close()
+
+    def test_nested_run(self, nornir: Nornir) -> None:
+        runner = ThreadedRunner(num_workers=1)
+        result = nornir.with_runner(runner).run(nested_run)
+        assert all(r.result for r in result.values())
+        runner.close()
+
+    def test_context_manager_closes_runner(self, nornir: Nornir) -> None:
+        runner = ThreadedRunner(num_workers=NUM_WORKERS)
+        with nornir.with_runner(runner) as nr:
+            nr.run(get_thread)
+            assert runner._pool is not None
+        assert runner._pool is None
+
+    def test_unclosed_runner_stops_threads(self, nornir: Nornir) -> None:
+        before = set(threading.enumerate())
+        nornir.with_runner(ThreadedRunner(num_workers=NUM_WORKERS)).run(get_thread)
+        started = [t for t in threading.enumerate() if t not in before]
+        assert started
+        assert all(t.name.startswith("nornir") for t in started)
+
+        gc.collect()
+        for t in started:
+            t.join(timeout=5)
+        assert not [t for t in started if t.is_alive()]
+
+    def test_max_pending(self, nornir: Nornir) -> None:
+        hosts = TrackedHosts(list(nornir.inventory.hosts.values()) * 10)
+        runner = ThreadedRunner(num_workers=2, max_pending=3)
+        task = Task(hosts.completed, nornir, global_dry_run=False, processors=Processors())
+        results = list(runner.run_iter(task, hosts))
+        runner.close()
+        assert len(results) == len(hosts)
+        assert hosts.max_in_flight == 3
+
+    def test_concurrency_limits(self, nornir: Nornir) -> None:
+        tracker = RunningTracker(lambda h: h.platform)
+        runner = ThreadedRunner(NUM_WORKERS, concurrency_limits={"platform": {"linux": 2}})
+        with nornir.with_runner(runner) as nr:
+            result = nr.run(tracker.task)
+        assert list(result) == list(nornir.inventory.hosts)
+        assert not result.failed
+        assert tracker.max_running == {"eos": 1, "junos": 1, "linux": 2}
+
+    def test_concurrency_limits_groups(self, nornir: Nornir) -> None:
+        tracker = RunningTracker(lambda h: h.has_parent_group("group_1"))
+        limits = ConcurrencyLimits({"groups": {"group_1": 1}})
+        runner = ThreadedRunner(NUM_WORKERS, concurrency_limits=limits)
+        task = Task(tracker.task, nornir, global_dry_run=False, processors=Processors())
+        hosts = list(nornir.inventory.hosts.values()) * 5
+        results = list(runner.run_iter(task, hosts))
+        runner.close()
+        assert len(results) == len(hosts)
+        assert tracker.max_running[True] == 1
+        assert tracker.max_running[False] > 1
+
+    def test_concurrency_limits_key_function(self, nornir: Nornir) -> None:
+        tracker = RunningTracker(lambda h: h.name[-1])
+        limits = ConcurrencyLimits({"platform": 3, lambda h: h.name[-1]: 1})
+        runner = ThreadedRunner(NUM_WORKERS, max_pending=4, concurrency_limits=limits)
+        task = Task(tracker.task, nornir, global_dry_run=False, processors=Processors())
+        hosts = list(nornir.inventory.hosts.values()) * 5
+        results = list(runner.run_iter(task, hosts))
+        runner.close()
+        assert len(results) == len(hosts)
+        assert set(tracker.max_running.values()) == {1}
+
+    def test_concurrency_limits_invalid(self) -> None:
+        with pytest.raises(ValueError, match="platform"):
+            ConcurrencyLimits({"platform": {"linux": 0}})
+
+    def test_rate_limit(self, nornir: Nornir) -> None:
+        starts = StartTimes()
+        runner = ThreadedRunner(NUM_WORKERS, rate_limit={"rate": 20, "burst": 2})
+        t1 = time.monotonic()
+        with nornir.with_runner(runner) as nr:
+            result = nr.run(starts.task)
+        assert list(result) == list(nornir.inventory.hosts)
+        assert not result.failed
+        times = sorted(t - t1 for t in starts.values())
+        # two hosts start right away, the rest once every 50ms
+        assert times[1] < 0.04
+        for previous, current in itertools.pairwise(times[1:]):
+            assert current - previous > 0.04
+
+    def test_rate_limit_per_key(self, nornir: Nornir) -> None:
+        starts = StartTimes()
+        limit = RateLimit(10, key="platform")
+        runner = ThreadedRunner(NUM_WORKERS, rate_limit=limit)
+        task = Task(starts.task, nornir, global_dry_run=False, processors=Processors())
+        # hosts waiting on the bucket of their platform don't hold back the rest
+        hosts = sorted(nornir.inventory.hosts.values(), key=lambda h: h.platform != "linux")
+        t1 = time.monotonic()
+        results = list(runner.run_iter(task, hosts))
+        runner.close()
+        assert len(results) == len(hosts)
+        assert starts["dev1.group_1"] - t1 < 0.05
+        assert starts["dev2.group_1"] - t1 < 0.05
+        linux = sorted(starts[h.name] for h in hosts if h.platform == "linux")
+        for previous, current in itertools.pairwise(linux):
+            assert current - previous > 0.09
+
+    def test_rate_limit_invalid(self) -> None:
+        with pytest.raises(ValueError, match="rate"):
+            RateLimit(0)